@@ -0,0 +1,359 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Headless gear calculations, corresponding to the notebook examples.
+
+Each calculation takes the notebook inputs as keyword arguments, with angles in degrees, and returns a dict of
+JSON-serializable results.
+"""
+
+from math import radians, degrees, pi
+from typing import Any, Callable, Dict
+
+from geometry import helical_gears as hg
+from geometry import planetary
+from strength import contact_stress, forces, root_stress
+from tooling import basic_rack as br
+
+
+Results = Dict[str, Any]
+
+
+# region GEOMETRY
+
+def helical_gear(module_normal, pressure_angle_normal_deg, helix_angle_deg, number_of_teeth,
+                 basic_rack_addendum_coefficient=1, basic_rack_dedendum_coefficient=1.25,
+                 tool_tip_radius_coefficient=0.38, profile_shift_coefficient=0) -> Results:
+    """Helical gear geometry, see the geometry notebook Chapter 3."""
+
+    pressure_angle_normal = radians(pressure_angle_normal_deg)
+    helix_angle = radians(helix_angle_deg)
+    basic_rack_addendum = basic_rack_addendum_coefficient * module_normal
+    basic_rack_dedendum = basic_rack_dedendum_coefficient * module_normal
+    profile_shift = profile_shift_coefficient * module_normal
+
+    # core params
+    module_transverse = hg.module_transverse_fcn(module_normal, helix_angle)
+    pressure_angle_transverse = hg.pressure_angle_transverse_fcn(pressure_angle_normal, helix_angle)
+    theoretical_pitch_diameter = hg.theoretical_pitch_diameter_fcn(module_transverse, number_of_teeth)
+    base_diameter = hg.base_diameter_fcn(theoretical_pitch_diameter, pressure_angle_transverse)
+    tip_diameter = hg.tip_diameter_fcn(theoretical_pitch_diameter, basic_rack_addendum, profile_shift)
+    root_diameter = hg.root_diameter_fcn(theoretical_pitch_diameter, basic_rack_dedendum, profile_shift)
+    helix_angle_base = hg.helix_angle_arbitrary_fcn(base_diameter, helix_angle, theoretical_pitch_diameter)
+
+    # tooth thicknesses
+    tooth_thickness_transverse = hg.tooth_thickness_transverse_fcn(
+        module_normal, pressure_angle_normal, helix_angle, profile_shift_coefficient)
+    tooth_thickness_transverse_tip = hg.tooth_thickness_transverse_arbitrary_fcn(
+        tip_diameter, module_normal, pressure_angle_normal, number_of_teeth, helix_angle, profile_shift_coefficient)
+    tooth_thickness_normal = hg.tooth_thickness_normal_fcn(tooth_thickness_transverse, helix_angle)
+    tooth_thickness_normal_tip = hg.tooth_thickness_normal_fcn(tooth_thickness_transverse_tip, helix_angle)
+
+    # root params
+    form_diameter = hg.form_diameter_fcn(module_normal, pressure_angle_normal, helix_angle, number_of_teeth,
+                                         basic_rack_dedendum_coefficient, profile_shift_coefficient,
+                                         tool_tip_radius_coefficient)
+
+    return {
+        'module_transverse': module_transverse,
+        'pressure_angle_transverse_deg': degrees(pressure_angle_transverse),
+        'theoretical_pitch_diameter': theoretical_pitch_diameter,
+        'base_diameter': base_diameter,
+        'tip_diameter': tip_diameter,
+        'root_diameter': root_diameter,
+        'form_diameter': form_diameter,
+        'helix_angle_base_deg': degrees(helix_angle_base),
+        'pitch_transverse': hg.pitch_transverse_fcn(theoretical_pitch_diameter, number_of_teeth),
+        'base_pitch_transverse': hg.pitch_transverse_fcn(base_diameter, number_of_teeth),
+        'base_pitch_normal': hg.base_pitch_normal_fcn(module_normal, pressure_angle_normal),
+        'tooth_thickness_transverse': tooth_thickness_transverse,
+        'tooth_thickness_normal': tooth_thickness_normal,
+        'tooth_thickness_normal_tip': tooth_thickness_normal_tip,
+        'tooth_thickness_tip_coefficient': tooth_thickness_normal_tip / module_normal,
+        'minimum_profile_shift_coefficient': hg.minimum_profile_shift_coefficient_to_avoid_undercut(
+            basic_rack_addendum_coefficient, pressure_angle_normal, number_of_teeth, helix_angle),
+        'minimum_number_of_teeth': hg.minimum_teeth_to_avoid_undercut(
+            basic_rack_addendum_coefficient, pressure_angle_normal, profile_shift_coefficient, helix_angle),
+        'undercut': form_diameter is None,
+    }
+
+
+def helical_gear_pair(module_normal, pressure_angle_normal_deg, helix_angle_deg, center_distance,
+                      number_of_teeth1, number_of_teeth2, facewidth1, facewidth2,
+                      profile_shift_coefficient1=0, profile_shift_coefficient2=0,
+                      basic_rack_addendum_coefficient1=1, basic_rack_addendum_coefficient2=1,
+                      basic_rack_dedendum_coefficient1=1.25, basic_rack_dedendum_coefficient2=1.25,
+                      input_speed_rpm=0) -> Results:
+    """Helical gear pair geometry and kinematics, see the geometry notebook Chapter 3."""
+
+    pressure_angle_normal = radians(pressure_angle_normal_deg)
+    helix_angle = radians(helix_angle_deg)
+    profile_shift1 = profile_shift_coefficient1 * module_normal
+    profile_shift2 = profile_shift_coefficient2 * module_normal
+
+    # gear parameters
+    module_transverse = hg.module_transverse_fcn(module_normal, helix_angle)
+    pressure_angle_transverse = hg.pressure_angle_transverse_fcn(pressure_angle_normal, helix_angle)
+    theoretical_pitch_diameter1 = hg.theoretical_pitch_diameter_fcn(module_transverse, number_of_teeth1)
+    theoretical_pitch_diameter2 = hg.theoretical_pitch_diameter_fcn(module_transverse, number_of_teeth2)
+    base_diameter1 = hg.base_diameter_fcn(theoretical_pitch_diameter1, pressure_angle_transverse)
+    base_diameter2 = hg.base_diameter_fcn(theoretical_pitch_diameter2, pressure_angle_transverse)
+    tip_diameter1 = hg.tip_diameter_fcn(theoretical_pitch_diameter1,
+                                        basic_rack_addendum_coefficient1 * module_normal, profile_shift1)
+    tip_diameter2 = hg.tip_diameter_fcn(theoretical_pitch_diameter2,
+                                        basic_rack_addendum_coefficient2 * module_normal, profile_shift2)
+    root_diameter1 = hg.root_diameter_fcn(theoretical_pitch_diameter1,
+                                          basic_rack_dedendum_coefficient1 * module_normal, profile_shift1)
+    root_diameter2 = hg.root_diameter_fcn(theoretical_pitch_diameter2,
+                                          basic_rack_dedendum_coefficient2 * module_normal, profile_shift2)
+    helix_angle_base = hg.helix_angle_arbitrary_fcn(base_diameter1, helix_angle, theoretical_pitch_diameter1)
+
+    # CHECK INPUTS
+    if center_distance > (tip_diameter1 + tip_diameter2) / 2:
+        raise ValueError('Center distance is too large, try reducing it or change the gear geometry.')
+
+    if center_distance < (root_diameter1 + root_diameter2) / 2:
+        raise ValueError('Center distance is too small, try increasing it or change the gear geometry.')
+
+    # pressure angles and center distances
+    working_pressure_angle = hg.working_pressure_angle_fcn(center_distance, base_diameter1, base_diameter2)
+    working_pressure_angle_theoretical = hg.working_pressure_angle_theoretical_fcn(
+        profile_shift_coefficient1, profile_shift_coefficient2, number_of_teeth1, number_of_teeth2,
+        pressure_angle_normal, pressure_angle_transverse)
+
+    if working_pressure_angle_theoretical is None:
+        raise ValueError('Sum of profile shift coefficients is too negative.')
+
+    center_distance_reference = hg.center_distance_reference_fcn(
+        module_normal, number_of_teeth1, number_of_teeth2, helix_angle)
+    center_distance_theoretical = hg.center_distance_theoretical_fcn(
+        center_distance_reference, working_pressure_angle_theoretical, pressure_angle_transverse)
+
+    # rotational speeds
+    transmission_ratio = hg.transmission_ratio_fcn(number_of_teeth1, number_of_teeth2)
+    angular_velocity1 = input_speed_rpm * pi / 30
+    angular_velocity2 = angular_velocity1 / transmission_ratio
+    working_pitch_diameter1, working_pitch_diameter2 = hg.pitch_diameters_fcn(
+        center_distance, number_of_teeth1, number_of_teeth2)
+
+    # clearances
+    backlash_radial = hg.backlash_radial_fcn(center_distance, center_distance_theoretical)
+    backlash_circumferential = hg.backlash_circumferential_fcn(backlash_radial, working_pressure_angle)
+    backlash_profile = hg.backlash_profile_fcn(backlash_circumferential, working_pressure_angle)
+
+    # SAP & EAP
+    pressure_angle_transverse_eap1 = hg.pressure_angle_transverse_arbitrary_fcn(base_diameter1, tip_diameter1)
+    pressure_angle_transverse_eap2 = hg.pressure_angle_transverse_arbitrary_fcn(base_diameter2, tip_diameter2)
+    pressure_angle_transverse_sap1 = hg.pressure_angle_transverse_contact_fcn(
+        working_pressure_angle, number_of_teeth1, number_of_teeth2, pressure_angle_transverse_eap2)
+    pressure_angle_transverse_sap2 = hg.pressure_angle_transverse_contact_fcn(
+        working_pressure_angle, number_of_teeth2, number_of_teeth1, pressure_angle_transverse_eap1)
+
+    # contact
+    facewidth_effective = min([facewidth1, facewidth2])
+    contact_ratio_transverse = hg.contact_ratio_transverse_fcn(
+        working_pressure_angle, number_of_teeth1, number_of_teeth2,
+        pressure_angle_transverse_eap1, pressure_angle_transverse_eap2)
+    contact_ratio_axial = hg.contact_ratio_axial_fcn(facewidth_effective, helix_angle, module_normal)
+    contact_lines_length_mean = hg.contact_lines_length_mean_fcn(
+        facewidth_effective, contact_ratio_transverse, helix_angle_base)
+
+    results = {
+        'transmission_ratio': transmission_ratio,
+        'center_distance_reference': center_distance_reference,
+        'center_distance_theoretical': center_distance_theoretical,
+        'working_pressure_angle_deg': degrees(working_pressure_angle),
+        'working_pitch_diameter1': working_pitch_diameter1,
+        'working_pitch_diameter2': working_pitch_diameter2,
+        'base_diameter1': base_diameter1,
+        'base_diameter2': base_diameter2,
+        'tip_diameter1': tip_diameter1,
+        'tip_diameter2': tip_diameter2,
+        'root_diameter1': root_diameter1,
+        'root_diameter2': root_diameter2,
+        'helix_angle_base_deg': degrees(helix_angle_base),
+        'backlash_radial': backlash_radial,
+        'backlash_circumferential': backlash_circumferential,
+        'backlash_normal': hg.backlash_normal_fcn(backlash_profile, helix_angle_base),
+        'tip_clearance1': hg.tip_clearance_fcn(center_distance, tip_diameter1, root_diameter2),
+        'tip_clearance2': hg.tip_clearance_fcn(center_distance, tip_diameter2, root_diameter1),
+        'diameter_sap1': hg.pressure_angle_transverse_to_diameter(base_diameter1, pressure_angle_transverse_sap1),
+        'diameter_sap2': hg.pressure_angle_transverse_to_diameter(base_diameter2, pressure_angle_transverse_sap2),
+        'contact_ratio_transverse': contact_ratio_transverse,
+        'contact_ratio_axial': contact_ratio_axial,
+        'contact_ratio_total': hg.contact_ratio_total_fcn(contact_ratio_transverse, contact_ratio_axial),
+        'contact_plane_length': hg.contact_plane_length_fcn(
+            working_pressure_angle, base_diameter1, base_diameter2,
+            pressure_angle_transverse_eap1, pressure_angle_transverse_eap2),
+        'contact_lines_length_mean': contact_lines_length_mean,
+        'contact_lines_length_min': hg.contact_lines_length_min_fcn(
+            contact_lines_length_mean, contact_ratio_transverse, contact_ratio_axial),
+    }
+
+    if input_speed_rpm:
+        # kinematics
+        sliding_velocity_sap1, sliding_velocity_eap2 = hg.sliding_velocity_fcn(
+            base_diameter1, base_diameter2, pressure_angle_transverse_sap1, pressure_angle_transverse_eap2,
+            angular_velocity1, angular_velocity2)
+        sliding_velocity_sap2, sliding_velocity_eap1 = hg.sliding_velocity_fcn(
+            base_diameter1, base_diameter2, pressure_angle_transverse_sap2, pressure_angle_transverse_eap1,
+            angular_velocity1, angular_velocity2)
+        specific_sliding_sap1, specific_sliding_eap2 = hg.specific_sliding_fcn(
+            base_diameter1, base_diameter2, pressure_angle_transverse_sap1, pressure_angle_transverse_eap2,
+            angular_velocity1, angular_velocity2)
+        specific_sliding_sap2, specific_sliding_eap1 = hg.specific_sliding_fcn(
+            base_diameter2, base_diameter1, pressure_angle_transverse_sap2, pressure_angle_transverse_eap1,
+            angular_velocity2, angular_velocity1)
+
+        results.update({
+            'pitch_line_velocity': hg.pitch_line_velocity_fcn(working_pitch_diameter1, angular_velocity1),
+            'sliding_velocity_sap1': sliding_velocity_sap1,
+            'sliding_velocity_sap2': sliding_velocity_sap2,
+            'sliding_velocity_eap1': sliding_velocity_eap1,
+            'sliding_velocity_eap2': sliding_velocity_eap2,
+            'specific_sliding_sap1': specific_sliding_sap1,
+            'specific_sliding_sap2': specific_sliding_sap2,
+            'specific_sliding_eap1': specific_sliding_eap1,
+            'specific_sliding_eap2': specific_sliding_eap2,
+        })
+
+    return results
+
+
+def planetary_gears(number_of_teeth_sun, number_of_teeth_ring, number_of_planets) -> Results:
+    """Standard planetary ratios, planet spacing and mesh phasing, see the geometry notebook Chapter 4.
+
+    Negative sign convention is used for number of ring gear teeth.
+    """
+
+    z1 = number_of_teeth_sun
+    z3 = -abs(number_of_teeth_ring)
+
+    ratio_base = planetary.std_ratio_base(z1, z3)
+    equal_ticks = planetary.get_planet_equal_ticks(z1, z3, number_of_planets)
+
+    if planetary.allows_equally_spaced(equal_ticks):
+        spacing = 'E'
+    elif planetary.allows_diametrically_opposed(equal_ticks):
+        spacing = 'X'
+    else:
+        raise ValueError('Planets can be neither equally spaced nor diametrically opposed.')
+
+    thetas = planetary.get_planet_angles(z1, z3, number_of_planets)
+    phis_ring = [planetary.mesh_phase_angle(theta, z3) for theta in thetas]
+    phis_sun = [planetary.mesh_phase_angle(theta, z1) for theta in thetas]
+    fx_ring, fy_ring, trq_ring = planetary.summed_phasing(thetas, phis_ring)
+    fx_sun, fy_sun, trq_sun = planetary.summed_phasing(thetas, phis_sun)
+
+    return {
+        'ratio_base': ratio_base,
+        'ratio_1v': planetary.std_ratio_1v(ratio_base),
+        'ratio_3v': planetary.std_ratio_3v(ratio_base),
+        'number_of_teeth_planet_reference': planetary.reference_planet_size(z1, z3),
+        'spacing': spacing,
+        'planet_angles_deg': [degrees(theta) for theta in thetas],
+        'phase_angles_ring_deg': [degrees(phi) for phi in phis_ring],
+        'phase_angles_sun_deg': [degrees(phi) for phi in phis_sun],
+        'phasing_type_ring': planetary.get_phasing_type(fx_ring, fy_ring, trq_ring),
+        'phasing_type_sun': planetary.get_phasing_type(fx_sun, fy_sun, trq_sun),
+    }
+
+
+# endregion
+
+
+# region TOOLING
+
+def basic_rack(module, pressure_angle_deg, addendum_coefficient=1, dedendum_coefficient=1.25,
+               root_radius_coefficient=0.38) -> Results:
+    """Basic rack properties, see the tooling notebook Chapter 1."""
+
+    pressure_angle = radians(pressure_angle_deg)
+    addendum = addendum_coefficient * module
+    dedendum = dedendum_coefficient * module
+    root_radius_coefficient_max = br.max_root_radius(module, pressure_angle, addendum, dedendum) / module
+
+    return {
+        'pitch': br.pitch_fcn(module),
+        'base_pitch': br.base_pitch_fcn(module, pressure_angle),
+        'bottom_clearance_coefficient': br.bottom_clearance_fcn(addendum, dedendum) / module,
+        'root_radius_coefficient_max': root_radius_coefficient_max,
+        'root_radius_feasible': root_radius_coefficient <= root_radius_coefficient_max,
+    }
+
+
+# endregion
+
+
+# region STRENGTH
+
+def root_stress_sizing(torque, number_of_teeth, facewidth_to_pitch, allowable_bending_stress,
+                       stress_concentration_factor, load_sharing_factor=1, module_step=0.5) -> Results:
+    """Module sizing for tooth root bending stress, see the strength notebook Chapter 2."""
+
+    module_min = root_stress.minimum_module_bending_fcn(torque, number_of_teeth, facewidth_to_pitch,
+                                                        allowable_bending_stress, stress_concentration_factor,
+                                                        load_sharing_factor)
+    module = root_stress.selected_module_fcn(module_min, module_step)
+
+    pitch_diameter = module * number_of_teeth
+    facewidth = facewidth_to_pitch * pitch_diameter
+    tangential_force = forces.tangential_force_fcn(torque, pitch_diameter)
+
+    return {
+        'module_min': module_min,
+        'module': module,
+        'pitch_diameter': pitch_diameter,
+        'facewidth': facewidth,
+        'tangential_force': tangential_force,
+        'bending_stress': root_stress.bending_stress_fcn(tangential_force, facewidth, module,
+                                                         stress_concentration_factor, load_sharing_factor),
+    }
+
+
+def contact_stress_sizing(torque, number_of_teeth1, number_of_teeth2, facewidth_to_pitch, allowable_contact_pressure,
+                          material_factor, pitch_point_factor, module_step=0.5) -> Results:
+    """Module sizing for pitch point contact pressure, see the strength notebook Chapter 3."""
+
+    gear_ratio = number_of_teeth2 / number_of_teeth1
+    module_min = contact_stress.minimum_module_contact_fcn(torque, number_of_teeth1, gear_ratio, facewidth_to_pitch,
+                                                           allowable_contact_pressure, material_factor,
+                                                           pitch_point_factor)
+    module = root_stress.selected_module_fcn(module_min, module_step)
+
+    pitch_diameter1 = module * number_of_teeth1
+
+    return {
+        'gear_ratio': gear_ratio,
+        'module_min': module_min,
+        'module': module,
+        'pitch_diameter1': pitch_diameter1,
+        'tangential_force': forces.tangential_force_fcn(torque, pitch_diameter1),
+        'contact_pressure': contact_stress.contact_pressure_fcn(torque, pitch_diameter1, gear_ratio,
+                                                                facewidth_to_pitch, material_factor,
+                                                                pitch_point_factor),
+    }
+
+
+# endregion
+
+
+CALCULATIONS: Dict[str, Callable[..., Results]] = {
+    'helical_gear': helical_gear,
+    'helical_gear_pair': helical_gear_pair,
+    'planetary': planetary_gears,
+    'basic_rack': basic_rack,
+    'root_stress': root_stress_sizing,
+    'contact_stress': contact_stress_sizing,
+}
+
+
+def run(calculation: str, inputs: Dict[str, Any]) -> Results:
+    """Run a calculation by name with keyword inputs."""
+
+    try:
+        fcn = CALCULATIONS[calculation]
+    except KeyError:
+        raise ValueError(f'Unknown calculation: {calculation!r}, expected one of {sorted(CALCULATIONS)}') from None
+
+    return fcn(**inputs)
@@ -0,0 +1,614 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Equivalence of the scalar and vectorized geometry functions, checked against golden data.
+
+Every function of `helical_gears_batch` and `basic_rack_batch` is compared with the scalar function of the same name,
+evaluated element by element, and the functions of `involute` are compared between element by element and whole array
+evaluation.  Inputs are consistent gear pair designs: randomized designs, after edge cases with undercut, a negative
+profile shift sum that makes `working_pressure_angle_theoretical_fcn` return None, spur gears with
+`contact_ratio_axial == 0`, and internal gears.
+
+A scalar function returning None, a complex number, or raising an arithmetic error is invalid, and the batched
+function must return NaN for the same element.  Valid results must agree within the tolerance of the case::
+
+    abs(batched - scalar) <= atol + rtol * abs(scalar)
+
+The inputs and batched results are stored as golden data, so that later changes of either implementation, NumPy or
+the platform are compared with the same numbers.  Speed ratios of a scalar loop to one batched call are reported.
+
+The optimizer is checked against exhaustive search, and the contact pressure path and lubrication screening against a
+batch that mixes valid and invalid designs.
+
+Usage, from the repository root::
+
+    python -m batch.equivalence                   # check against batch/golden/equivalence.json
+    python -m batch.equivalence --update-golden   # regenerate inputs and golden results
+"""
+
+import argparse
+import inspect
+import json
+import os
+import sys
+import time
+import warnings
+from math import radians
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from geometry import helical_gears as hg
+from geometry import helical_gears_batch as hgb
+from geometry import involute
+from geometry import optimizer
+from strength import contact_stress, lubrication
+from tooling import basic_rack as br
+from tooling import basic_rack_batch as brb
+
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), 'golden', 'equivalence.json')
+
+RTOL = 1e-10  # relative tolerance, between libm and NumPy implementations of the elementary functions
+ATOL = 1e-10  # absolute tolerance, mm or radians, for results near zero such as sliding at the pitch point
+
+Inputs = Dict[str, np.ndarray]
+
+
+# region INPUTS
+
+# edge cases: name, z1, z2, x1, x2, pressure angle normal (deg), helix angle (deg)
+EDGE_CASES = [
+    ('undercut', 8, 40, -0.4, 0.0, 20, 0),
+    ('undercut_helical', 7, 31, -0.3, 0.2, 20, 25),
+    ('negative_profile_shift_sum', 10, 12, -1.0, -1.0, 20, 15),
+    ('spur', 24, 61, 0.25, -0.1, 20, 0),
+    ('spur_internal', 18, -54, 0.3, 0.1, 20, 0),
+    ('internal', 21, -83, 0.2, 0.1, 20, 20),
+    ('high_pressure_angle', 30, 31, 0.0, 0.0, 25, 10),
+    ('low_pressure_angle', 40, 97, 0.5, 0.5, 14.5, 30),
+]
+
+
+def design_inputs(number_of_samples: int, seed: int) -> Inputs:
+    """Inputs of every compared function, keyed by argument name, for consistent gear pair designs.
+
+    The first rows are the edge cases, the remaining rows randomized designs.  Derived quantities are computed with
+    the batched functions, so that invalid designs propagate NaN.
+    """
+
+    rng = np.random.default_rng(seed)
+    n = number_of_samples
+    k = min(len(EDGE_CASES), n)
+
+    z1 = rng.integers(6, 61, n).astype(float)
+    z2 = rng.integers(0, 91, n) + z1
+    internal = rng.random(n) < 0.2
+    z2 = np.where(internal, -(z2 + 15), z2)
+    x1 = rng.uniform(-0.6, 0.8, n)
+    x2 = rng.uniform(-0.6, 0.8, n)
+    alpha_n = np.radians(rng.choice([14.5, 17.5, 20, 22.5, 25], n))
+    beta = np.where(rng.random(n) < 0.25, 0, np.radians(rng.uniform(5, 35, n)))
+
+    edge = np.array([case[1:] for case in EDGE_CASES[:k]], dtype=float).T
+    z1[:k], z2[:k], x1[:k], x2[:k] = edge[:4]
+    alpha_n[:k] = np.radians(edge[4])
+    beta[:k] = np.radians(edge[5])
+
+    m_n = rng.uniform(1, 10, n)
+    h_a = np.ones(n)
+    h_f = rng.uniform(1.2, 1.4, n)
+    rho = rng.uniform(0.2, 0.4, n)
+    b = rng.uniform(5, 20, n) * m_n
+    omega1 = rng.uniform(10, 300, n)
+
+    with np.errstate(all='ignore'):
+        m_t = hgb.module_transverse_fcn(m_n, beta)
+        alpha_t = hgb.pressure_angle_transverse_fcn(alpha_n, beta)
+        beta_b = np.arctan(np.tan(beta) * np.cos(alpha_t))
+        d1 = hgb.theoretical_pitch_diameter_fcn(m_t, z1)
+        d2 = hgb.theoretical_pitch_diameter_fcn(m_t, z2)
+        d_b1 = hgb.base_diameter_fcn(d1, alpha_t)
+        d_b2 = hgb.base_diameter_fcn(d2, alpha_t)
+        d_a1 = hgb.tip_diameter_fcn(d1, h_a * m_n, x1 * m_n)
+        d_a2 = hgb.tip_diameter_fcn(d2, h_a * m_n, x2 * m_n)
+        d_f1 = hgb.root_diameter_fcn(d1, h_f * m_n, x1 * m_n)
+        d_f2 = hgb.root_diameter_fcn(d2, h_f * m_n, x2 * m_n)
+
+        inv_alpha_w = hgb.involute_function(alpha_t) + 2 * np.tan(alpha_n) * (x1 + x2) / (z1 + z2)
+        alpha_wt_theoretical = hgb.working_pressure_angle_theoretical_fcn(x1, x2, z1, z2, alpha_n, alpha_t)
+        a_ref = hgb.center_distance_reference_fcn(m_n, z1, z2, beta)
+        a_theoretical = hgb.center_distance_theoretical_fcn(a_ref, alpha_wt_theoretical, alpha_t)
+
+        # small radial backlash, away from the reference center distance where the theoretical one is invalid
+        j_r = rng.uniform(0, 0.01, n) * m_n
+        a = np.where(np.isnan(a_theoretical), a_ref, a_theoretical) + np.sign(a_ref) * j_r
+        alpha_wt = hgb.working_pressure_angle_fcn(a, d_b1, d_b2)
+        d_w1 = hgb.pitch_diameters_fcn(a, z1, z2)[0]
+
+        alpha_eap1 = hgb.pressure_angle_transverse_arbitrary_fcn(d_b1, d_a1)
+        alpha_eap2 = hgb.pressure_angle_transverse_arbitrary_fcn(d_b2, d_a2)
+        cr_t = hgb.contact_ratio_transverse_fcn(alpha_wt, z1, z2, alpha_eap1, alpha_eap2)
+        cr_a = hgb.contact_ratio_axial_fcn(b, beta, m_n)
+
+        # a point of the active flank of gear 1, and the mating contact point of gear 2
+        d_y1 = np.maximum(d_b1, d_f1) + rng.random(n) * (d_a1 - np.maximum(d_b1, d_f1))
+        alpha_y1 = hgb.pressure_angle_transverse_arbitrary_fcn(d_b1, d_y1)
+        alpha_y2 = hgb.pressure_angle_transverse_contact_fcn(alpha_wt, z2, z1, alpha_y1)
+
+        j_t = hgb.backlash_circumferential_fcn(j_r, alpha_wt)
+        s_t = hgb.tooth_thickness_transverse_fcn(m_n, alpha_n, beta, x1)
+        s_y1 = hgb.tooth_thickness_transverse_arbitrary_fcn(d_y1, m_n, alpha_n, z1, beta, x1)
+
+        inputs = {
+            'module': m_n,
+            'module_normal': m_n,
+            'module_transverse': m_t,
+            'pressure_angle': alpha_n,
+            'pressure_angle_normal': alpha_n,
+            'pressure_angle_transverse': alpha_t,
+            'helix_angle': beta,
+            'helix_angle_ref': beta,
+            'helix_angle_base': beta_b,
+            'number_of_teeth': z1,
+            'number_of_teeth1': z1,
+            'number_of_teeth2': z2,
+            'mating_number_of_teeth': z2,
+            'profile_shift_coefficient': x1,
+            'profile_shift_coefficient1': x1,
+            'profile_shift_coefficient2': x2,
+            'profile_shift': x1 * m_n,
+            'addendum': h_a * m_n,
+            'dedendum': h_f * m_n,
+            'basic_rack_addendum': h_a * m_n,
+            'basic_rack_dedendum': h_f * m_n,
+            'basic_rack_addendum_coefficient': h_a,
+            'cutter_addendum_coefficient': h_f,
+            'tip_radius_coefficient': rho,
+            'theoretical_pitch_diameter': d1,
+            'diameter_ref': d1,
+            'radius': d1 / 2,
+            'diameter': d_y1,
+            'diameter_arbitrary': d_y1,
+            'base_diameter': d_b1,
+            'base_diameter1': d_b1,
+            'base_diameter2': d_b2,
+            'radius_base': d_b1 / 2,
+            'tip_diameter': d_a1,
+            'mating_tip_diameter': d_a2,
+            'root_diameter': d_f1,
+            'mating_root_diameter': d_f2,
+            'tooth_thickness_transverse': s_t,
+            'tooth_thickness_transverse_at_diameter': s_y1,
+            'involute_fcn': inv_alpha_w,
+            'reference_center_distance': a_ref,
+            'center_distance_theoretical': a_theoretical,
+            'center_distance': a,
+            'center_distance_actual': a,
+            'working_pressure_angle_transverse': alpha_wt,
+            'pitch_diameter': d_w1,
+            'working_pitch_diameter': d_w1,
+            'backlash_radial': j_r,
+            'backlash_circumferential': j_t,
+            'backlash_profile': hgb.backlash_profile_fcn(j_t, alpha_wt),
+            'pressure_angle_transverse_eap1': alpha_eap1,
+            'pressure_angle_transverse_eap2': alpha_eap2,
+            'pressure_angle_transverse_arbitrary': alpha_y1,
+            'pressure_angle_transverse_contact': alpha_y1,
+            'pressure_angle_transverse_contact1': alpha_y1,
+            'pressure_angle_transverse_contact2': alpha_y2,
+            'mating_pressure_angle_transverse_contact_point': alpha_y2,
+            'roll_angle': np.tan(alpha_y1),
+            'phi': rng.uniform(-np.pi, np.pi, n),
+            'facewidth_effective': b,
+            'contact_ratio_transverse': cr_t,
+            'contact_ratio_axial': cr_a,
+            'contact_lines_length_mean': hgb.contact_lines_length_mean_fcn(b, cr_t, beta_b),
+            'angular_velocity': omega1,
+            'angular_velocity1': omega1,
+            'angular_velocity2': omega1 * z1 / z2,
+        }
+
+    return inputs
+
+
+# endregion
+
+
+# region CASES
+
+class Case(NamedTuple):
+    """A scalar function and its batched counterpart, with the names of their arguments."""
+
+    name: str
+    scalar: Callable
+    batched: Callable
+    arguments: Tuple[str, ...]
+    rtol: float = RTOL
+    atol: float = ATOL
+
+
+def _public_functions(module):
+    return {name: fcn for name, fcn in vars(module).items()
+            if inspect.isfunction(fcn) and fcn.__module__ == module.__name__ and not name.startswith('_')}
+
+
+def _arguments(fcn) -> Tuple[str, ...]:
+    """Names of the arguments without defaults."""
+
+    parameters = inspect.signature(fcn).parameters.values()
+
+    return tuple(p.name for p in parameters if p.default is inspect.Parameter.empty)
+
+
+def _involute_pressure_angle_scalar(radius_base, roll_angle):
+    diameter = hg.roll_angle_to_diameter(2 * radius_base, roll_angle)
+
+    return hg.pressure_angle_transverse_arbitrary_fcn(2 * radius_base, diameter)
+
+
+def _involute_radius_scalar(radius_base, roll_angle):
+    return hg.roll_angle_to_diameter(2 * radius_base, roll_angle) / 2
+
+
+def _involute_radius_batched(radius_base, roll_angle):
+    return np.hypot(*involute.involute_curve(radius_base, roll_angle))
+
+
+def cases() -> List[Case]:
+    """All compared pairs of functions."""
+
+    result = []
+
+    for prefix, scalar_module, batched_module in (('helical_gears', hg, hgb), ('basic_rack', br, brb)):
+        scalar_functions = _public_functions(scalar_module)
+        for name, batched in _public_functions(batched_module).items():
+            if name in scalar_functions:
+                result.append(Case(f'{prefix}.{name}', scalar_functions[name], batched, _arguments(batched)))
+
+    # involute functions are NumPy functions already: element by element against whole arrays
+    for name, fcn in _public_functions(involute).items():
+        result.append(Case(f'involute.{name}', fcn, fcn, _arguments(fcn)))
+
+    # involute functions against their helical_gears equivalents
+    result += [
+        Case('involute.involute_function ~ helical_gears', hg.involute_function, involute.involute_function,
+             ('pressure_angle',)),
+        Case('involute.involute_pressure_angle ~ helical_gears', _involute_pressure_angle_scalar,
+             involute.involute_pressure_angle, ('radius_base', 'roll_angle')),
+        Case('involute.involute_curve radius ~ helical_gears', _involute_radius_scalar, _involute_radius_batched,
+             ('radius_base', 'roll_angle')),
+    ]
+
+    return result
+
+
+# endregion
+
+
+# region EVALUATION
+
+def _as_outputs(value, number_of_samples: int) -> np.ndarray:
+    """Result of a batched function as a float array of shape (outputs, samples), NaN where not finite."""
+
+    outputs = value if isinstance(value, tuple) else (value,)
+    array = np.array([np.broadcast_to(np.asarray(output, dtype=float), (number_of_samples,)) for output in outputs])
+
+    return np.where(np.isfinite(array), array, np.nan)
+
+
+def _scalar_output(value) -> float:
+    if value is None or isinstance(value, complex):
+        return np.nan
+
+    value = float(value)
+
+    return value if np.isfinite(value) else np.nan
+
+
+def evaluate_scalar(case: Case, inputs: Inputs) -> np.ndarray:
+    """Scalar function called for every sample, with Python floats, as a (outputs, samples) array."""
+
+    columns = [inputs[argument].tolist() for argument in case.arguments]
+    rows = []
+
+    for arguments in zip(*columns):
+        try:
+            value = case.scalar(*arguments)
+        except (ArithmeticError, ValueError):
+            value = None
+
+        values = value if isinstance(value, tuple) else (value,)
+        rows.append([_scalar_output(v) for v in values])
+
+    return np.array(rows, dtype=float).reshape(len(rows), -1).T
+
+
+def evaluate_batched(case: Case, inputs: Inputs) -> np.ndarray:
+    """Batched function called once for all samples, as a (outputs, samples) array."""
+
+    number_of_samples = len(next(iter(inputs.values())))
+
+    with np.errstate(all='ignore'):
+        return _as_outputs(case.batched(*[inputs[argument] for argument in case.arguments]), number_of_samples)
+
+
+class Comparison(NamedTuple):
+    """Agreement of two (outputs, samples) arrays."""
+
+    passed: bool
+    invalid: int  # samples invalid in the reference
+    mismatched_invalid: int  # samples valid in one array only
+    max_error: float  # largest abs(actual - reference) / (atol + rtol * abs(reference)), passing if <= 1
+
+
+def compare(actual: np.ndarray, reference: np.ndarray, rtol: float, atol: float) -> Comparison:
+    if actual.shape != reference.shape:
+        return Comparison(False, 0, max(actual.size, reference.size), np.inf)
+
+    actual_invalid = np.isnan(actual)
+    reference_invalid = np.isnan(reference)
+    valid = ~actual_invalid & ~reference_invalid
+
+    error = np.abs(actual[valid] - reference[valid]) / (atol + rtol * np.abs(reference[valid]))
+    max_error = float(error.max()) if error.size else 0.0
+    mismatched_invalid = int(np.count_nonzero(actual_invalid != reference_invalid))
+
+    return Comparison(mismatched_invalid == 0 and max_error <= 1, int(reference_invalid.any(axis=0).sum()),
+                      mismatched_invalid, max_error)
+
+
+def speed_ratio(case: Case, inputs: Inputs) -> float:
+    """Time of the scalar loop over the time of one batched call."""
+
+    start = time.perf_counter()
+    evaluate_scalar(case, inputs)
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    evaluate_batched(case, inputs)
+    batched_time = time.perf_counter() - start
+
+    return scalar_time / batched_time
+
+
+# endregion
+
+
+# region GOLDEN DATA
+
+def _to_json(array: np.ndarray):
+    return [[None if np.isnan(v) else v for v in row] for row in np.atleast_2d(array).tolist()]
+
+
+def _from_json(rows) -> np.ndarray:
+    return np.array([[np.nan if v is None else v for v in row] for row in rows], dtype=float)
+
+
+def write_golden(path: str, inputs: Inputs, results: Dict[str, np.ndarray], seed: int) -> None:
+    golden = {
+        'seed': seed,
+        'numpy': np.__version__,
+        'inputs': {name: _to_json(values)[0] for name, values in inputs.items()},
+        'results': {name: _to_json(values) for name, values in results.items()},
+    }
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(json.dumps(golden, indent=1) + '\n')
+
+
+def read_golden(path: str) -> Tuple[Inputs, Dict[str, np.ndarray]]:
+    with open(path) as f:
+        golden = json.load(f)
+
+    inputs = {name: _from_json([values])[0] for name, values in golden['inputs'].items()}
+    results = {name: _from_json(rows) for name, rows in golden['results'].items()}
+
+    return inputs, results
+
+
+# endregion
+
+
+# region OPTIMIZER
+
+# small design spaces, where branch-and-bound optimization must find the designs of exhaustive search
+OPTIMIZER_CASES = [
+    ('spur', optimizer.DesignSpace(2, 60, 2, 0.1, (16, 22), profile_shift_coefficients=np.arange(-0.5, 1.01, 0.1)),
+     optimizer.Constraints(), optimizer.CONTACT_RATIO),
+    ('helical', optimizer.DesignSpace(2, 60, 2, 0.1, (16, 22), helix_angles_deg=(0, 15),
+                                      profile_shift_coefficients=np.arange(-0.5, 1.01, 0.1)),
+     optimizer.Constraints(), optimizer.SLIDING_BALANCE),
+    # small tooth counts, where the lowest profile shift sums have no valid working pressure angle
+    ('undercut_allowed', optimizer.DesignSpace(2, 41, 2, 0.1, (10, 15), helix_angles_deg=(0, 15),
+                                               profile_shift_coefficients=np.arange(-0.5, 1.01, 0.1)),
+     optimizer.Constraints(allow_undercut=True), optimizer.CONTACT_RATIO),
+]
+
+
+def check_optimizer(number_of_designs=5, file=sys.stdout) -> bool:
+    """Compare the objective values of the best designs of optimize and optimize_exhaustive."""
+
+    all_passed = True
+
+    for name, space, constraints, objective in OPTIMIZER_CASES:
+        result = optimizer.optimize(space, constraints, objective, number_of_designs)
+        reference = optimizer.optimize_exhaustive(space, constraints, objective, number_of_designs)
+
+        values = [design[objective.name] for design in result.designs]
+        reference_values = [design[objective.name] for design in reference.designs]
+        passed = len(values) == len(reference_values) and np.allclose(values, reference_values, RTOL, ATOL)
+
+        status = '' if passed else f'  FAIL, {reference_values} expected'
+        print(f"{'optimizer.optimize ' + name:<62} {len(values):>7} designs, {result.designs_evaluated} of "
+              f"{reference.designs_evaluated} evaluated{status}", file=file)
+
+        all_passed &= passed
+
+    return all_passed
+
+
+# endregion
+
+
+# region INVALID DESIGNS
+
+# center distances of one gear pair: valid, too small for a working pressure angle, and too large for contact
+MIXED_CENTER_DISTANCES = (62.1, 55.0, 66.5)
+MIXED_VALID = (True, False, False)
+
+
+def mixed_contact_designs(center_distances=MIXED_CENTER_DISTANCES) -> Dict[str, np.ndarray]:
+    """Arguments of contact_pressure_path_fcn for a helical gear pair at each of the center distances."""
+
+    m_n, alpha_n, beta, z1, z2, b = 2, radians(20), radians(15), 20, 40, 20
+    a = np.asarray(center_distances, dtype=float)
+
+    m_t = hgb.module_transverse_fcn(m_n, beta)
+    alpha_t = hgb.pressure_angle_transverse_fcn(alpha_n, beta)
+    d1 = hgb.theoretical_pitch_diameter_fcn(m_t, z1)
+    d2 = hgb.theoretical_pitch_diameter_fcn(m_t, z2)
+    d_b1 = hgb.base_diameter_fcn(d1, alpha_t)
+    d_b2 = hgb.base_diameter_fcn(d2, alpha_t)
+
+    with np.errstate(invalid='ignore'):
+        alpha_wt = hgb.working_pressure_angle_fcn(a, d_b1, d_b2)
+
+    return {
+        'torque': 100,
+        'base_diameter1': d_b1,
+        'base_diameter2': d_b2,
+        'number_of_teeth1': z1,
+        'working_pressure_angle_transverse': alpha_wt,
+        'pressure_angle_transverse_eap1': hgb.pressure_angle_transverse_arbitrary_fcn(
+            d_b1, hgb.tip_diameter_fcn(d1, m_n, 0)),
+        'pressure_angle_transverse_eap2': hgb.pressure_angle_transverse_arbitrary_fcn(
+            d_b2, hgb.tip_diameter_fcn(d2, m_n, 0)),
+        'facewidth': b,
+        'helix_angle_base': hgb.helix_angle_arbitrary_fcn(d_b1, beta, d1),
+        'contact_ratio_axial': hgb.contact_ratio_axial_fcn(b, beta, m_n),
+    }
+
+
+def check_invalid_designs(file=sys.stdout) -> bool:
+    """Evaluate a batch of valid and invalid designs, which must neither raise nor warn.
+
+    Invalid designs must be NaN, or not pass lubrication screening, and valid designs must equal their evaluation
+    alone.
+    """
+
+    valid = np.array(MIXED_VALID)
+    speeds = np.array([[1000], [3000]])  # rpm, against the row of designs
+    lubricant = lubrication.Lubricant(0.02)
+
+    def evaluate(center_distances):
+        designs = mixed_contact_designs(center_distances)
+        path = contact_stress.contact_pressure_path_fcn(**designs)
+        result = lubrication.lubrication_fcn(path, designs['base_diameter1'], designs['base_diameter2'], speeds,
+                                             lubricant)
+        return path, result, lubrication.lubrication_screen_fcn(result, 0.05, 300)  # limits passed by valid designs
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            path, result, screen = evaluate(MIXED_CENTER_DISTANCES)
+    except (ArithmeticError, ValueError, RuntimeWarning) as e:
+        print(f"{'strength mixed valid and invalid designs':<62} FAIL, {type(e).__name__}: {e}", file=file)
+        return False
+
+    references = [evaluate([a]) for a, is_valid in zip(MIXED_CENTER_DISTANCES, MIXED_VALID) if is_valid]
+
+    passed = np.all(np.isnan(path.pressure_max[~valid])) and np.all(np.isnan(path.position_max[~valid])) and \
+        np.all(np.isnan(result.specific_film_thickness_min[:, ~valid])) and not np.any(screen[:, ~valid]) and \
+        np.all(screen[:, valid]) and \
+        np.allclose(path.pressure_max[valid], [p.pressure_max[0] for p, _, _ in references], RTOL, ATOL) and \
+        np.allclose(result.specific_film_thickness_min[:, valid],
+                    np.concatenate([r.specific_film_thickness_min for _, r, _ in references], axis=-1), RTOL, ATOL)
+
+    status = '' if passed else f'  FAIL, {path.pressure_max} with invalid {~valid}'
+    print(f"{'strength mixed valid and invalid designs':<62} {np.count_nonzero(~valid):>7}{status}", file=file)
+
+    return passed
+
+
+# endregion
+
+
+def run(golden_path=GOLDEN_PATH, update_golden=False, number_of_samples=48, speed_samples=10000, seed=2026,
+        file=sys.stdout) -> bool:
+    """Compare every case, scalar against batched and batched against golden data, then optimize against exhaustive
+    search and evaluate a batch with invalid designs, and print a report.
+
+    :param update_golden: Generate new inputs and store the batched results as golden data, if scalar and batched
+        results agree.  Otherwise the inputs are read from the golden data.
+    :param speed_samples: Number of samples for speed ratios.  Not timed if 0.
+    :return: True if all cases passed.
+    """
+
+    golden_results = {}  # type: Dict[str, np.ndarray]
+    if update_golden:
+        inputs = design_inputs(number_of_samples, seed)
+    else:
+        inputs, golden_results = read_golden(golden_path)
+
+    speed_inputs = design_inputs(speed_samples, seed + 1) if speed_samples else None
+
+    all_passed = True
+    results = {}
+    print(f"{'case':<62} {'invalid':>7} {'error':>7} {'golden':>7} {'speedup':>8}", file=file)
+
+    for case in cases():
+        scalar = evaluate_scalar(case, inputs)
+        batched = evaluate_batched(case, inputs)
+        results[case.name] = batched
+
+        comparison = compare(batched, scalar, case.rtol, case.atol)
+        passed = comparison.passed
+        golden_status = '-'
+
+        if not update_golden:
+            if case.name in golden_results:
+                golden_comparison = compare(batched, golden_results[case.name], case.rtol, case.atol)
+                golden_status = f'{golden_comparison.max_error:.2g}' if golden_comparison.passed else 'FAIL'
+                passed &= golden_comparison.passed
+            else:
+                golden_status = 'missing'
+                passed = False
+
+        ratio = f'{speed_ratio(case, speed_inputs):.1f}x' if speed_inputs is not None else '-'
+        status = '' if passed else f'  FAIL, {comparison.mismatched_invalid} invalid mismatched'
+        print(f'{case.name:<62} {comparison.invalid:>7} {comparison.max_error:>7.2g} {golden_status:>7} '
+              f'{ratio:>8}{status}', file=file)
+
+        all_passed &= passed
+
+    if update_golden:
+        if all_passed:
+            write_golden(golden_path, inputs, results, seed)
+            print(f'Golden data written to {golden_path}', file=file)
+        else:
+            print('Golden data not written, scalar and batched results disagree.', file=file)
+
+    all_passed &= check_optimizer(file=file)
+    all_passed &= check_invalid_designs(file=file)
+
+    return all_passed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Check scalar and vectorized geometry functions for equivalence.')
+    parser.add_argument('--golden', default=GOLDEN_PATH, help='golden data file')
+    parser.add_argument('--update-golden', action='store_true', help='regenerate inputs and golden results')
+    parser.add_argument('-n', '--samples', type=int, default=48, help='number of samples for --update-golden')
+    parser.add_argument('--speed-samples', type=int, default=10000, help='number of samples timed, 0 to skip')
+    parser.add_argument('--seed', type=int, default=2026, help='random seed for --update-golden')
+    args = parser.parse_args(argv)
+
+    passed = run(args.golden, args.update_golden, args.samples, args.speed_samples, args.seed)
+
+    return 0 if passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
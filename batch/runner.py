@@ -0,0 +1,209 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Command-line batch runner of gear calculations driven by design files.
+
+Design files list jobs, each with a calculation name and its inputs:
+
+- JSON or YAML: a list of jobs, or a mapping with a 'jobs' list.  A job is a mapping with 'calculation', an optional
+  'id', and either an 'inputs' mapping or the inputs as the remaining keys.
+- CSV: one job per row, with a 'calculation' column, an optional 'id' column, and one column per input.  Empty cells
+  are omitted, so that defaults apply.
+
+Usage::
+
+    python -m batch.runner designs.csv -o results.json --workers 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List
+
+from batch import calculations
+
+
+Job = Dict[str, Any]
+Record = Dict[str, Any]
+
+
+# region DESIGN FILES
+
+def _parse_cell(value: str):
+    """Convert a CSV cell to int, float or bool where possible."""
+
+    for typ in (int, float):
+        try:
+            return typ(value)
+        except ValueError:
+            pass
+
+    if value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+
+    return value
+
+
+def _normalize_job(job: Job, index: int) -> Job:
+    job = dict(job)
+
+    try:
+        calculation = job.pop('calculation')
+    except KeyError:
+        raise ValueError(f'Job {index} has no calculation.') from None
+
+    job_id = job.pop('id', index)
+    inputs = job.pop('inputs', None)
+
+    if inputs is None:
+        inputs = job
+    elif job:
+        raise ValueError(f'Job {job_id} has unexpected keys besides inputs: {sorted(job)}')
+
+    return {'id': job_id, 'calculation': calculation, 'inputs': inputs}
+
+
+def read_jobs(path: str) -> List[Job]:
+    """Read the jobs of a JSON, YAML or CSV design file."""
+
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, newline='') as f:
+        if extension == '.csv':
+            rows = [{key: _parse_cell(value) for key, value in row.items() if value != ''}
+                    for row in csv.DictReader(f)]
+        elif extension == '.json':
+            rows = json.load(f)
+        elif extension in ('.yaml', '.yml'):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError('PyYAML is required to read YAML design files.') from None
+            rows = yaml.safe_load(f)
+        else:
+            raise ValueError(f'Unsupported design file type: {extension}')
+
+    if isinstance(rows, dict):
+        rows = rows['jobs']
+
+    return [_normalize_job(row, i) for i, row in enumerate(rows, start=1)]
+
+
+# endregion
+
+
+# region EXECUTION
+
+def run_job(job: Job) -> Record:
+    """Run a single job, capturing any failure in the returned record."""
+
+    start = time.perf_counter()
+
+    try:
+        results = calculations.run(job['calculation'], job['inputs'])
+        status, error = 'ok', None
+    except Exception as e:
+        results = {}
+        status, error = 'error', ''.join(traceback.format_exception_only(type(e), e)).strip()
+
+    return {
+        'id': job['id'],
+        'calculation': job['calculation'],
+        'status': status,
+        'elapsed_s': time.perf_counter() - start,
+        'error': error,
+        'inputs': job['inputs'],
+        'results': results,
+    }
+
+
+def run_jobs(jobs: List[Job], workers: int = 1, chunksize: int = 16) -> Iterable[Record]:
+    """Run jobs in order, in parallel if more than one worker.  Records are yielded as they complete, in job order."""
+
+    if workers <= 1:
+        return map(run_job, jobs)
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    def records():
+        with executor:
+            yield from executor.map(run_job, jobs, chunksize=chunksize)
+
+    return records()
+
+
+# endregion
+
+
+# region RESULT FILES
+
+def _flatten(record: Record) -> Dict[str, Any]:
+    row = {key: record[key] for key in ('id', 'calculation', 'status', 'elapsed_s', 'error')}
+
+    for prefix in ('inputs', 'results'):
+        for key, value in record[prefix].items():
+            row[f'{prefix}.{key}'] = json.dumps(value) if isinstance(value, (list, dict)) else value
+
+    return row
+
+
+def write_records(path: str, records: List[Record]) -> None:
+    """Write result records to a JSON, JSON lines or CSV file, by extension."""
+
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, 'w', newline='') as f:
+        if extension == '.json':
+            json.dump(records, f, indent=1)
+        elif extension == '.jsonl':
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+        elif extension == '.csv':
+            rows = [_flatten(record) for record in records]
+            fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            raise ValueError(f'Unsupported result file type: {extension}')
+
+
+# endregion
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Run gear calculations for every job of a design file.')
+    parser.add_argument('design_file', help='JSON, YAML or CSV design file')
+    parser.add_argument('-o', '--output', required=True, help='JSON, JSONL or CSV result file')
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(), help='number of worker processes')
+    parser.add_argument('-v', '--verbose', action='store_true', help='print the timing of each job')
+    args = parser.parse_args(argv)
+
+    jobs = read_jobs(args.design_file)
+    start = time.perf_counter()
+    records = []
+
+    for record in run_jobs(jobs, args.workers):
+        records.append(record)
+
+        if args.verbose or record['status'] != 'ok':
+            message = f" {record['error']}" if record['error'] else ''
+            print(f"[{record['status']}] {record['id']} {record['calculation']} "
+                  f"{1000 * record['elapsed_s']:.2f} ms{message}", file=sys.stderr)
+
+    write_records(args.output, records)
+
+    failed = sum(record['status'] != 'ok' for record in records)
+    elapsed = time.perf_counter() - start
+    print(f'{len(records)} jobs, {failed} failed, {elapsed:.2f} s total', file=sys.stderr)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
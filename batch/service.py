@@ -0,0 +1,464 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Local HTTP/JSON service for gear calculations, with request coalescing.
+
+Requests arriving within a short window are grouped by calculation and run as one batch in a worker process, so that
+many concurrent callers share the cost of process dispatch.  Helical gear batches are evaluated in a single vectorized
+pass; other calculations are looped within the batch.  Each caller receives only its own result.
+
+Endpoints:
+
+- ``POST /calculate``: a job, ``{"calculation": ..., "inputs": {...}, "id": ...}``, or a list of jobs.  Responds with
+  the result record, or a list of records, as written by the batch runner.
+- ``GET /calculations``: names of the available calculations.
+- ``GET /metrics``: request throughput, batch sizes and latency percentiles.
+
+Usage::
+
+    python -m batch.service --port 8765 --window-ms 2
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from batch import calculations
+from batch.runner import Job, Record, run_job
+from geometry import helical_gears_batch as hgb
+
+
+# region VECTORIZED CALCULATIONS
+
+def _signature(fcn) -> Tuple[Dict[str, Any], set]:
+    """Defaults of the optional parameters, and the names of the required parameters, of a calculation."""
+
+    parameters = inspect.signature(fcn).parameters.values()
+    defaults = {p.name: p.default for p in parameters if p.default is not p.empty}
+    required = {p.name for p in parameters if p.default is p.empty}
+
+    return defaults, required
+
+
+def _is_number(value) -> bool:
+    return type(value) in (int, float)
+
+
+def _helical_gear_vectorized(inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Vectorized mirror of calculations.helical_gear, with NaN form diameter where undercut."""
+
+    module_normal = inputs['module_normal']
+    number_of_teeth = inputs['number_of_teeth']
+    profile_shift_coefficient = inputs['profile_shift_coefficient']
+    basic_rack_addendum_coefficient = inputs['basic_rack_addendum_coefficient']
+    basic_rack_dedendum_coefficient = inputs['basic_rack_dedendum_coefficient']
+
+    pressure_angle_normal = np.radians(inputs['pressure_angle_normal_deg'])
+    helix_angle = np.radians(inputs['helix_angle_deg'])
+    basic_rack_addendum = basic_rack_addendum_coefficient * module_normal
+    basic_rack_dedendum = basic_rack_dedendum_coefficient * module_normal
+    profile_shift = profile_shift_coefficient * module_normal
+
+    # core params
+    module_transverse = hgb.module_transverse_fcn(module_normal, helix_angle)
+    pressure_angle_transverse = hgb.pressure_angle_transverse_fcn(pressure_angle_normal, helix_angle)
+    theoretical_pitch_diameter = hgb.theoretical_pitch_diameter_fcn(module_transverse, number_of_teeth)
+    base_diameter = hgb.base_diameter_fcn(theoretical_pitch_diameter, pressure_angle_transverse)
+    tip_diameter = hgb.tip_diameter_fcn(theoretical_pitch_diameter, basic_rack_addendum, profile_shift)
+    root_diameter = hgb.root_diameter_fcn(theoretical_pitch_diameter, basic_rack_dedendum, profile_shift)
+    helix_angle_base = hgb.helix_angle_arbitrary_fcn(base_diameter, helix_angle, theoretical_pitch_diameter)
+
+    # tooth thicknesses
+    tooth_thickness_transverse = hgb.tooth_thickness_transverse_fcn(
+        module_normal, pressure_angle_normal, helix_angle, profile_shift_coefficient)
+    tooth_thickness_transverse_tip = hgb.tooth_thickness_transverse_arbitrary_fcn(
+        tip_diameter, module_normal, pressure_angle_normal, number_of_teeth, helix_angle, profile_shift_coefficient)
+    tooth_thickness_normal = hgb.tooth_thickness_normal_fcn(tooth_thickness_transverse, helix_angle)
+    tooth_thickness_normal_tip = hgb.tooth_thickness_normal_fcn(tooth_thickness_transverse_tip, helix_angle)
+
+    # root params
+    form_diameter = hgb.form_diameter_fcn(module_normal, pressure_angle_normal, helix_angle, number_of_teeth,
+                                          basic_rack_dedendum_coefficient, profile_shift_coefficient,
+                                          inputs['tool_tip_radius_coefficient'])
+
+    return {
+        'module_transverse': module_transverse,
+        'pressure_angle_transverse_deg': np.degrees(pressure_angle_transverse),
+        'theoretical_pitch_diameter': theoretical_pitch_diameter,
+        'base_diameter': base_diameter,
+        'tip_diameter': tip_diameter,
+        'root_diameter': root_diameter,
+        'form_diameter': form_diameter,
+        'helix_angle_base_deg': np.degrees(helix_angle_base),
+        'pitch_transverse': hgb.pitch_transverse_fcn(theoretical_pitch_diameter, number_of_teeth),
+        'base_pitch_transverse': hgb.pitch_transverse_fcn(base_diameter, number_of_teeth),
+        'base_pitch_normal': hgb.base_pitch_normal_fcn(module_normal, pressure_angle_normal),
+        'tooth_thickness_transverse': tooth_thickness_transverse,
+        'tooth_thickness_normal': tooth_thickness_normal,
+        'tooth_thickness_normal_tip': tooth_thickness_normal_tip,
+        'tooth_thickness_tip_coefficient': tooth_thickness_normal_tip / module_normal,
+        'minimum_profile_shift_coefficient': hgb.minimum_profile_shift_coefficient_to_avoid_undercut(
+            basic_rack_addendum_coefficient, pressure_angle_normal, number_of_teeth, helix_angle),
+        'minimum_number_of_teeth': hgb.minimum_teeth_to_avoid_undercut(
+            basic_rack_addendum_coefficient, pressure_angle_normal, profile_shift_coefficient, helix_angle),
+        'undercut': np.isnan(form_diameter),
+    }
+
+
+# results that are None in the scalar calculation, and NaN in the vectorized one
+_NULLABLE = {'helical_gear': {'form_diameter'}}
+
+VECTORIZED = {
+    'helical_gear': _helical_gear_vectorized,
+}
+
+
+def _run_vectorized(calculation: str, jobs: List[Job]) -> List[Optional[Record]]:
+    """Records of the jobs that could be evaluated in one vectorized pass, and None for the others.
+
+    Jobs with unexpected, missing or non-numeric inputs, or with non-finite results, are left to the scalar
+    calculation, so that their errors are reported exactly as by the batch runner.
+    """
+
+    defaults, required = _signature(calculations.CALCULATIONS[calculation])
+    names = list(defaults) + sorted(required)
+    indices = [i for i, job in enumerate(jobs)
+               if required <= job['inputs'].keys() <= set(names) and all(map(_is_number, job['inputs'].values()))]
+
+    records = [None] * len(jobs)  # type: List[Optional[Record]]
+    if not indices:
+        return records
+
+    start = time.perf_counter()
+
+    inputs = {name: np.array([jobs[i]['inputs'].get(name, defaults.get(name)) for i in indices], dtype=float)
+              for name in names}
+    with np.errstate(all='ignore'):
+        results = VECTORIZED[calculation](inputs)
+
+    nullable = _NULLABLE.get(calculation, set())
+    finite = np.logical_and.reduce([np.isfinite(values) for name, values in results.items() if name not in nullable])
+    columns = {name: np.where(np.isnan(values), None, values).tolist() if name in nullable else values.tolist()
+               for name, values in results.items()}
+    elapsed = (time.perf_counter() - start) / len(indices)
+
+    for k, i in enumerate(indices):
+        if not finite[k]:
+            continue
+
+        row = {name: column[k] for name, column in columns.items()}
+
+        records[i] = {
+            'id': jobs[i]['id'],
+            'calculation': calculation,
+            'status': 'ok',
+            'elapsed_s': elapsed,
+            'error': None,
+            'inputs': jobs[i]['inputs'],
+            'results': row,
+        }
+
+    return records
+
+
+def run_batch(calculation: str, jobs: List[Job]) -> List[Record]:
+    """Run jobs of the same calculation, vectorized where supported.  Records are returned in job order."""
+
+    if calculation in VECTORIZED:
+        records = _run_vectorized(calculation, jobs)
+    else:
+        records = [None] * len(jobs)
+
+    return [run_job(job) if record is None else record for job, record in zip(jobs, records)]
+
+
+# endregion
+
+
+# region COALESCING
+
+class Metrics:
+    """Request and batch counters, with latency percentiles over the most recent requests."""
+
+    def __init__(self, window: int = 10000):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.latencies = deque(maxlen=window)
+        self.completed = deque(maxlen=window)
+
+    def record_batch(self, records: List[Record], latencies: List[float]) -> None:
+        now = time.perf_counter()
+
+        self.batches += 1
+        self.requests += len(records)
+        self.errors += sum(record['status'] != 'ok' for record in records)
+        self.latencies.extend(latencies)
+        self.completed.extend([now] * len(records))
+
+    def summary(self) -> Dict[str, Any]:
+        now = time.perf_counter()
+        uptime = now - self.started
+
+        recent = [t for t in self.completed if now - t <= 10]
+        latencies_ms = 1000 * np.array(self.latencies) if self.latencies else np.full(1, np.nan)
+        p50, p90, p99 = np.percentile(latencies_ms, [50, 90, 99])
+
+        return {
+            'uptime_s': uptime,
+            'requests': self.requests,
+            'errors': self.errors,
+            'batches': self.batches,
+            'mean_batch_size': self.requests / self.batches if self.batches else None,
+            'throughput_per_s': self.requests / uptime if uptime else None,
+            'throughput_recent_per_s': len(recent) / min(10, uptime) if uptime else None,
+            'latency_ms': {
+                'mean': float(np.mean(latencies_ms)),
+                'p50': float(p50),
+                'p90': float(p90),
+                'p99': float(p99),
+                'max': float(np.max(latencies_ms)),
+            },
+        }
+
+
+class Coalescer:
+    """Collects jobs submitted within a time window and runs them as batches in an executor."""
+
+    def __init__(self, executor: Executor, window: float = 0.002, max_batch_size: int = 1024,
+                 metrics: Optional[Metrics] = None):
+        """
+        :param executor: Executor of the batches, typically a process pool.
+        :param window: Seconds to wait for more jobs after the first job of a batch arrives.
+        :param max_batch_size: Number of jobs that dispatches a batch without waiting for the window to close.
+        :param metrics: Metrics to update as batches complete.
+        """
+
+        self.executor = executor
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.metrics = Metrics() if metrics is None else metrics
+
+        self._queue = []  # type: List[Tuple[Job, float, asyncio.Future]]
+        self._timer = None  # type: Optional[asyncio.TimerHandle]
+
+    def submit(self, job: Job) -> 'asyncio.Future[Record]':
+        """Queue a normalized job, returning a future of its record."""
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((job, time.perf_counter(), future))
+
+        if len(self._queue) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+
+        return future
+
+    def flush(self) -> None:
+        """Dispatch all queued jobs, one batch per calculation."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        queue, self._queue = self._queue, []
+
+        groups = {}  # type: Dict[str, List[Tuple[Job, float, asyncio.Future]]]
+        for item in queue:
+            groups.setdefault(item[0]['calculation'], []).append(item)
+
+        for calculation, items in groups.items():
+            asyncio.ensure_future(self._run(calculation, items))
+
+    async def _run(self, calculation: str, items: List[Tuple[Job, float, asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        jobs = [job for job, _, _ in items]
+
+        try:
+            records = await loop.run_in_executor(self.executor, run_batch, calculation, jobs)
+        except Exception as e:
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        now = time.perf_counter()
+        self.metrics.record_batch(records, [now - submitted for _, submitted, _ in items])
+
+        for (_, _, future), record in zip(items, records):
+            if not future.done():
+                future.set_result(record)
+
+
+# endregion
+
+
+# region HTTP
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 422: 'Unprocessable Entity',
+            500: 'Internal Server Error'}
+
+
+def _normalize_request(job: Any, index: int) -> Job:
+    if not isinstance(job, dict) or not isinstance(job.get('inputs', {}), dict):
+        raise ValueError(f'Job {index} must be an object with a calculation and an inputs object.')
+
+    job = dict(job)
+    inputs = job.pop('inputs', {})
+    job_id = job.pop('id', index)
+
+    try:
+        calculation = job.pop('calculation')
+    except KeyError:
+        raise ValueError(f'Job {job_id} has no calculation.') from None
+
+    if calculation not in calculations.CALCULATIONS:
+        raise ValueError(f'Unknown calculation: {calculation!r}, expected one of {sorted(calculations.CALCULATIONS)}')
+
+    if job:
+        raise ValueError(f'Job {job_id} has unexpected keys: {sorted(job)}')
+
+    return {'id': job_id, 'calculation': calculation, 'inputs': inputs}
+
+
+class CalculationService:
+    """Minimal HTTP/1.1 server with keep-alive, dispatching jobs to a coalescer."""
+
+    def __init__(self, coalescer: Coalescer):
+        self.coalescer = coalescer
+
+    async def calculate(self, body: bytes) -> Tuple[int, Any]:
+        try:
+            payload = json.loads(body)
+            many = isinstance(payload, list)
+            jobs = [_normalize_request(job, i) for i, job in enumerate(payload if many else [payload], start=1)]
+        except ValueError as e:
+            return 400, {'error': str(e)}
+
+        records = await asyncio.gather(*[self.coalescer.submit(job) for job in jobs])
+
+        if many:
+            return 200, records
+
+        return (200 if records[0]['status'] == 'ok' else 422), records[0]
+
+    async def route(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        routes = {
+            '/calculate': 'POST',
+            '/calculations': 'GET',
+            '/metrics': 'GET',
+        }
+
+        if path not in routes:
+            return 404, {'error': f'No such endpoint: {path}'}
+
+        if method != routes[path]:
+            return 405, {'error': f'{path} expects {routes[path]}'}
+
+        if path == '/calculate':
+            return await self.calculate(body)
+        elif path == '/calculations':
+            return 200, sorted(calculations.CALCULATIONS)
+        else:
+            return 200, self.coalescer.metrics.summary()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+
+                try:
+                    content_length = int(headers.get('content-length', 0))
+                    if content_length < 0:
+                        raise ValueError
+                except ValueError:
+                    # the body cannot be framed, so the connection cannot be reused
+                    status, payload = 400, {'error': f"Invalid Content-Length: {headers['content-length']!r}"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(content_length)
+
+                    try:
+                        status, payload = await self.route(method, target.split('?')[0], body)
+                    except Exception as e:
+                        status, payload = 500, {'error': repr(e)}
+
+                content = json.dumps(payload).encode()
+
+                writer.write(f'HTTP/1.1 {status} {_REASONS[status]}\r\n'
+                             f'Content-Type: application/json\r\n'
+                             f'Content-Length: {len(content)}\r\n'
+                             f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode() + content)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765, window: float = 0.002, max_batch_size: int = 1024,
+                workers: Optional[int] = None) -> None:
+    """Serve calculations until cancelled."""
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # start the worker processes before accepting connections; workers forked later would inherit client
+        # sockets, and closing a connection would then not reach the client
+        executor.submit(int).result()
+
+        service = CalculationService(Coalescer(executor, window, max_batch_size))
+        server = await asyncio.start_server(service.handle, host, port)
+
+        async with server:
+            await server.serve_forever()
+
+
+# endregion
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description='Serve gear calculations over HTTP on the local machine.')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind, localhost by default')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--window-ms', type=float, default=2, help='time window for coalescing requests')
+    parser.add_argument('--max-batch', type=int, default=1024, help='maximum number of jobs per batch')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='number of worker processes')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms / 1000, args.max_batch, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Shared-memory result store for parallel design sweeps.
+
+Rows of a NumPy structured array are written in place by worker processes and read zero-copy by the parent, so that
+results are never pickled back.  For results larger than memory, the store can instead spill to a memory-mapped file.
+
+Shared memory requires Python 3.8 or later; on earlier versions, stores spill to a temporary file by default.
+"""
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+
+# columns of the helical gear candidates, see the geometry notebook Chapter 3
+CANDIDATE_DTYPE = np.dtype([
+    ('#', np.int64),
+    ('z1', np.int32),
+    ('z2', np.int32),
+    ('ratio', np.float64),
+    ('beta', np.float64),
+    ('mn', np.float64),
+])
+
+
+class StoreHandle(NamedTuple):
+    """Picklable reference to a store, for attaching from other processes."""
+
+    dtype: np.dtype
+    number_of_rows: int
+    shared_memory_name: Optional[str] = None
+    spill_path: Optional[str] = None
+
+
+class SweepStore:
+    """Fixed-size table of sweep results, backed by shared memory or a memory-mapped file.
+
+    Create a store in the parent process, pass its handle to workers, and attach there.  Only the creating process
+    unlinks the storage; workers share its resource tracker, so attaching does not take ownership of the segment.
+    """
+
+    def __init__(self, handle: StoreHandle, create: bool = False):
+        self.handle = handle
+        self._owner = create
+        self._shm = None
+        self._temporary_path = None
+
+        dtype = np.dtype(handle.dtype)
+        shape = (handle.number_of_rows,)
+
+        if handle.spill_path is not None:
+            mode = 'w+' if create else 'r+'
+            self.rows = np.memmap(handle.spill_path, dtype=dtype, mode=mode, shape=shape)
+        else:
+            if shared_memory is None:
+                raise RuntimeError('Shared memory requires Python 3.8 or later; specify a spill path instead.')
+
+            if create:
+                size = max(dtype.itemsize * handle.number_of_rows, 1)
+                self._shm = shared_memory.SharedMemory(name=handle.shared_memory_name, create=True, size=size)
+            else:
+                self._shm = shared_memory.SharedMemory(name=handle.shared_memory_name)
+
+            self.rows = np.ndarray(shape, dtype=dtype, buffer=self._shm.buf)
+
+        if create:
+            self.rows[...] = np.zeros((), dtype=dtype)
+
+    @classmethod
+    def create(cls, dtype, number_of_rows: int, spill_path: Optional[str] = None) -> 'SweepStore':
+        """Create a store in shared memory, or in the spill file if given.
+
+        Without shared memory (Python 3.7), a temporary spill file is used, removed when the store is closed.
+        """
+
+        temporary_path = None
+        if spill_path is None and shared_memory is None:
+            fd, temporary_path = tempfile.mkstemp(prefix='sweep_', suffix='.dat')
+            os.close(fd)
+            spill_path = temporary_path
+
+        name = None if spill_path is not None else f'sweep_{os.getpid()}_{os.urandom(4).hex()}'
+        store = cls(StoreHandle(np.dtype(dtype), number_of_rows, name, spill_path), create=True)
+        store._temporary_path = temporary_path
+
+        return store
+
+    @classmethod
+    def attach(cls, handle: StoreHandle) -> 'SweepStore':
+        return cls(handle, create=False)
+
+    def close(self) -> None:
+        """Release this process's view of the store, and the storage itself if this process created it."""
+
+        if self.rows is None:
+            return
+
+        if isinstance(self.rows, np.memmap):
+            self.rows.flush()
+
+        self.rows = None
+
+        if self._shm is not None:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+            self._shm = None
+
+        if self._temporary_path is not None:
+            os.remove(self._temporary_path)
+            self._temporary_path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.handle.number_of_rows
+
+
+# region PARALLEL SWEEP
+
+_worker_store = None
+_worker_fcn = None
+
+
+def _init_worker(handle: StoreHandle, fcn: Callable[..., Sequence[Any]]) -> None:
+    global _worker_store, _worker_fcn
+
+    _worker_store = SweepStore.attach(handle)
+    _worker_fcn = fcn
+
+
+def _write_rows(start: int, tasks: Sequence[Sequence[Any]]) -> int:
+    rows = _worker_store.rows
+
+    for i, args in enumerate(tasks, start=start):
+        rows[i] = tuple(_worker_fcn(*args))
+
+    return len(tasks)
+
+
+def run_sweep(fcn: Callable[..., Sequence[Any]], tasks: Sequence[Sequence[Any]], store: SweepStore,
+              workers: Optional[int] = None, chunksize: int = 1000) -> SweepStore:
+    """Evaluate fcn(*args) for every task in parallel, writing the returned row of task i to row i of the store.
+
+    :param fcn: Picklable, module-level function returning a row of values in the order of the store fields.
+    :param tasks: Argument tuples, one per row.
+    :param store: Store with at least as many rows as tasks.
+    :param workers: Number of worker processes; defaults to the CPU count.
+    :param chunksize: Number of tasks sent to a worker at a time.
+    :return: The store, for chaining.
+    """
+
+    if len(tasks) > len(store):
+        raise ValueError(f'Store has {len(store)} rows for {len(tasks)} tasks.')
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(store.handle, fcn)) as executor:
+        futures = [executor.submit(_write_rows, start, tasks[start:start + chunksize])
+                   for start in range(0, len(tasks), chunksize)]
+
+        for future in futures:
+            future.result()
+
+    if isinstance(store.rows, np.memmap):
+        store.rows.flush()
+
+    return store
+
+
+# endregion
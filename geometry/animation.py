@@ -0,0 +1,275 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for animating gear meshes.
+
+Gear outlines are computed once, then rotated for all frames in a single array operation.  Frames are drawn by updating
+line data only: in notebooks with matplotlib blitting, and for review videos by rasterizing with Agg and writing raw
+RGBA frames straight to an ffmpeg pipe, optionally rasterizing chunks of frames in parallel processes.
+"""
+
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from math import pi, tan, acos, atan, cos
+from typing import Iterator, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+try:
+    import involute as inv  # notebooks, run from geometry/
+except ImportError:
+    from geometry import involute as inv  # batch tools, run from the repository root
+
+
+# region OUTLINES
+
+def gear_outline(number_of_teeth, module_normal, pressure_angle_normal, helix_angle=0, profile_shift_coefficient=0,
+                 addendum_coefficient=1, dedendum_coefficient=1.25, points_per_flank=20,
+                 points_per_land=6) -> Tuple[np.ndarray, np.ndarray]:
+    """Closed transverse outline of an external gear, with a tooth centered on the positive x-axis.
+
+    Flanks are involutes, and tip and root lands are circular arcs.  Below the base circle, flanks are continued
+    radially to the root circle; the fillet is not modelled.
+
+    :param pressure_angle_normal: Normal pressure angle, radians.
+    :param helix_angle: Helix angle, radians.  Zero for spur gears.
+    :param profile_shift_coefficient: Profile shift coefficient, normal to the helix for helical gears.
+    :param addendum_coefficient: Addendum coefficient, normal to the helix.
+    :return: x and y coordinates, first point repeated at the end.
+    """
+
+    z = number_of_teeth
+    m_n = module_normal
+    x = profile_shift_coefficient
+    alpha_n = pressure_angle_normal
+    alpha_t = atan(tan(alpha_n) / cos(helix_angle))
+
+    r = z * m_n / cos(helix_angle) / 2
+    r_b = r * cos(alpha_t)
+    r_a = r + (addendum_coefficient + x) * m_n
+    r_f = r - (dedendum_coefficient - x) * m_n
+
+    # half tooth angle at the base circle, from the transverse tooth thickness at the reference circle
+    tooth_thickness = m_n / cos(helix_angle) * (pi / 2 + 2 * x * tan(alpha_n))
+    eta_b = tooth_thickness / (2 * r) + inv.involute_function(alpha_t)
+
+    # lower flank, from the form circle to the tip, rotated to end at the tooth half angle
+    roll_start = tan(acos(r_b / r_f)) if r_f > r_b else 0
+    roll = np.linspace(roll_start, tan(acos(r_b / r_a)), points_per_flank)
+    x_flank, y_flank = inv.involute_curve(r_b, roll)
+    theta_flank = np.arctan2(y_flank, x_flank) - eta_b
+    radius_flank = np.hypot(x_flank, y_flank)
+
+    if r_f < r_b:
+        theta_flank = np.concatenate([[theta_flank[0]], theta_flank])
+        radius_flank = np.concatenate([[r_f], radius_flank])
+
+    # one tooth in polar coordinates: lower flank, tip land, upper flank, then root land to the next tooth
+    theta_tip = np.linspace(theta_flank[-1], -theta_flank[-1], points_per_land)[1:-1]
+    theta_root = np.linspace(-theta_flank[0], 2 * pi / z + theta_flank[0], points_per_land)[1:-1]
+
+    theta = np.concatenate([theta_flank, theta_tip, -theta_flank[::-1], theta_root])
+    radius = np.concatenate([radius_flank, np.full(len(theta_tip), r_a), radius_flank[::-1],
+                             np.full(len(theta_root), r_f)])
+
+    # all teeth at once
+    theta = (theta + 2 * pi / z * np.arange(z)[:, np.newaxis]).ravel()
+    radius = np.tile(radius, z)
+
+    x_outline, y_outline = inv.circle_curve(radius, theta)
+
+    return np.append(x_outline, x_outline[0]), np.append(y_outline, y_outline[0])
+
+
+def rotate_frames(x, y, angles, x_center=0, y_center=0) -> Tuple[np.ndarray, np.ndarray]:
+    """Outline rotated about its origin by each angle, then translated to the center.
+
+    :return: x and y coordinates with shape (frames, points).
+    """
+
+    cos_angles = np.cos(angles)[:, np.newaxis]
+    sin_angles = np.sin(angles)[:, np.newaxis]
+
+    return x * cos_angles - y * sin_angles + x_center, x * sin_angles + y * cos_angles + y_center
+
+
+class MeshFrames(NamedTuple):
+    """Outline coordinates of both gears of a mesh at every frame, with shape (frames, points)."""
+
+    x1: np.ndarray
+    y1: np.ndarray
+    x2: np.ndarray
+    y2: np.ndarray
+    limits: Tuple[float, float, float, float]  # x_min, x_max, y_min, y_max
+
+
+def mesh_frames(number_of_teeth1, number_of_teeth2, module_normal, pressure_angle_normal, helix_angle=0,
+                center_distance=None, profile_shift_coefficient1=0, profile_shift_coefficient2=0,
+                number_of_frames=120, teeth_per_cycle=1, **outline_options) -> MeshFrames:
+    """Frames of an external gear pair in mesh, gear 1 at the origin and gear 2 on the positive x-axis.
+
+    Each outline is computed once.  Gear 1 turns counterclockwise through teeth_per_cycle pitches over the frames,
+    which loop seamlessly for a whole number of pitches.
+
+    :param center_distance: Defaults to the reference center distance.
+    :param outline_options: Passed to gear_outline for both gears.
+    """
+
+    z1 = number_of_teeth1
+    z2 = number_of_teeth2
+
+    if center_distance is None:
+        center_distance = (z1 + z2) * module_normal / cos(helix_angle) / 2
+
+    x1, y1 = gear_outline(z1, module_normal, pressure_angle_normal, helix_angle, profile_shift_coefficient1,
+                          **outline_options)
+    x2, y2 = gear_outline(z2, module_normal, pressure_angle_normal, helix_angle, profile_shift_coefficient2,
+                          **outline_options)
+
+    angles1 = 2 * pi / z1 * teeth_per_cycle * np.arange(number_of_frames) / number_of_frames
+    # gear 2 turns the other way, with a tooth space of gear 2 facing the tooth of gear 1 on the center line
+    angles2 = pi + pi / z2 - angles1 * z1 / z2
+
+    x1_frames, y1_frames = rotate_frames(x1, y1, angles1)
+    x2_frames, y2_frames = rotate_frames(x2, y2, angles2, x_center=center_distance)
+
+    r_a1 = np.max(np.hypot(x1, y1))
+    r_a2 = np.max(np.hypot(x2, y2))
+    limits = (-r_a1, center_distance + r_a2, -max(r_a1, r_a2), max(r_a1, r_a2))
+
+    return MeshFrames(x1_frames, y1_frames, x2_frames, y2_frames, limits)
+
+
+# endregion
+
+
+# region RENDERING
+
+def _mesh_figure(frames: MeshFrames, size_px: Tuple[int, int], dpi: int, colors: Sequence[str], figure=None):
+    width, height = size_px
+
+    if figure is None:
+        figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        FigureCanvasAgg(figure)
+
+    ax = figure.add_axes([0, 0, 1, 1])
+    x_min, x_max, y_min, y_max = frames.limits
+    margin = 0.02 * (x_max - x_min)
+    ax.set_xlim(x_min - margin, x_max + margin)
+    ax.set_ylim(y_min - margin, y_max + margin)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    line1, = ax.plot(frames.x1[0], frames.y1[0], colors[0], linewidth=1.5, animated=True)
+    line2, = ax.plot(frames.x2[0], frames.y2[0], colors[1], linewidth=1.5, animated=True)
+
+    return figure, ax, [line1, line2]
+
+
+def animate_mesh(frames: MeshFrames, figure=None, interval=40, colors=('k', 'b')) -> FuncAnimation:
+    """Blitted matplotlib animation of mesh frames, for notebooks.  Each frame only updates the line data.
+
+    :param figure: Figure to draw in, e.g. plt.figure(figsize=FIGSIZE).  A new Agg figure if None.
+    :param interval: Delay between frames, ms.
+    """
+
+    figure, _, lines = _mesh_figure(frames, (600, 600), 100, colors, figure)
+
+    def update(i):
+        lines[0].set_data(frames.x1[i], frames.y1[i])
+        lines[1].set_data(frames.x2[i], frames.y2[i])
+        return lines
+
+    return FuncAnimation(figure, update, frames=len(frames.x1), interval=interval, blit=True)
+
+
+def render_frames(frames: MeshFrames, indices: Optional[Sequence[int]] = None, size_px=(640, 640), dpi=100,
+                  colors=('k', 'b')) -> Iterator[bytes]:
+    """Rasterize frames to raw RGBA bytes with Agg, blitting the lines over a background drawn once."""
+
+    figure, ax, lines = _mesh_figure(frames, size_px, dpi, colors)
+    canvas = figure.canvas
+
+    canvas.draw()
+    background = canvas.copy_from_bbox(figure.bbox)
+
+    for i in range(len(frames.x1)) if indices is None else indices:
+        canvas.restore_region(background)
+        lines[0].set_data(frames.x1[i], frames.y1[i])
+        lines[1].set_data(frames.x2[i], frames.y2[i])
+        for line in lines:
+            ax.draw_artist(line)
+        yield bytes(canvas.buffer_rgba())
+
+
+_worker_render_options = None  # (frames, size_px, dpi, colors) of a worker process
+
+
+def _init_render_worker(frames: MeshFrames, size_px, dpi, colors) -> None:
+    global _worker_render_options
+    _worker_render_options = (frames, size_px, dpi, colors)
+
+
+def _render_chunk(start: int, stop: int) -> bytes:
+    frames, size_px, dpi, colors = _worker_render_options
+
+    return b''.join(render_frames(frames, range(start, stop), size_px, dpi, colors))
+
+
+def write_video(path: str, frames: MeshFrames, fps=30, size_px=(640, 640), dpi=100, colors=('k', 'b'),
+                workers: Optional[int] = None, chunk_size=30, ffmpeg='ffmpeg') -> None:
+    """Encode mesh frames to a video file by piping raw RGBA frames to ffmpeg.
+
+    :param path: Output file, e.g. an mp4, gif or webm; ffmpeg selects the codec by extension.
+    :param size_px: Width and height in pixels.
+    :param workers: Number of processes rasterizing chunks of frames in parallel.  Frames are rasterized in this
+        process if None or 1.
+    :param chunk_size: Number of frames rasterized per task, when parallel.
+    :param ffmpeg: ffmpeg executable.
+    """
+
+    width, height = size_px
+    command = [ffmpeg, '-y', '-loglevel', 'error',
+               '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+               '-an', path]
+    if path.lower().endswith('.mp4'):
+        command[-1:-1] = ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p']
+
+    number_of_frames = len(frames.x1)
+    process = subprocess.Popen(command, stdin=subprocess.PIPE)
+    pipe_broken = False
+
+    try:
+        try:
+            if workers is None or workers <= 1:
+                for frame in render_frames(frames, None, size_px, dpi, colors):
+                    process.stdin.write(frame)
+            else:
+                # frames are sent once per worker; tasks are index ranges, and results one byte string per chunk
+                starts = list(range(0, number_of_frames, chunk_size))
+                stops = [min(start + chunk_size, number_of_frames) for start in starts]
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                         initargs=(frames, size_px, dpi, colors)) as executor:
+                    for chunk in executor.map(_render_chunk, starts, stops):
+                        process.stdin.write(chunk)
+        except BrokenPipeError:
+            # ffmpeg exited early; its exit code is the cause reported below
+            pipe_broken = True
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pipe_broken = True
+        return_code = process.wait()
+
+    if return_code:
+        raise RuntimeError(f'ffmpeg exited with code {return_code} while writing {path}')
+
+    if pipe_broken:
+        raise RuntimeError(f'ffmpeg stopped reading frames while writing {path}')
+
+
+# endregion
@@ -0,0 +1,308 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for exact derivatives of gear geometry, with forward-mode dual numbers over NumPy arrays.
+
+A Dual carries values and their derivatives with respect to a number of variables.  NumPy ufuncs and `np.where` apply
+the chain rule as they evaluate, so the functions of `helical_gears_batch` return values and gradients in a single
+batched pass, through chains such as working pressure angle, center distance and contact ratio::
+
+    x1, x2 = variables(0.2, np.linspace(-0.5, 0.5, 11))
+    alpha_wt = hgb.working_pressure_angle_theoretical_fcn(x1, x2, z1, z2, alpha_n, alpha_t)
+    a = hgb.center_distance_theoretical_fcn(a_ref, alpha_wt, alpha_t)
+    a.value, a.derivative[..., 0], a.derivative[..., 1]  # center distance and its partials to x1 and x2
+
+Comparisons and tests such as `np.isnan` act on values and return plain arrays, so branches select derivatives along
+with values.  The scalar functions of `helical_gears` use the math module and do not accept duals.
+"""
+
+from typing import Callable, Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class Dual:
+    """Values with derivatives, as arrays of shape (*shape) and (*shape, variables)."""
+
+    __hash__ = None
+
+    def __init__(self, value, derivative):
+        self.value = np.asarray(value, dtype=float)
+        self.derivative = np.asarray(derivative, dtype=float)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.value.ndim
+
+    @property
+    def number_of_variables(self) -> int:
+        return self.derivative.shape[-1]
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getitem__(self, index):
+        derivative = np.broadcast_to(self.derivative, self.shape + (self.number_of_variables,))
+
+        return Dual(self.value[index], derivative[index])
+
+    def __repr__(self):
+        return f'Dual(value={self.value!r}, derivative={self.derivative!r})'
+
+    # region OPERATORS
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __mod__(self, other):
+        return np.remainder(self, other)
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __eq__(self, other):
+        return np.equal(self, other)
+
+    def __ne__(self, other):
+        return np.not_equal(self, other)
+
+    def __lt__(self, other):
+        return np.less(self, other)
+
+    def __le__(self, other):
+        return np.less_equal(self, other)
+
+    def __gt__(self, other):
+        return np.greater(self, other)
+
+    def __ge__(self, other):
+        return np.greater_equal(self, other)
+
+    # endregion
+
+    # region NUMPY PROTOCOLS
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or 'out' in kwargs:
+            return NotImplemented
+
+        values = [x.value if isinstance(x, Dual) else x for x in inputs]
+
+        if ufunc in _VALUE_UFUNCS:
+            return ufunc(*values, **kwargs)
+
+        try:
+            rule = _DERIVATIVE_RULES[ufunc]
+        except KeyError:
+            raise TypeError(f'Dual does not support {ufunc.__name__}') from None
+
+        derivatives = [x.derivative if isinstance(x, Dual) else None for x in inputs]
+        value = ufunc(*values, **kwargs)
+
+        return Dual(value, rule(value, *values, *derivatives))
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.where and len(args) + len(kwargs) == 3:
+            return _where(*args, **kwargs)
+
+        return NotImplemented
+
+    # endregion
+
+
+Number = Union[Dual, np.ndarray, float]
+
+
+# region DERIVATIVE RULES
+
+def _chain(partial, derivative):
+    """Derivative contribution of one input, partial * derivative, or zero for a constant input."""
+
+    if derivative is None:
+        return 0
+
+    return np.asarray(partial)[..., np.newaxis] * derivative
+
+
+def _unary(partial_fcn: Callable) -> Callable:
+    """Rule of a function of one input, from its partial derivative as a function of the value and input."""
+
+    def rule(y, a, da):
+        return _chain(partial_fcn(y, a), da)
+
+    return rule
+
+
+def _power(y, a, b, da, db):
+    result = _chain(b * a ** (b - 1), da)
+
+    if db is not None:
+        result = result + _chain(y * np.log(a), db)
+
+    return result
+
+
+def _maximum(y, a, b, da, db):
+    a_selected = np.asarray(a >= b)[..., np.newaxis]
+
+    return np.where(a_selected, _chain(1, da), _chain(1, db))
+
+
+def _minimum(y, a, b, da, db):
+    a_selected = np.asarray(a <= b)[..., np.newaxis]
+
+    return np.where(a_selected, _chain(1, da), _chain(1, db))
+
+
+def _zero(y, *args):
+    derivatives = [d for d in args[len(args) // 2:] if d is not None]
+
+    return np.zeros(np.shape(y) + derivatives[0].shape[-1:])
+
+
+_DERIVATIVE_RULES = {
+    np.add: lambda y, a, b, da, db: _chain(1, da) + _chain(1, db),
+    np.subtract: lambda y, a, b, da, db: _chain(1, da) - _chain(1, db),
+    np.multiply: lambda y, a, b, da, db: _chain(b, da) + _chain(a, db),
+    np.true_divide: lambda y, a, b, da, db: _chain(1 / b, da) - _chain(y / b, db),
+    np.power: _power,
+    np.remainder: lambda y, a, b, da, db: _chain(1, da) - _chain(np.floor_divide(a, b), db),
+    np.hypot: lambda y, a, b, da, db: _chain(a / y, da) + _chain(b / y, db),
+    np.arctan2: lambda y, a, b, da, db: _chain(b / (a ** 2 + b ** 2), da) - _chain(a / (a ** 2 + b ** 2), db),
+    np.maximum: _maximum,
+    np.minimum: _minimum,
+    np.negative: _unary(lambda y, a: -1),
+    np.positive: _unary(lambda y, a: 1),
+    np.absolute: _unary(lambda y, a: np.sign(a)),
+    np.square: _unary(lambda y, a: 2 * a),
+    np.sqrt: _unary(lambda y, a: 1 / (2 * y)),
+    np.cbrt: _unary(lambda y, a: 1 / (3 * y ** 2)),
+    np.reciprocal: _unary(lambda y, a: -y ** 2),
+    np.exp: _unary(lambda y, a: y),
+    np.log: _unary(lambda y, a: 1 / a),
+    np.sin: _unary(lambda y, a: np.cos(a)),
+    np.cos: _unary(lambda y, a: -np.sin(a)),
+    np.tan: _unary(lambda y, a: 1 + y ** 2),
+    np.arcsin: _unary(lambda y, a: 1 / np.sqrt(1 - a ** 2)),
+    np.arccos: _unary(lambda y, a: -1 / np.sqrt(1 - a ** 2)),
+    np.arctan: _unary(lambda y, a: 1 / (1 + a ** 2)),
+    np.floor: _zero,
+    np.ceil: _zero,
+    np.trunc: _zero,
+    np.rint: _zero,
+    np.sign: _zero,
+    np.floor_divide: _zero,
+}
+
+# ufuncs evaluated on values only, returning plain arrays
+_VALUE_UFUNCS = {
+    np.equal, np.not_equal, np.less, np.less_equal, np.greater, np.greater_equal,
+    np.isnan, np.isfinite, np.isinf, np.signbit, np.logical_and, np.logical_or, np.logical_not,
+}
+
+
+def _where(condition, x, y):
+    condition = condition.value if isinstance(condition, Dual) else np.asarray(condition)
+    x_derivative = x.derivative if isinstance(x, Dual) else None
+    y_derivative = y.derivative if isinstance(y, Dual) else None
+
+    value = np.where(condition, value_of(x), value_of(y))
+    derivative = np.where(condition[..., np.newaxis], _chain(1, x_derivative), _chain(1, y_derivative))
+
+    return Dual(value, np.broadcast_to(derivative, value.shape + derivative.shape[-1:]))
+
+
+# endregion
+
+
+# region VARIABLES
+
+def variables(*values) -> Tuple[Dual, ...]:
+    """Independent variables, each with a unit derivative with respect to itself.
+
+    Values broadcast against each other, so that every variable varies over the same designs.
+    """
+
+    arrays = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in values])
+    identity = np.eye(len(arrays))
+
+    return tuple(Dual(a, np.broadcast_to(identity[i], a.shape + (len(arrays),))) for i, a in enumerate(arrays))
+
+
+def value_of(x) -> np.ndarray:
+    """Values of a dual, or the array itself."""
+
+    return x.value if isinstance(x, Dual) else np.asarray(x, dtype=float)
+
+
+def gradient_of(x, number_of_variables: int) -> np.ndarray:
+    """Derivatives of a dual, or zeros for a constant, with shape (*shape, variables)."""
+
+    if isinstance(x, Dual):
+        return np.broadcast_to(x.derivative, x.shape + (number_of_variables,))
+
+    return np.zeros(np.shape(x) + (number_of_variables,))
+
+
+def value_and_gradient(fcn: Callable, wrt: Sequence[str], **inputs) -> Tuple[Number, Dict[str, np.ndarray]]:
+    """Value of a batched function and its partial derivatives with respect to the named inputs.
+
+    :param fcn: Function of NumPy arrays, e.g. from helical_gears_batch, called with the inputs as keyword arguments.
+    :param wrt: Names of the inputs to differentiate with respect to.
+    :return: Value, and partial derivatives by input name.  For functions returning a tuple, tuples of both.
+    """
+
+    for name, dual in zip(wrt, variables(*[inputs[name] for name in wrt])):
+        inputs[name] = dual
+
+    result = fcn(**inputs)
+
+    def split(x):
+        gradient = gradient_of(x, len(wrt))
+        return value_of(x), {name: gradient[..., i] for i, name in enumerate(wrt)}
+
+    if isinstance(result, tuple):
+        values, gradients = zip(*[split(x) for x in result])
+        return values, gradients
+
+    return split(result)
+
+
+# endregion
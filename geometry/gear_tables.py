@@ -0,0 +1,227 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for precomputed geometry tables of standard gear families.
+
+Tables are stored per unit normal module, since every length in a family scales linearly with module.  Each quantity
+is one column file of shape (families, teeth, profile shifts), memory-mapped when loaded.
+"""
+
+import json
+import os
+from math import radians
+from typing import Dict, Iterable, NamedTuple, Sequence
+
+import numpy as np
+
+try:
+    import helical_gears as hg  # notebooks, run from geometry/
+except ImportError:
+    from geometry import helical_gears as hg  # batch tools, run from the repository root
+
+
+FORMAT_VERSION = 1
+METADATA_FILENAME = 'tables.json'
+
+NUMBER_OF_TEETH_RANGE = (6, 300)
+PROFILE_SHIFT_COEFFICIENTS = np.round(np.linspace(-1, 1.5, 51), 6)
+
+COLUMNS = (
+    'base_diameter',
+    'tip_diameter',
+    'root_diameter',
+    'minimum_profile_shift_coefficient',
+    'tooth_thickness_transverse',
+)
+UNITLESS_COLUMNS = ('minimum_profile_shift_coefficient',)
+
+
+class GearFamily(NamedTuple):
+    """Standard gear family; the module is applied at lookup."""
+
+    pressure_angle_normal_deg: float
+    helix_angle_deg: float = 0
+    basic_rack_addendum_coefficient: float = 1
+    basic_rack_dedendum_coefficient: float = 1.25
+
+
+STANDARD_FAMILIES = (
+    GearFamily(20, 0, 1, 1.25),
+    GearFamily(20, 0, 1, 1.4),
+    GearFamily(25, 0, 1, 1.25),
+    GearFamily(25, 0, 1, 1.4),
+)
+
+
+# region BUILD
+
+def family_table(family: GearFamily, number_of_teeth: np.ndarray,
+                 profile_shift_coefficients: np.ndarray) -> Dict[str, np.ndarray]:
+    """Compute all table columns of a gear family for unit normal module.
+
+    Columns have shape (len(number_of_teeth), len(profile_shift_coefficients)).
+    """
+
+    module_normal = 1
+    pressure_angle_normal = radians(family.pressure_angle_normal_deg)
+    helix_angle = radians(family.helix_angle_deg)
+
+    z = np.asarray(number_of_teeth, dtype=float)[:, np.newaxis]
+    x = np.asarray(profile_shift_coefficients, dtype=float)[np.newaxis, :]
+
+    module_transverse = hg.module_transverse_fcn(module_normal, helix_angle)
+    pressure_angle_transverse = hg.pressure_angle_transverse_fcn(pressure_angle_normal, helix_angle)
+    theoretical_pitch_diameter = hg.theoretical_pitch_diameter_fcn(module_transverse, z)
+
+    addendum = family.basic_rack_addendum_coefficient * module_normal
+    dedendum = family.basic_rack_dedendum_coefficient * module_normal
+    profile_shift = x * module_normal
+
+    columns = {
+        'base_diameter': hg.base_diameter_fcn(theoretical_pitch_diameter, pressure_angle_transverse),
+        'tip_diameter': hg.tip_diameter_fcn(theoretical_pitch_diameter, addendum, profile_shift),
+        'root_diameter': hg.root_diameter_fcn(theoretical_pitch_diameter, dedendum, profile_shift),
+        'minimum_profile_shift_coefficient': hg.minimum_profile_shift_coefficient_to_avoid_undercut(
+            family.basic_rack_addendum_coefficient, pressure_angle_normal, z, helix_angle),
+        'tooth_thickness_transverse': hg.tooth_thickness_transverse_fcn(
+            module_normal, pressure_angle_normal, helix_angle, x),
+    }
+
+    shape = (z.size, x.size)
+
+    return {name: np.broadcast_to(value, shape) for name, value in columns.items()}
+
+
+def write_tables(path: str, families: Sequence[GearFamily] = STANDARD_FAMILIES,
+                 number_of_teeth_range: Sequence[int] = NUMBER_OF_TEETH_RANGE,
+                 profile_shift_coefficients: Iterable[float] = PROFILE_SHIFT_COEFFICIENTS,
+                 dtype=np.float32) -> None:
+    """Precompute the tables of the specified gear families and write them to a directory.
+
+    :param path: Output directory, created if missing.
+    :param families: Gear families to tabulate.
+    :param number_of_teeth_range: Inclusive (min, max) number of teeth.
+    :param profile_shift_coefficients: Ascending grid of profile shift coefficients.
+    :param dtype: Storage dtype of every column.
+    :return: None
+    """
+
+    z_min, z_max = number_of_teeth_range
+    number_of_teeth = np.arange(z_min, z_max + 1)
+    x_grid = np.asarray(list(profile_shift_coefficients), dtype=float)
+
+    if x_grid.size < 2 or np.any(np.diff(x_grid) <= 0):
+        raise ValueError('Profile shift coefficients must be a strictly ascending grid of two or more values.')
+
+    os.makedirs(path, exist_ok=True)
+
+    tables = [family_table(family, number_of_teeth, x_grid) for family in families]
+
+    for name in COLUMNS:
+        column = np.stack([table[name] for table in tables]).astype(dtype)
+        np.save(os.path.join(path, f'{name}.npy'), column)
+
+    metadata = {
+        'format_version': FORMAT_VERSION,
+        'families': [family._asdict() for family in families],
+        'number_of_teeth_range': [int(z_min), int(z_max)],
+        'profile_shift_coefficients': x_grid.tolist(),
+        'columns': list(COLUMNS),
+    }
+
+    with open(os.path.join(path, METADATA_FILENAME), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+
+# endregion
+
+
+# region LOOKUP
+
+class GearTables:
+    """Memory-mapped gear family tables with linear interpolation between profile shift grid points.
+
+    Tabulated quantities are linear in profile shift, so interpolation is exact up to storage precision.
+    """
+
+    def __init__(self, path: str):
+        with open(os.path.join(path, METADATA_FILENAME)) as f:
+            metadata = json.load(f)
+
+        if metadata['format_version'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported table format version: {metadata['format_version']}")
+
+        self.path = path
+        self.families = [GearFamily(**family) for family in metadata['families']]
+        self.number_of_teeth_range = tuple(metadata['number_of_teeth_range'])
+        self.profile_shift_coefficients = np.asarray(metadata['profile_shift_coefficients'])
+        self.columns = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r')
+                        for name in metadata['columns']}
+
+    def family_index(self, family: GearFamily) -> int:
+        try:
+            return self.families.index(GearFamily(*family))
+        except ValueError:
+            raise ValueError(f'Gear family is not tabulated: {family}') from None
+
+    def _grid_indices(self, number_of_teeth, profile_shift_coefficient):
+        z_min, z_max = self.number_of_teeth_range
+        z = np.asarray(number_of_teeth)
+        x = np.asarray(profile_shift_coefficient, dtype=float)
+        x_grid = self.profile_shift_coefficients
+
+        if np.any(z != np.round(z)) or np.any(z < z_min) or np.any(z > z_max):
+            raise ValueError(f'Number of teeth must be integers from {z_min} to {z_max}.')
+
+        if np.any(x < x_grid[0]) or np.any(x > x_grid[-1]):
+            raise ValueError(f'Profile shift coefficient must be within [{x_grid[0]}, {x_grid[-1]}].')
+
+        i_z = z.astype(int) - z_min
+        i_x = np.clip(np.searchsorted(x_grid, x, side='right') - 1, 0, x_grid.size - 2)
+        weight = (x - x_grid[i_x]) / (x_grid[i_x + 1] - x_grid[i_x])
+
+        return i_z, i_x, weight
+
+    def lookup(self, name: str, family: GearFamily, number_of_teeth, profile_shift_coefficient,
+               module_normal=1) -> np.ndarray:
+        """Interpolated value of a table column.  Array arguments are broadcast against each other."""
+
+        i_family = self.family_index(family)
+        column = self.columns[name]
+
+        z, x, m_n = np.broadcast_arrays(number_of_teeth, profile_shift_coefficient, module_normal)
+        i_z, i_x, weight = self._grid_indices(z, x)
+
+        lower = column[i_family, i_z, i_x].astype(float)
+        upper = column[i_family, i_z, i_x + 1].astype(float)
+        value = lower + weight * (upper - lower)
+
+        if name in UNITLESS_COLUMNS:
+            return value
+
+        return value * m_n
+
+    def query(self, family: GearFamily, number_of_teeth, profile_shift_coefficient,
+              module_normal=1) -> Dict[str, np.ndarray]:
+        """Interpolated values of all table columns."""
+
+        return {name: self.lookup(name, family, number_of_teeth, profile_shift_coefficient, module_normal)
+                for name in self.columns}
+
+
+def load_tables(path: str) -> GearTables:
+    return GearTables(path)
+
+
+# endregion
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Precompute geometry tables of standard gear families.')
+    parser.add_argument('path', help='output directory')
+    parser.add_argument('--float64', action='store_true', help='store columns as float64 instead of float32')
+    args = parser.parse_args()
+
+    write_tables(args.path, dtype=np.float64 if args.float64 else np.float32)
@@ -5,6 +5,7 @@
 
 import random
 from math import degrees
+import numpy as np
 from IPython.display import display, HTML
 
 
@@ -54,6 +55,20 @@ def round_degrees(rad) -> int:
         return int(round(degrees(rad), 0))
 
 
+def table_html(headings, rows) -> str:
+    """HTML string of a table, built in a single join.
+
+    :param headings: List of heading strings.  Can include MathJax notation.
+    :param rows: Iterable of rows, each an iterable of cell values.
+    :return: HTML string.
+    """
+
+    header = ''.join(f'<th>{h}</th>' for h in headings)
+    body = ''.join('<tr>' + ''.join(f'<td>{c}</td>' for c in row) + '</tr>' for row in rows)
+
+    return f'<table style="margin-left: 0"><tr>{header}</tr>{body}</table>'
+
+
 def html_table(headings, rows):
     """Display an HTML table in a Jupyter notebook.
 
@@ -62,21 +77,172 @@ def html_table(headings, rows):
     :return: None
     """
 
-    html_str = '<table style="margin-left: 0">'
+    display(HTML(table_html(headings, rows)))
+
+
+def _column_array(values) -> np.ndarray:
+    """1-D array of column values, with cells such as lists kept as objects."""
+
+    array = np.asarray(values)
+
+    if array.ndim != 1:
+        array = np.empty(len(values), dtype=object)
+        array[:] = list(values)
+
+    return array
+
+
+class TablePager:
+    """Paged view of a large table that renders only the visible rows, with sorting and filtering done in NumPy.
+
+    Accepts a pandas DataFrame, a NumPy structured array, a dict of columns, or a list of rows with headings.
+    """
+
+    def __init__(self, data, headings=None, page_size=25, float_format='{:.6g}'):
+        if hasattr(data, 'columns') and hasattr(data, 'to_numpy'):
+            names = [str(name) for name in data.columns]
+            columns = [data[name].to_numpy() for name in data.columns]
+        elif getattr(getattr(data, 'dtype', None), 'names', None):
+            names = list(data.dtype.names)
+            columns = [data[name] for name in names]
+        elif isinstance(data, dict):
+            names = [str(name) for name in data]
+            columns = list(data.values())
+        else:
+            rows = list(data)
+            names = list(headings)
+            columns = [[row[j] for row in rows] for j in range(len(names))]
+
+        self.names = names
+        self.headings = names if headings is None else list(headings)
+        self.columns = {name: _column_array(column) for name, column in zip(names, columns)}
+        self.page_size = page_size
+        self.float_format = float_format
+
+        self.sort_by = None
+        self.ascending = True
+        self.expression = None
+        self._index = np.arange(len(columns[0]) if columns else 0)
+
+    def filter(self, expression=None):
+        """Keep rows where the expression is true, then re-apply the sort.
+
+        :param expression: Boolean expression of column names, e.g. 'z1 >= 20', evaluated with NumPy elementwise
+            operators ('&', '|', '~'); or a function of the dict of columns returning a boolean mask; or None for all
+            rows.
+        :return: self
+        """
+
+        size = len(next(iter(self.columns.values()))) if self.columns else 0
+
+        if expression is None or expression == '':
+            mask = np.ones(size, dtype=bool)
+        elif callable(expression):
+            mask = np.asarray(expression(self.columns), dtype=bool)
+        else:
+            mask = np.asarray(eval(expression, {'__builtins__': {}, 'np': np}, dict(self.columns)), dtype=bool)
+
+        self.expression = expression
+        self._index = np.flatnonzero(np.broadcast_to(mask, size))
+
+        return self.sort(self.sort_by, self.ascending)
+
+    def sort(self, by=None, ascending=True):
+        """Order the rows by a column, or in original order if None.  Ties keep their original order.
+
+        :return: self
+        """
+
+        self._index = np.sort(self._index)
+
+        if by is not None:
+            values = self.columns[by][self._index]
+            if ascending:
+                order = np.argsort(values, kind='stable')
+            else:
+                # stable sort of the reversed values, so that ties keep their original order
+                order = len(values) - 1 - np.argsort(values[::-1], kind='stable')[::-1]
+            self._index = self._index[order]
+
+        self.sort_by = by
+        self.ascending = ascending
+
+        return self
+
+    @property
+    def number_of_rows(self) -> int:
+        return len(self._index)
+
+    @property
+    def number_of_pages(self) -> int:
+        return max(1, -(-self.number_of_rows // self.page_size))
+
+    def page_rows(self, page=0):
+        """Rows of a page, zero-based, after filtering and sorting."""
+
+        index = self._index[page * self.page_size:(page + 1) * self.page_size]
+
+        return zip(*[self._format(self.columns[name][index]) for name in self.names])
+
+    def _format(self, values):
+        if values.dtype.kind == 'f':
+            return [self.float_format.format(value) for value in values.tolist()]
+
+        return values.tolist()
+
+    def page_html(self, page=0) -> str:
+        return table_html(self.headings, self.page_rows(page))
+
+    def widget(self):
+        """Interactive pager with sort and filter controls.  Only the rows of the current page are sent to the browser.
+
+        :return: ipywidgets box.
+        """
+
+        import ipywidgets as widgets
+
+        state = {'page': 0}
+
+        table = widgets.HTML()
+        status = widgets.Label()
+        previous_button = widgets.Button(description='<', layout=widgets.Layout(width='40px'))
+        next_button = widgets.Button(description='>', layout=widgets.Layout(width='40px'))
+        sort_by = widgets.Dropdown(options=[('', None)] + [(h, n) for h, n in zip(self.headings, self.names)],
+                                   description='Sort by')
+        descending = widgets.Checkbox(value=False, description='Descending')
+        expression = widgets.Text(placeholder='e.g. (z1 >= 20) & (ratio < 3)', description='Filter',
+                                  continuous_update=False)
+
+        def render():
+            state['page'] = min(state['page'], self.number_of_pages - 1)
+            table.value = self.page_html(state['page'])
+            status.value = f"Page {state['page'] + 1} of {self.number_of_pages}, {self.number_of_rows} rows"
 
-    html_str += '<tr>'
+        def on_page(step):
+            state['page'] = max(0, state['page'] + step)
+            render()
 
-    for h in headings:
-        html_str += f'<th>{h}</th>'
+        def on_sort(change):
+            self.sort(sort_by.value, not descending.value)
+            state['page'] = 0
+            render()
 
-    html_str += '</tr>'
+        def on_filter(change):
+            try:
+                self.filter(expression.value)
+            except Exception as e:
+                status.value = f'Invalid filter: {e}'
+                return
+            state['page'] = 0
+            render()
 
-    for row in rows:
-        html_str += '<tr>'
-        for c in row:
-            html_str += f'<td>{c}</td>'
+        previous_button.on_click(lambda button: on_page(-1))
+        next_button.on_click(lambda button: on_page(1))
+        sort_by.observe(on_sort, names='value')
+        descending.observe(on_sort, names='value')
+        expression.observe(on_filter, names='value')
 
-        html_str += '</tr>'
+        render()
 
-    html_str += '</table>'
-    display(HTML(html_str))
+        controls = widgets.HBox([previous_button, next_button, status])
+        return widgets.VBox([widgets.HBox([sort_by, descending, expression]), controls, table])
@@ -0,0 +1,460 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for constrained optimization of helical gear pairs with branch-and-bound pruning.
+
+The design space is branched on pressure angle, helix angle and tooth counts.  Each branch is bounded with cheap
+analytic checks before its profile shift grid is evaluated:
+
+1. Per gear, profile shifts that undercut or exceed the tip thickness limit are removed.
+2. Per gear pair, the zero-backlash center distance increases with the sum of profile shifts, which bounds the
+   backlash reachable at the actual center distance.
+3. Per gear pair, the objective bound, if any, is compared with the incumbent designs.
+"""
+
+import heapq
+from math import inf, radians
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import helical_gears_batch as hgb  # notebooks, run from geometry/
+except ImportError:
+    from geometry import helical_gears_batch as hgb  # batch tools, run from the repository root
+
+
+class DesignSpace(NamedTuple):
+    """Candidate design space of a helical gear pair at a fixed center distance and normal module."""
+
+    module_normal: float
+    center_distance: float
+    gear_ratio_target: float
+    gear_ratio_delta: float
+    number_of_teeth1_range: Tuple[int, int]
+    helix_angles_deg: Sequence[float] = (0,)
+    pressure_angles_normal_deg: Sequence[float] = (20,)
+    profile_shift_coefficients: Sequence[float] = tuple(np.round(np.arange(-0.5, 1.0001, 0.05), 3))
+    facewidth: float = 10
+    basic_rack_addendum_coefficient: float = 1
+    basic_rack_dedendum_coefficient: float = 1.25
+
+
+class Constraints(NamedTuple):
+    backlash_radial_min: float = 0
+    backlash_radial_max: float = inf
+    tip_thickness_coefficient_min: float = 0.25
+    tip_clearance_coefficient_min: float = 0.25
+    allow_undercut: bool = False
+
+
+class Objective(NamedTuple):
+    """Design objective.
+
+    The bound function receives the arrays of all branches and returns, per branch, a value that no design in the
+    branch can improve upon; an upper bound when maximizing and a lower bound when minimizing.
+    """
+
+    name: str
+    evaluate: Callable[[Dict[str, np.ndarray]], np.ndarray]
+    maximize: bool = True
+    bound: Optional[Callable[[Dict[str, np.ndarray]], np.ndarray]] = None
+
+
+class OptimizationResult(NamedTuple):
+    designs: List[Dict[str, float]]
+    branches: int
+    branches_pruned_infeasible: int
+    branches_pruned_bound: int
+    designs_total: int
+    designs_evaluated: int
+
+
+# region EVALUATION
+
+def evaluate_designs(space: DesignSpace, pressure_angle_normal, helix_angle,
+                     number_of_teeth1, number_of_teeth2,
+                     profile_shift_coefficient1, profile_shift_coefficient2) -> Dict[str, np.ndarray]:
+    """Evaluate arrays of gear pair designs.  Arguments are broadcast; angles in radians.
+
+    The returned 'feasible' array includes all geometric checks, but not the constraints.
+    """
+
+    m_n = space.module_normal
+    a = space.center_distance
+    alpha_n = pressure_angle_normal
+    beta = helix_angle
+    z1 = number_of_teeth1
+    z2 = number_of_teeth2
+    x1 = profile_shift_coefficient1
+    x2 = profile_shift_coefficient2
+    h_a = space.basic_rack_addendum_coefficient * m_n
+    h_f = space.basic_rack_dedendum_coefficient * m_n
+
+    # gear parameters
+    module_transverse = hgb.module_transverse_fcn(m_n, beta)
+    pressure_angle_transverse = hgb.pressure_angle_transverse_fcn(alpha_n, beta)
+    theoretical_pitch_diameter1 = hgb.theoretical_pitch_diameter_fcn(module_transverse, z1)
+    theoretical_pitch_diameter2 = hgb.theoretical_pitch_diameter_fcn(module_transverse, z2)
+    base_diameter1 = hgb.base_diameter_fcn(theoretical_pitch_diameter1, pressure_angle_transverse)
+    base_diameter2 = hgb.base_diameter_fcn(theoretical_pitch_diameter2, pressure_angle_transverse)
+    tip_diameter1 = hgb.tip_diameter_fcn(theoretical_pitch_diameter1, h_a, x1 * m_n)
+    tip_diameter2 = hgb.tip_diameter_fcn(theoretical_pitch_diameter2, h_a, x2 * m_n)
+    root_diameter1 = hgb.root_diameter_fcn(theoretical_pitch_diameter1, h_f, x1 * m_n)
+    root_diameter2 = hgb.root_diameter_fcn(theoretical_pitch_diameter2, h_f, x2 * m_n)
+
+    with np.errstate(invalid='ignore'):
+        # pressure angles and center distances
+        working_pressure_angle = hgb.working_pressure_angle_fcn(a, base_diameter1, base_diameter2)
+        working_pressure_angle_theoretical = hgb.working_pressure_angle_theoretical_fcn(
+            x1, x2, z1, z2, alpha_n, pressure_angle_transverse)
+        center_distance_reference = hgb.center_distance_reference_fcn(m_n, z1, z2, beta)
+        center_distance_theoretical = hgb.center_distance_theoretical_fcn(
+            center_distance_reference, working_pressure_angle_theoretical, pressure_angle_transverse)
+
+        # SAP & EAP
+        pressure_angle_transverse_eap1 = hgb.pressure_angle_transverse_arbitrary_fcn(base_diameter1, tip_diameter1)
+        pressure_angle_transverse_eap2 = hgb.pressure_angle_transverse_arbitrary_fcn(base_diameter2, tip_diameter2)
+        pressure_angle_transverse_sap1 = hgb.pressure_angle_transverse_contact_fcn(
+            working_pressure_angle, z1, z2, pressure_angle_transverse_eap2)
+        pressure_angle_transverse_sap2 = hgb.pressure_angle_transverse_contact_fcn(
+            working_pressure_angle, z2, z1, pressure_angle_transverse_eap1)
+
+        # tooth tips
+        tooth_thickness_transverse_tip1 = hgb.tooth_thickness_transverse_arbitrary_fcn(
+            tip_diameter1, m_n, alpha_n, z1, beta, x1)
+        tooth_thickness_transverse_tip2 = hgb.tooth_thickness_transverse_arbitrary_fcn(
+            tip_diameter2, m_n, alpha_n, z2, beta, x2)
+
+        # contact
+        contact_ratio_transverse = hgb.contact_ratio_transverse_fcn(
+            working_pressure_angle, z1, z2, pressure_angle_transverse_eap1, pressure_angle_transverse_eap2)
+        contact_ratio_axial = hgb.contact_ratio_axial_fcn(space.facewidth, beta, m_n)
+
+        # kinematics, for unit angular velocity of gear 1
+        angular_velocity1 = 1
+        angular_velocity2 = z1 / z2
+        specific_sliding_sap1, _ = hgb.specific_sliding_fcn(
+            base_diameter1, base_diameter2, pressure_angle_transverse_sap1, pressure_angle_transverse_eap2,
+            angular_velocity1, angular_velocity2)
+        _, specific_sliding_sap2 = hgb.specific_sliding_fcn(
+            base_diameter1, base_diameter2, pressure_angle_transverse_eap1, pressure_angle_transverse_sap2,
+            angular_velocity1, angular_velocity2)
+
+        # SAP must be above the base circle; NaN results are infeasible
+        feasible = (pressure_angle_transverse_sap1 > 0) & (pressure_angle_transverse_sap2 > 0) & \
+            np.isfinite(center_distance_theoretical) & np.isfinite(working_pressure_angle)
+
+    designs = {
+        'number_of_teeth1': z1,
+        'number_of_teeth2': z2,
+        'gear_ratio': hgb.transmission_ratio_fcn(z1, z2),
+        'helix_angle_deg': np.degrees(beta),
+        'pressure_angle_normal_deg': np.degrees(alpha_n),
+        'profile_shift_coefficient1': x1,
+        'profile_shift_coefficient2': x2,
+        'working_pressure_angle_deg': np.degrees(working_pressure_angle),
+        'center_distance_theoretical': center_distance_theoretical,
+        'backlash_radial': hgb.backlash_radial_fcn(a, center_distance_theoretical),
+        'tip_clearance1': hgb.tip_clearance_fcn(a, tip_diameter1, root_diameter2),
+        'tip_clearance2': hgb.tip_clearance_fcn(a, tip_diameter2, root_diameter1),
+        'tip_thickness_coefficient1': hgb.tooth_thickness_normal_fcn(tooth_thickness_transverse_tip1, beta) / m_n,
+        'tip_thickness_coefficient2': hgb.tooth_thickness_normal_fcn(tooth_thickness_transverse_tip2, beta) / m_n,
+        'contact_ratio_transverse': contact_ratio_transverse,
+        'contact_ratio_axial': contact_ratio_axial,
+        'contact_ratio_total': hgb.contact_ratio_total_fcn(contact_ratio_transverse, contact_ratio_axial),
+        'specific_sliding_sap1': specific_sliding_sap1,
+        'specific_sliding_sap2': specific_sliding_sap2,
+        'feasible': feasible,
+    }
+
+    return {key: np.broadcast_to(value, np.shape(feasible)) for key, value in designs.items()}
+
+
+def satisfies_constraints(designs: Dict[str, np.ndarray], space: DesignSpace, constraints: Constraints) -> np.ndarray:
+    m_n = space.module_normal
+    clearance_min = constraints.tip_clearance_coefficient_min * m_n
+
+    with np.errstate(invalid='ignore'):
+        return designs['feasible'] & \
+            (designs['backlash_radial'] >= constraints.backlash_radial_min) & \
+            (designs['backlash_radial'] <= constraints.backlash_radial_max) & \
+            (designs['tip_clearance1'] >= clearance_min) & \
+            (designs['tip_clearance2'] >= clearance_min) & \
+            (designs['tip_thickness_coefficient1'] >= constraints.tip_thickness_coefficient_min) & \
+            (designs['tip_thickness_coefficient2'] >= constraints.tip_thickness_coefficient_min)
+
+
+# endregion
+
+
+# region OBJECTIVES
+
+def contact_ratio_bound(branches: Dict[str, np.ndarray]) -> np.ndarray:
+    """Upper bound of total contact ratio of a branch.
+
+    The actual working pressure angle does not depend on profile shift, and the transverse contact ratio increases
+    with tip diameter, so the bound is evaluated at the largest feasible profile shift of each gear.
+    """
+
+    return branches['contact_ratio_total_at_max_profile_shift']
+
+
+CONTACT_RATIO = Objective('contact_ratio_total', lambda designs: designs['contact_ratio_total'], True,
+                          contact_ratio_bound)
+
+def _absolute_range(lower_end, upper_end):
+    """Range of the absolute value of a monotonic function, from its values at both ends of an interval."""
+
+    low = np.where(np.sign(lower_end) != np.sign(upper_end), 0, np.minimum(np.abs(lower_end), np.abs(upper_end)))
+
+    return low, np.maximum(np.abs(lower_end), np.abs(upper_end))
+
+
+def sliding_balance_bound(branches: Dict[str, np.ndarray]) -> np.ndarray:
+    """Lower bound of the specific sliding balance of a branch.
+
+    Specific sliding of gear 1 at its SAP depends only on the tip diameter of gear 2, decreasing monotonically with
+    its profile shift, and likewise for gear 2.  The ranges of both absolute values over the branch therefore follow
+    from the smallest and largest feasible profile shifts, and bound their difference.  Where the designs at these
+    profile shifts are infeasible, the bound is zero.
+    """
+
+    low1, high1 = _absolute_range(branches['specific_sliding_sap1_at_min_profile_shift'],
+                                  branches['specific_sliding_sap1_at_max_profile_shift'])
+    low2, high2 = _absolute_range(branches['specific_sliding_sap2_at_min_profile_shift'],
+                                  branches['specific_sliding_sap2_at_max_profile_shift'])
+    bound = np.maximum(0, np.maximum(low1 - high2, low2 - high1))
+
+    return np.where(branches['feasible_at_profile_shift_limits'], bound, 0)
+
+
+SLIDING_BALANCE = Objective(
+    'specific_sliding_balance',
+    lambda designs: np.abs(np.abs(designs['specific_sliding_sap1']) - np.abs(designs['specific_sliding_sap2'])),
+    False,
+    sliding_balance_bound,
+)
+
+
+# endregion
+
+
+# region BRANCH AND BOUND
+
+def _branches(space: DesignSpace) -> Dict[str, np.ndarray]:
+    """All branches of pressure angle, helix angle and tooth counts within the gear ratio band."""
+
+    ratio_lower = space.gear_ratio_target * (1 - space.gear_ratio_delta)
+    ratio_upper = space.gear_ratio_target * (1 + space.gear_ratio_delta)
+    z1_min, z1_max = space.number_of_teeth1_range
+
+    rows = []
+    for alpha_n_deg in space.pressure_angles_normal_deg:
+        for beta_deg in space.helix_angles_deg:
+            for z1 in range(z1_min, z1_max + 1):
+                for z2 in range(int(np.ceil(z1 * ratio_lower)), int(np.floor(z1 * ratio_upper)) + 1):
+                    rows.append((radians(alpha_n_deg), radians(beta_deg), z1, z2))
+
+    columns = np.array(rows, dtype=float).reshape(-1, 4).T
+
+    return {
+        'pressure_angle_normal': columns[0],
+        'helix_angle': columns[1],
+        'number_of_teeth1': columns[2],
+        'number_of_teeth2': columns[3],
+    }
+
+
+def _profile_shift_masks(space: DesignSpace, constraints: Constraints, pressure_angle_normal, helix_angle,
+                         number_of_teeth) -> np.ndarray:
+    """Profile shift grid values allowed for each gear, by undercut and tip thickness; shape (gears, grid)."""
+
+    m_n = space.module_normal
+    x = np.asarray(space.profile_shift_coefficients, dtype=float)[np.newaxis, :]
+    alpha_n = pressure_angle_normal[:, np.newaxis]
+    beta = helix_angle[:, np.newaxis]
+    z = number_of_teeth[:, np.newaxis]
+
+    d = hgb.theoretical_pitch_diameter_fcn(hgb.module_transverse_fcn(m_n, beta), z)
+    tip_diameter = hgb.tip_diameter_fcn(d, space.basic_rack_addendum_coefficient * m_n, x * m_n)
+
+    with np.errstate(invalid='ignore'):
+        tip_thickness = hgb.tooth_thickness_transverse_arbitrary_fcn(tip_diameter, m_n, alpha_n, z, beta, x)
+        mask = hgb.tooth_thickness_normal_fcn(tip_thickness, beta) / m_n >= constraints.tip_thickness_coefficient_min
+
+    if not constraints.allow_undercut:
+        x_min = hgb.minimum_profile_shift_coefficient_to_avoid_undercut(
+            space.basic_rack_addendum_coefficient, alpha_n, z, beta)
+        mask &= x >= x_min
+
+    return mask
+
+
+def _bound_branches(space: DesignSpace, constraints: Constraints, branches: Dict[str, np.ndarray]):
+    """Vectorized feasibility bounds of all branches, with the profile shift masks of both gears."""
+
+    x_grid = np.asarray(space.profile_shift_coefficients, dtype=float)
+    alpha_n = branches['pressure_angle_normal']
+    beta = branches['helix_angle']
+    z1 = branches['number_of_teeth1']
+    z2 = branches['number_of_teeth2']
+
+    mask1 = _profile_shift_masks(space, constraints, alpha_n, beta, z1)
+    mask2 = _profile_shift_masks(space, constraints, alpha_n, beta, z2)
+    has_x = mask1.any(axis=1) & mask2.any(axis=1)
+
+    # branches without allowed profile shifts are evaluated at zero, then discarded
+    x_lo1 = np.where(has_x, np.where(mask1, x_grid, inf).min(axis=1), 0)
+    x_lo2 = np.where(has_x, np.where(mask2, x_grid, inf).min(axis=1), 0)
+    x_hi1 = np.where(has_x, np.where(mask1, x_grid, -inf).max(axis=1), 0)
+    x_hi2 = np.where(has_x, np.where(mask2, x_grid, -inf).max(axis=1), 0)
+
+    with np.errstate(invalid='ignore'):
+        # zero-backlash center distance increases with the sum of profile shifts
+        lowest = evaluate_designs(space, alpha_n, beta, z1, z2, x_lo1, x_lo2)
+        highest = evaluate_designs(space, alpha_n, beta, z1, z2, x_hi1, x_hi2)
+
+        # where the lowest sum has no valid working pressure angle, valid sums reach a working pressure angle of
+        # zero at most, where the zero-backlash center distance is a_ref * cos(alpha_t)
+        center_distance_reference = hgb.center_distance_reference_fcn(space.module_normal, z1, z2, beta)
+        backlash_limit = space.center_distance - \
+            center_distance_reference * np.cos(hgb.pressure_angle_transverse_fcn(alpha_n, beta))
+        backlash_max = np.where(np.isnan(lowest['backlash_radial']), backlash_limit, lowest['backlash_radial'])
+        backlash_min = np.where(np.isnan(highest['backlash_radial']), -inf, highest['backlash_radial'])
+
+        feasible = has_x & np.isfinite(highest['working_pressure_angle_deg']) & \
+            (backlash_max >= constraints.backlash_radial_min) & \
+            (backlash_min <= constraints.backlash_radial_max)
+
+    branches = dict(
+        branches,
+        contact_ratio_total_at_max_profile_shift=highest['contact_ratio_total'],
+        specific_sliding_sap1_at_min_profile_shift=lowest['specific_sliding_sap1'],
+        specific_sliding_sap1_at_max_profile_shift=highest['specific_sliding_sap1'],
+        specific_sliding_sap2_at_min_profile_shift=lowest['specific_sliding_sap2'],
+        specific_sliding_sap2_at_max_profile_shift=highest['specific_sliding_sap2'],
+        feasible_at_profile_shift_limits=lowest['feasible'] & highest['feasible'],
+    )
+
+    return feasible, mask1, mask2, branches
+
+
+def _evaluate_branch(space: DesignSpace, constraints: Constraints, objective: Objective,
+                     branches: Dict[str, np.ndarray], mask1, mask2, i) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Designs of the allowed profile shift grid of branch i, with flattened scores; -inf where not valid."""
+
+    x_grid = np.asarray(space.profile_shift_coefficients, dtype=float)
+    x1 = x_grid[mask1][:, np.newaxis]
+    x2 = x_grid[mask2][np.newaxis, :]
+
+    designs = evaluate_designs(space, branches['pressure_angle_normal'][i], branches['helix_angle'][i],
+                               branches['number_of_teeth1'][i], branches['number_of_teeth2'][i], x1, x2)
+
+    # scores are maximized; minimization objectives are negated
+    sign = 1 if objective.maximize else -1
+    valid = satisfies_constraints(designs, space, constraints)
+    scores = sign * objective.evaluate(designs)
+
+    return designs, np.where(valid & ~np.isnan(scores), scores, -inf).ravel()
+
+
+def optimize(space: DesignSpace, constraints: Constraints = Constraints(), objective: Objective = CONTACT_RATIO,
+             number_of_designs: int = 10) -> OptimizationResult:
+    """Find the best gear pair designs of a design space, subject to constraints.
+
+    :param space: Design space to search.
+    :param constraints: Design constraints.
+    :param objective: Objective to maximize or minimize.
+    :param number_of_designs: Number of best designs to return.
+    :return: Best designs, in order, with pruning statistics.
+    """
+
+    x_grid = np.asarray(space.profile_shift_coefficients, dtype=float)
+    branches = _branches(space)
+    n_branches = branches['number_of_teeth1'].size
+
+    feasible, mask1, mask2, branches = _bound_branches(space, constraints, branches)
+
+    # scores are maximized; minimization objectives are negated
+    sign = 1 if objective.maximize else -1
+    bounds = np.full(n_branches, inf) if objective.bound is None else sign * objective.bound(branches)
+    bounds = np.where(np.isnan(bounds), inf, bounds)
+
+    # best-first: promising branches raise the incumbent early, so that more branches are pruned
+    order = [i for i in np.argsort(-bounds, kind='stable') if feasible[i]]
+
+    incumbents = []  # min-heap of (score, tie-breaker, design)
+    pruned_bound = 0
+    designs_evaluated = 0
+
+    for i in order:
+        if len(incumbents) == number_of_designs and bounds[i] <= incumbents[0][0]:
+            pruned_bound += 1
+            continue
+
+        designs, scores = _evaluate_branch(space, constraints, objective, branches, mask1[i], mask2[i], i)
+        designs_evaluated += designs['feasible'].size
+
+        for j in np.argsort(-scores)[:number_of_designs]:
+            if scores[j] == -inf:
+                break
+
+            if len(incumbents) == number_of_designs and scores[j] <= incumbents[0][0]:
+                break
+
+            design = {key: float(value.ravel()[j]) for key, value in designs.items() if key != 'feasible'}
+            design[objective.name] = float(sign * scores[j])
+            entry = (scores[j], int(i) * x_grid.size ** 2 + int(j), design)
+
+            if len(incumbents) < number_of_designs:
+                heapq.heappush(incumbents, entry)
+            else:
+                heapq.heapreplace(incumbents, entry)
+
+    return OptimizationResult(
+        designs=[design for _, _, design in sorted(incumbents, key=lambda entry: (-entry[0], entry[1]))],
+        branches=n_branches,
+        branches_pruned_infeasible=int(n_branches - np.count_nonzero(feasible)),
+        branches_pruned_bound=pruned_bound,
+        designs_total=n_branches * x_grid.size ** 2,
+        designs_evaluated=designs_evaluated,
+    )
+
+
+def optimize_exhaustive(space: DesignSpace, constraints: Constraints = Constraints(),
+                        objective: Objective = CONTACT_RATIO, number_of_designs: int = 10) -> OptimizationResult:
+    """Best designs by evaluating every branch, without bounds.  Reference for optimize, for small design spaces."""
+
+    branches = _branches(space)
+    n_branches = branches['number_of_teeth1'].size
+    sign = 1 if objective.maximize else -1
+
+    mask1 = _profile_shift_masks(space, constraints, branches['pressure_angle_normal'], branches['helix_angle'],
+                                 branches['number_of_teeth1'])
+    mask2 = _profile_shift_masks(space, constraints, branches['pressure_angle_normal'], branches['helix_angle'],
+                                 branches['number_of_teeth2'])
+
+    candidates = []
+    designs_evaluated = 0
+
+    for i in range(n_branches):
+        designs, scores = _evaluate_branch(space, constraints, objective, branches, mask1[i], mask2[i], i)
+        designs_evaluated += designs['feasible'].size
+
+        for j in np.flatnonzero(scores > -inf):
+            design = {key: float(value.ravel()[j]) for key, value in designs.items() if key != 'feasible'}
+            design[objective.name] = float(sign * scores[j])
+            candidates.append((-scores[j], i, int(j), design))
+
+    return OptimizationResult(
+        designs=[design for *_, design in sorted(candidates, key=lambda entry: entry[:3])[:number_of_designs]],
+        branches=n_branches,
+        branches_pruned_infeasible=0,
+        branches_pruned_bound=0,
+        designs_total=n_branches * len(space.profile_shift_coefficients) ** 2,
+        designs_evaluated=designs_evaluated,
+    )
+
+
+# endregion
@@ -0,0 +1,171 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for contact lines on the plane of action, vectorized for arrays of gear pairs.
+
+The plane of action is unrolled to a rectangle with the path of contact along u, from the start of active contact A
+(u = 0) to the end of active contact E (u = g_alpha), and the facewidth along y.  Contact lines cross the rectangle
+inclined at the base helix angle, spaced by the transverse base pitch.  As the gears rotate, the lines advance along u;
+one base pitch of travel is a complete mesh cycle.
+
+Design arguments are NumPy arrays, or scalars, that broadcast against each other.  Outputs append the axes of mesh
+position, contact line and, for sampled points, point along the line.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+# region PATH OF CONTACT
+
+def path_of_contact_fcn(base_diameter1, base_diameter2, working_pressure_angle_transverse,
+                        pressure_angle_transverse_eap1, pressure_angle_transverse_eap2):
+    """Distances along the line of action, measured from the tangent point T1 of the base circle of gear 1.
+
+    :return: Tuple of T1T2, the length of the line of action between base circles; T1A, to the start of active
+        contact; and T1E, to the end of active contact.
+    """
+
+    r_b1 = base_diameter1 / 2
+    r_b2 = base_diameter2 / 2
+
+    t1t2 = (r_b1 + r_b2) * np.tan(working_pressure_angle_transverse)
+    t1a = t1t2 - r_b2 * np.tan(pressure_angle_transverse_eap2)
+    t1e = r_b1 * np.tan(pressure_angle_transverse_eap1)
+
+    return t1t2, t1a, t1e
+
+
+def contact_lines_count_max(contact_plane_length, facewidth, helix_angle_base, base_pitch_transverse) -> int:
+    """Largest number of contact lines that can cross the plane of action at once, over all designs.
+
+    Designs without a valid path of contact, e.g. NaN contact plane lengths, are ignored; zero if no design is valid.
+    """
+
+    span = contact_plane_length + facewidth * np.tan(np.abs(helix_angle_base))
+    counts = np.floor(span / base_pitch_transverse)
+    counts = counts[np.isfinite(counts)]
+
+    if counts.size == 0:
+        return 0
+
+    return max(int(counts.max()) + 1, 0)
+
+
+# endregion
+
+
+# region CONTACT GRID
+
+class ContactGrid(NamedTuple):
+    """Contact lines on the plane of action, at every mesh position.
+
+    Arrays have shape (*designs, positions) for totals, (*designs, positions, lines) for line segments and
+    (*designs, positions, lines, points) for points sampled along the lines.  Lines that do not cross the plane of
+    action at a position have zero length and NaN coordinates.
+    """
+
+    position: np.ndarray  # travel of the contact lines along u, within one transverse base pitch
+    rotation1: np.ndarray  # corresponding rotation of gear 1, radians
+    u_start: np.ndarray  # segment end points, at the smaller y
+    y_start: np.ndarray
+    u_end: np.ndarray  # segment end points, at the larger y
+    y_end: np.ndarray
+    length: np.ndarray  # segment lengths, on the plane of action
+    length_total: np.ndarray  # total length of contact lines
+    u: np.ndarray  # points at the centers of equal subsegments
+    y: np.ndarray
+    radius_curvature1: np.ndarray  # involute radii of curvature of each gear at the points
+    radius_curvature2: np.ndarray
+    point_length: np.ndarray  # length of the subsegment represented by each point
+
+
+def contact_grid(base_diameter1, base_diameter2, number_of_teeth1, working_pressure_angle_transverse,
+                 pressure_angle_transverse_eap1, pressure_angle_transverse_eap2, facewidth, helix_angle_base,
+                 number_of_positions=32, points_per_line=16) -> ContactGrid:
+    """Discretize the contact lines of spur or helical gear pairs on the plane of action.
+
+    All designs, mesh positions, lines and points are evaluated as array operations.
+
+    :param base_diameter1: Base diameter of gear 1, the driving gear.
+    :param base_diameter2: Base diameter of gear 2.
+    :param number_of_teeth1: Number of teeth of gear 1.
+    :param working_pressure_angle_transverse: Working pressure angle in the transverse plane, radians.
+    :param pressure_angle_transverse_eap1: Transverse pressure angle at the end of active profile of gear 1, radians.
+    :param pressure_angle_transverse_eap2: Transverse pressure angle at the end of active profile of gear 2, radians.
+    :param facewidth: Effective facewidth.
+    :param helix_angle_base: Base helix angle, radians.  Zero for spur gears.
+    :param number_of_positions: Number of mesh positions, evenly spaced over one base pitch.
+    :param points_per_line: Number of points sampled along each contact line.
+    :return: ContactGrid
+    """
+
+    d_b1, d_b2, z1, alpha_wt, alpha_eap1, alpha_eap2, b, beta_b = np.broadcast_arrays(
+        *[np.asarray(arg, dtype=float) for arg in (base_diameter1, base_diameter2, number_of_teeth1,
+                                                  working_pressure_angle_transverse, pressure_angle_transverse_eap1,
+                                                  pressure_angle_transverse_eap2, facewidth, helix_angle_base)])
+
+    t1t2, t1a, t1e = path_of_contact_fcn(d_b1, d_b2, alpha_wt, alpha_eap1, alpha_eap2)
+    g_alpha = t1e - t1a
+    p_bt = np.pi * d_b1 / z1
+    tan_beta_b = np.tan(np.abs(beta_b))
+
+    number_of_lines = contact_lines_count_max(g_alpha, b, beta_b, p_bt)
+
+    # axes: (*designs, positions, lines)
+    def expand(a):
+        return a[..., np.newaxis, np.newaxis]
+
+    fraction = np.arange(number_of_positions) / number_of_positions
+    position = p_bt[..., np.newaxis] * fraction
+    k = np.arange(number_of_lines)
+
+    # line k crosses u = c - y tan(beta_b), from y = 0 at u = c
+    c = position[..., np.newaxis] + k * expand(p_bt)
+    g = expand(g_alpha)
+    t = expand(tan_beta_b)
+    width = expand(b)
+
+    # facewidth interval where the line lies within 0 <= u <= g_alpha
+    helical = t > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y_low = np.where(helical, (c - g) / t, np.where(c <= g, 0, width))
+        y_high = np.where(helical, c / t, width)
+
+    y_low = np.clip(y_low, 0, width)
+    y_high = np.clip(y_high, 0, width)
+    crossing = y_high > y_low
+
+    nan = np.full_like(c, np.nan)
+    y_start = np.where(crossing, y_low, nan)
+    y_end = np.where(crossing, y_high, nan)
+    u_start = c - y_start * t
+    u_end = c - y_end * t
+    length = np.where(crossing, (y_high - y_low) / np.cos(expand(beta_b)), 0)
+
+    # points at the centers of equal subsegments, axes: (*designs, positions, lines, points)
+    point_fraction = (np.arange(points_per_line) + 0.5) / points_per_line
+    y = y_start[..., np.newaxis] + (y_end - y_start)[..., np.newaxis] * point_fraction
+    u = c[..., np.newaxis] - y * t[..., np.newaxis]
+    radius_curvature1 = expand(t1a)[..., np.newaxis] + u
+    radius_curvature2 = expand(t1t2)[..., np.newaxis] - radius_curvature1
+
+    return ContactGrid(
+        position=position,
+        rotation1=position / (d_b1[..., np.newaxis] / 2),
+        u_start=u_start,
+        y_start=y_start,
+        u_end=u_end,
+        y_end=y_end,
+        length=length,
+        length_total=length.sum(axis=-1),
+        u=u,
+        y=y,
+        radius_curvature1=radius_curvature1,
+        radius_curvature2=radius_curvature2,
+        point_length=np.broadcast_to((length / points_per_line)[..., np.newaxis], u.shape),
+    )
+
+
+# endregion
@@ -4,8 +4,9 @@
 """Notebook module for planetary gear geometry."""
 
 import numpy as np
-from math import pi, cos, sin
-from typing import Tuple
+from cmath import exp
+from math import pi, cos, sin, asin, ceil, floor, isclose
+from typing import List, Tuple
 
 
 Point = Tuple[float, float]
@@ -25,3 +26,197 @@ def polar_to_cartesian(radius: float, phi: float) -> Point:
     y = radius * sin(phi)
 
     return x, y
+
+
+# region RATIOS
+# NOTE: Negative sign convention is used for number of ring gear teeth, z3.
+
+def std_ratio_base(z1: int, z3: int) -> float:
+    """Compute the base transmission ratio between sun and ring, with the carrier constrained to ground."""
+
+    return z3 / z1
+
+
+def std_ratio_1v(ratio_base: float) -> float:
+    """Compute the transmission ratio between sun and carrier, with the ring gear constrained to ground."""
+
+    return 1 - ratio_base
+
+
+def std_ratio_3v(ratio_base: float) -> float:
+    """Compute the transmission ratio between the ring and carrier, with the sun gear constrained to ground."""
+
+    return 1 - 1 / ratio_base
+
+
+def reference_planet_size(d1: float, d3: float) -> float:
+    """Compute the reference planet size; diameter or tooth counts may be used.  Actual planets may differ."""
+
+    return (abs(d3) - d1) / 2
+
+
+def get_max_planets(tip_diameter_planet: float, center_distance: float) -> int:
+    """Compute the maximum number of planets to avoid interference."""
+
+    return floor(pi / (asin(tip_diameter_planet / (2 * center_distance))))
+
+
+# endregion
+
+
+# region PLANET SPACING
+# NOTE: Negative sign convention is used for number of ring gear teeth, z3.
+
+def get_planet_tick_angle(z1: int, z3: int) -> float:
+    """Compute the unit angle to satisfy the planet meshing conditions."""
+
+    return 2 * pi / (z1 - z3)
+
+
+def get_planet_equal_ticks(z1: int, z3: int, number_of_planets: int) -> float:
+    """Compute the number of tick angles that correspond to equal planet spacing.  Must be integer to mesh."""
+
+    return (z1 - z3) / number_of_planets
+
+
+def allows_equally_spaced(equal_ticks: float) -> bool:
+    """Check if equally spaced planets are allowed based on the tick count required for equal spacing."""
+
+    return isclose(equal_ticks, round(equal_ticks))
+
+
+def allows_diametrically_opposed(equal_ticks: float) -> bool:
+    """Check if diametrically opposed planet spacing is allowed based on the ticks required for equal spacing."""
+
+    return isclose(equal_ticks % 1, 0.5)
+
+
+def get_planet_angles(z1: int, z3: int, number_of_planets: int) -> List[float]:
+    """Compute the planet angles that are nearest equal-spacing."""
+
+    tick_angle = get_planet_tick_angle(z1, z3)
+    equal_ticks = get_planet_equal_ticks(z1, z3, number_of_planets)
+    equal_angle = 2 * pi / number_of_planets
+
+    if allows_equally_spaced(equal_ticks):
+        thetas = [i * equal_angle for i in range(number_of_planets)]
+    elif allows_diametrically_opposed(equal_ticks):
+        thetas = [0]
+        for i in range(1, number_of_planets):
+            nearest_whole_tick = ceil(i * equal_ticks)
+            theta = nearest_whole_tick * tick_angle
+            thetas.append(theta)
+    else:
+        raise ValueError('Invalid planetary design.')
+
+    return thetas
+
+
+# endregion
+
+
+# region PHASING
+
+def pitch_angle_transverse(number_of_teeth: int) -> float:
+    """Spur or helical gear transverse pitch angle."""
+
+    return 2 * pi / abs(number_of_teeth)
+
+
+def mesh_cycle_fraction(planet_position_angle: float, transverse_pitch_angle: float) -> float:
+    """Calculate the fraction of mesh cycle for a given planet position.
+
+    Notes:
+        1. Only the relative values of phasing are important.
+        2. It is assumed that a planet at zero angle is at the start of a mesh cycle.
+    """
+
+    return planet_position_angle / transverse_pitch_angle % 1
+
+
+def mesh_phase_angle(planet_position_angle: float, number_of_teeth: int) -> float:
+    """Calculate the mesh phase angle in radians."""
+
+    transverse_pitch_angle = pitch_angle_transverse(number_of_teeth)
+
+    return 2 * pi * mesh_cycle_fraction(planet_position_angle, transverse_pitch_angle)
+
+
+def summed_phasing(planet_angles: List[float], phase_angles: List[float]) -> Tuple[float, float, float]:
+    """Calculate the sum of gear mesh excitations, reporting a normalized metric for design purposes."""
+
+    fx = 0
+    fy = 0
+    mz = 0
+
+    for theta, phi in zip(planet_angles, phase_angles):
+        signal = exp(1j * phi)
+        fx += cos(theta) * signal
+        fy += sin(theta) * signal
+        mz += signal
+
+    # normalize metrics; 1.0 is fully reinforced
+    n_planets = len(planet_angles)
+    fx_sum = abs(fx) / (n_planets / 2)
+    fy_sum = abs(fy) / (n_planets / 2)
+    trq_sum = abs(mz) / n_planets
+
+    return fx_sum, fy_sum, trq_sum
+
+
+def get_phasing_type(fx_sum: float, fy_sum: float, trq_sum: float) -> str:
+    """Return a string to indicate the type of planetary phasing.
+
+    Phasing types:
+        1. 'I' - in-phase
+        2. 'C' - counter-phase
+        3. 'S' - sequential-phase
+        4. 'M' - mixed-phase
+    """
+
+    f_sum = fx_sum + fy_sum
+    f_cancelled = isclose(f_sum, 0, abs_tol=1e-3)
+    f_reinforced = isclose(f_sum, 2)
+
+    trq_cancelled = isclose(trq_sum, 0, abs_tol=1e-3)
+    trq_reinforced = isclose(trq_sum, 1)
+
+    if f_cancelled and trq_reinforced:
+        typ = 'I'
+    elif f_cancelled and trq_cancelled:
+        typ = 'C'
+    elif f_reinforced and trq_cancelled:
+        typ = 'S'
+    else:
+        typ = 'M'
+
+    return typ
+
+
+# NOTE: Sign convention for number of ring gear teeth is insignificant here.
+
+def mod_phasing(z3: int, number_of_planets: int) -> int:
+    """Modulo operation to compute gear mesh phasing for equally-spaced planets."""
+
+    return abs(z3) % number_of_planets
+
+
+def is_in_phase(k_phi: int) -> bool:
+    """Check if equally-spaced gear meshes are in-phase."""
+
+    return k_phi == 0
+
+
+def is_sequential_phase(k_phi: int, number_of_planets: int) -> bool:
+    """Check if equally-spaced gear meshes are sequential-phase."""
+
+    return k_phi == 1 or k_phi == number_of_planets - 1
+
+
+def is_counter_phase(k_phi: int, number_of_planets: int) -> bool:
+    """Check if equally-spaced gear meshes are counter-phase."""
+
+    return k_phi == 2 or k_phi == 3 or k_phi == number_of_planets - 2
+
+
+# endregion
@@ -0,0 +1,396 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for incremental, debounced recalculation of interactive examples.
+
+A calculation graph holds named inputs and quantities computed from them.  Changing an input marks only its downstream
+quantities as stale, and only stale quantities are recomputed.  A debounced updater collects widget changes, waits for
+input to settle, and abandons a recalculation as soon as newer input arrives.
+"""
+
+import threading
+import traceback
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+try:
+    import helical_gears as hg  # notebooks, run from geometry/
+except ImportError:
+    from geometry import helical_gears as hg  # batch tools, run from the repository root
+
+
+# region GRAPH
+
+def _changed(old, new) -> bool:
+    try:
+        return not np.array_equal(old, new)
+    except Exception:
+        return old is not new
+
+
+class CalculationGraph:
+    """Dependency graph of named inputs and calculated quantities.
+
+    Quantities must be added after the names they depend on, so that insertion order is a valid order of evaluation.
+    """
+
+    def __init__(self):
+        self._values = {}  # type: Dict[str, Any]
+        self._nodes = {}  # type: Dict[str, tuple]
+        self._dependents = defaultdict(list)  # type: Dict[str, List[str]]
+        self._dirty = set()  # type: Set[str]
+
+    def __contains__(self, name):
+        return name in self._values or name in self._nodes
+
+    def input(self, name: str, value) -> 'CalculationGraph':
+        """Add an input with its initial value."""
+
+        if name in self:
+            raise ValueError(f'{name} is already defined.')
+
+        self._values[name] = value
+        return self
+
+    def add(self, name: str, fcn: Callable, *inputs: str) -> 'CalculationGraph':
+        """Add a quantity calculated as fcn(*inputs), where inputs are names of inputs or other quantities."""
+
+        if name in self:
+            raise ValueError(f'{name} is already defined.')
+
+        for input_name in inputs:
+            if input_name not in self:
+                raise ValueError(f'{name} depends on undefined {input_name}.')
+            self._dependents[input_name].append(name)
+
+        self._nodes[name] = (fcn, inputs)
+        self._dirty.add(name)
+        return self
+
+    @property
+    def inputs(self) -> List[str]:
+        return list(self._values.keys() - self._nodes.keys())
+
+    @property
+    def stale(self) -> Set[str]:
+        return set(self._dirty)
+
+    def set(self, **values) -> Set[str]:
+        """Change input values and return the names of the quantities made stale.  Unchanged values have no effect."""
+
+        stale = set()
+        stack = []
+
+        for name, value in values.items():
+            if name in self._nodes or name not in self._values:
+                raise KeyError(f'{name} is not an input.')
+
+            if _changed(self._values[name], value):
+                self._values[name] = value
+                stack.append(name)
+
+        while stack:
+            for dependent in self._dependents[stack.pop()]:
+                if dependent not in stale:
+                    stale.add(dependent)
+                    stack.append(dependent)
+
+        self._dirty |= stale
+        return stale
+
+    def _upstream(self, names: Iterable[str]) -> Set[str]:
+        upstream = set()
+        stack = list(names)
+
+        while stack:
+            name = stack.pop()
+            if name not in upstream:
+                upstream.add(name)
+                stack.extend(self._nodes[name][1] if name in self._nodes else ())
+
+        return upstream
+
+    def evaluate(self, names: Optional[Iterable[str]] = None,
+                 cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """Recompute stale quantities, or only those required by the given names.
+
+        :param names: Quantities of interest.  All stale quantities are recomputed if None.
+        :param cancelled: Polled before each quantity; evaluation stops early if it returns True.
+        :return: False if cancelled, True otherwise.  Quantities computed before cancellation remain valid.
+        """
+
+        required = self._dirty if names is None else self._dirty & self._upstream(names)
+
+        for name in [name for name in self._nodes if name in required]:
+            if cancelled is not None and cancelled():
+                return False
+
+            fcn, inputs = self._nodes[name]
+            self._values[name] = fcn(*(self._values[input_name] for input_name in inputs))
+            self._dirty.discard(name)
+
+        return True
+
+    def get(self, name: str):
+        """Value of an input or quantity, recomputing it first if stale."""
+
+        if name in self._dirty:
+            self.evaluate([name])
+
+        return self._values[name]
+
+    def values(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Values of the given names, or of all inputs and quantities, recomputing stale ones first."""
+
+        names = list(self._values.keys() | self._nodes.keys()) if names is None else list(names)
+        self.evaluate(names)
+
+        return {name: self._values[name] for name in names}
+
+
+# endregion
+
+
+# region DEBOUNCE
+
+class DebouncedUpdater:
+    """Applies input changes to a graph once they settle, then reports the outputs.
+
+    Changes are collected until no new change arrives for the delay.  The recalculation then runs on a timer thread
+    and is abandoned, between quantities, if newer input arrives; the callback only ever receives current results.
+
+    Exceptions of a recalculation or callback are never raised, since the timer thread has no cell to report to.  The
+    latest is kept as last_error, and passed to on_error or written to the output widget.
+    """
+
+    def __init__(self, graph: CalculationGraph, outputs: Iterable[str], callback: Callable[[Dict[str, Any]], None],
+                 delay: float = 0.25, on_error: Optional[Callable[[Exception], None]] = None, output=None):
+        """
+        :param graph: Graph to update.
+        :param outputs: Names of the quantities passed to the callback.
+        :param callback: Called with a mapping of output names to values after each completed recalculation.
+        :param delay: Seconds without input changes before recalculating.
+        :param on_error: Called with the exception if a recalculation or the callback fails.
+        :param output: ipywidgets Output, showing the traceback of a failure if on_error is None.
+        """
+
+        self.graph = graph
+        self.outputs = list(outputs)
+        self.callback = callback
+        self.delay = delay
+        self.on_error = on_error
+        self.output = output
+        self.last_error = None  # type: Optional[Exception]
+
+        self._pending = {}  # type: Dict[str, Any]
+        self._generation = 0
+        self._timer = None  # type: Optional[threading.Timer]
+        self._lock = threading.Lock()
+        self._graph_lock = threading.Lock()
+
+    def update(self, **values) -> None:
+        """Queue input changes, restarting the delay and cancelling any recalculation in progress."""
+
+        with self._lock:
+            self._pending.update(values)
+            self._generation += 1
+
+            if self._timer is not None:
+                self._timer.cancel()
+
+            self._timer = threading.Timer(self.delay, self._run, args=(self._generation,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self) -> None:
+        """Discard queued changes and cancel any recalculation in progress."""
+
+        with self._lock:
+            self._pending = {}
+            self._generation += 1
+
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def flush(self) -> None:
+        """Apply queued changes and recalculate immediately, on the calling thread."""
+
+        with self._lock:
+            self._generation += 1
+
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            generation = self._generation
+
+        self._run(generation)
+
+    def _is_stale(self, generation: int) -> bool:
+        return generation != self._generation
+
+    def _run(self, generation: int) -> None:
+        with self._graph_lock:
+            with self._lock:
+                if self._is_stale(generation):
+                    return
+                values, self._pending = self._pending, {}
+
+            try:
+                self.graph.set(**values)
+
+                if not self.graph.evaluate(self.outputs, cancelled=lambda: self._is_stale(generation)):
+                    return
+
+                results = self.graph.values(self.outputs)
+            except Exception as e:
+                self._report_error(e)
+                return
+
+        if not self._is_stale(generation):
+            try:
+                self.callback(results)
+            except Exception as e:
+                self._report_error(e)
+                return
+
+            self.last_error = None
+
+    def _report_error(self, error: Exception) -> None:
+        self.last_error = error
+
+        if self.on_error is not None:
+            self.on_error(error)
+        elif self.output is not None:
+            # append_stderr is safe from the timer thread, unlike capturing with the output as a context manager
+            self.output.append_stderr(''.join(traceback.format_exception(type(error), error, error.__traceback__)))
+
+
+def link_widgets(updater: DebouncedUpdater, **widgets) -> None:
+    """Forward value changes of widgets to graph inputs of the same keyword name.
+
+    Any object with an ipywidgets-style observe method is accepted.
+    """
+
+    for name, widget in widgets.items():
+        def handler(change, name=name):
+            updater.update(**{name: change['new']})
+
+        widget.observe(handler, names='value')
+
+
+# endregion
+
+
+# region HELICAL GEAR PAIR
+
+HELICAL_GEAR_PAIR_INPUTS = {
+    'module_normal': 1,
+    'pressure_angle_normal_deg': 20,
+    'helix_angle_deg': 15,
+    'center_distance': 27.5,
+    'number_of_teeth1': 17,
+    'number_of_teeth2': 35,
+    'profile_shift_coefficient1': 0.2,
+    'profile_shift_coefficient2': -0.1,
+    'basic_rack_addendum_coefficient1': 1,
+    'basic_rack_addendum_coefficient2': 1,
+    'basic_rack_dedendum_coefficient1': 1.25,
+    'basic_rack_dedendum_coefficient2': 1.25,
+    'facewidth1': 10,
+    'facewidth2': 9,
+}
+
+
+def helical_gear_pair_graph(lib=hg, **inputs) -> CalculationGraph:
+    """Graph of the helical gear pair example, see the geometry notebook Chapter 3.
+
+    :param lib: Module of gear functions, either helical_gears for a single design or helical_gears_batch for arrays
+        of designs.
+    :param inputs: Initial values overriding HELICAL_GEAR_PAIR_INPUTS, with angles in degrees.
+    """
+
+    unknown = inputs.keys() - HELICAL_GEAR_PAIR_INPUTS.keys()
+    if unknown:
+        raise ValueError(f'Unknown inputs: {sorted(unknown)}')
+
+    graph = CalculationGraph()
+
+    for name, value in HELICAL_GEAR_PAIR_INPUTS.items():
+        graph.input(name, inputs.get(name, value))
+
+    def product(a, b):
+        return a * b
+
+    # conversions
+    graph.add('pressure_angle_normal', np.radians, 'pressure_angle_normal_deg')
+    graph.add('helix_angle', np.radians, 'helix_angle_deg')
+    for i in '12':
+        graph.add('basic_rack_addendum' + i, product, 'basic_rack_addendum_coefficient' + i, 'module_normal')
+        graph.add('basic_rack_dedendum' + i, product, 'basic_rack_dedendum_coefficient' + i, 'module_normal')
+        graph.add('profile_shift' + i, product, 'profile_shift_coefficient' + i, 'module_normal')
+
+    # gear parameters
+    graph.add('module_transverse', lib.module_transverse_fcn, 'module_normal', 'helix_angle')
+    graph.add('pressure_angle_transverse', lib.pressure_angle_transverse_fcn,
+              'pressure_angle_normal', 'helix_angle')
+    for i in '12':
+        graph.add('theoretical_pitch_diameter' + i, lib.theoretical_pitch_diameter_fcn,
+                  'module_transverse', 'number_of_teeth' + i)
+        graph.add('base_diameter' + i, lib.base_diameter_fcn,
+                  'theoretical_pitch_diameter' + i, 'pressure_angle_transverse')
+        graph.add('tip_diameter' + i, lib.tip_diameter_fcn,
+                  'theoretical_pitch_diameter' + i, 'basic_rack_addendum' + i, 'profile_shift' + i)
+        graph.add('root_diameter' + i, lib.root_diameter_fcn,
+                  'theoretical_pitch_diameter' + i, 'basic_rack_dedendum' + i, 'profile_shift' + i)
+    graph.add('helix_angle_base', lib.helix_angle_arbitrary_fcn,
+              'base_diameter1', 'helix_angle', 'theoretical_pitch_diameter1')
+
+    # pressure angles and center distances
+    graph.add('working_pressure_angle', lib.working_pressure_angle_fcn,
+              'center_distance', 'base_diameter1', 'base_diameter2')
+    graph.add('working_pressure_angle_theoretical', lib.working_pressure_angle_theoretical_fcn,
+              'profile_shift_coefficient1', 'profile_shift_coefficient2', 'number_of_teeth1', 'number_of_teeth2',
+              'pressure_angle_normal', 'pressure_angle_transverse')
+    graph.add('center_distance_reference', lib.center_distance_reference_fcn,
+              'module_normal', 'number_of_teeth1', 'number_of_teeth2', 'helix_angle')
+    graph.add('center_distance_theoretical', lib.center_distance_theoretical_fcn,
+              'center_distance_reference', 'working_pressure_angle_theoretical', 'pressure_angle_transverse')
+
+    # clearances
+    graph.add('tip_clearance1', lib.tip_clearance_fcn, 'center_distance', 'tip_diameter1', 'root_diameter2')
+    graph.add('tip_clearance2', lib.tip_clearance_fcn, 'center_distance', 'tip_diameter2', 'root_diameter1')
+    graph.add('backlash_radial', lib.backlash_radial_fcn, 'center_distance', 'center_distance_theoretical')
+    graph.add('backlash_circumferential', lib.backlash_circumferential_fcn,
+              'backlash_radial', 'working_pressure_angle')
+    graph.add('backlash_profile', lib.backlash_profile_fcn, 'backlash_circumferential', 'working_pressure_angle')
+    graph.add('backlash_normal', lib.backlash_normal_fcn, 'backlash_profile', 'helix_angle_base')
+
+    # SAP & EAP
+    for i in '12':
+        graph.add('pressure_angle_transverse_eap' + i, lib.pressure_angle_transverse_arbitrary_fcn,
+                  'base_diameter' + i, 'tip_diameter' + i)
+    for i, j in ('12', '21'):
+        graph.add('pressure_angle_transverse_sap' + i, lib.pressure_angle_transverse_contact_fcn,
+                  'working_pressure_angle', 'number_of_teeth' + i, 'number_of_teeth' + j,
+                  'pressure_angle_transverse_eap' + j)
+
+    # contact
+    graph.add('facewidth_effective', np.minimum, 'facewidth1', 'facewidth2')
+    graph.add('contact_ratio_transverse', lib.contact_ratio_transverse_fcn,
+              'working_pressure_angle', 'number_of_teeth1', 'number_of_teeth2',
+              'pressure_angle_transverse_eap1', 'pressure_angle_transverse_eap2')
+    graph.add('contact_ratio_axial', lib.contact_ratio_axial_fcn, 'facewidth_effective', 'helix_angle', 'module_normal')
+    graph.add('contact_ratio_total', lib.contact_ratio_total_fcn, 'contact_ratio_transverse', 'contact_ratio_axial')
+    graph.add('contact_lines_length_mean', lib.contact_lines_length_mean_fcn,
+              'facewidth_effective', 'contact_ratio_transverse', 'helix_angle_base')
+    graph.add('contact_lines_length_min', lib.contact_lines_length_min_fcn,
+              'contact_lines_length_mean', 'contact_ratio_transverse', 'contact_ratio_axial')
+
+    return graph
+
+
+# endregion
@@ -0,0 +1,339 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for Monte Carlo tolerance analysis of helical gear pair backlash and clearances.
+
+Manufacturing deviations are sampled in fixed-size chunks and reduced into streaming statistics, so memory use is
+independent of the number of samples.
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+
+try:
+    import helical_gears_batch as hgb  # notebooks, run from geometry/
+except ImportError:
+    from geometry import helical_gears_batch as hgb  # batch tools, run from the repository root
+
+
+Sampler = Callable[[np.random.Generator, int], np.ndarray]
+
+DEVIATIONS = (
+    'tooth_thickness1',  # normal tooth thickness deviation of gear 1, negative is thinner
+    'tooth_thickness2',  # normal tooth thickness deviation of gear 2, negative is thinner
+    'center_distance',  # actual center distance deviation
+    'tip_diameter1',  # tip diameter deviation of gear 1
+    'tip_diameter2',  # tip diameter deviation of gear 2
+    'runout1',  # radial runout of gear 1, total indicator reading
+    'runout2',  # radial runout of gear 2, total indicator reading
+)
+
+RESULTS = (
+    'backlash_radial',
+    'backlash_circumferential',
+    'backlash_normal',
+    'tip_clearance1',
+    'tip_clearance2',
+    'bottom_clearance1',
+    'bottom_clearance2',
+)
+
+
+class GearPairNominal(NamedTuple):
+    """Nominal data of a helical gear pair.  Angles in radians."""
+
+    module_normal: float
+    pressure_angle_normal: float
+    helix_angle: float
+    center_distance: float
+    number_of_teeth1: int
+    number_of_teeth2: int
+    profile_shift_coefficient1: float = 0
+    profile_shift_coefficient2: float = 0
+    basic_rack_addendum_coefficient1: float = 1
+    basic_rack_addendum_coefficient2: float = 1
+    basic_rack_dedendum_coefficient1: float = 1.25
+    basic_rack_dedendum_coefficient2: float = 1.25
+
+
+# region DISTRIBUTIONS
+
+def constant(value: float = 0) -> Sampler:
+    return lambda rng, size: np.full(size, float(value))
+
+
+def normal(mean: float, standard_deviation: float) -> Sampler:
+    return lambda rng, size: rng.normal(mean, standard_deviation, size)
+
+
+def uniform(lower: float, upper: float) -> Sampler:
+    return lambda rng, size: rng.uniform(lower, upper, size)
+
+
+def tolerance_band(lower: float, upper: float, sigma_level: float = 3) -> Sampler:
+    """Normal distribution centered in a tolerance band, with the band limits at +/- sigma_level."""
+
+    return normal((lower + upper) / 2, (upper - lower) / (2 * sigma_level))
+
+
+def rayleigh(mode: float) -> Sampler:
+    """Rayleigh distribution, typical of radial runout magnitudes."""
+
+    return lambda rng, size: rng.rayleigh(mode, size)
+
+
+# endregion
+
+
+# region STATISTICS
+
+class StreamingStatistics:
+    """Constant-memory statistics of a stream of values.
+
+    Mean and variance are merged exactly per chunk.  Quantiles are interpolated from a fixed-bin histogram, whose range
+    is set from a pilot of at least `bins` values unless specified; values are buffered until the pilot is complete.
+    Values outside the range are counted as underflow or overflow, and quantiles within those tails are clamped to the
+    exact min or max, so tail quantiles are unreliable when underflow or overflow are non-zero.
+    """
+
+    def __init__(self, bins: int = 2000, value_range: Optional[tuple] = None):
+        self.bins = bins
+        self.edges = None if value_range is None else np.linspace(*value_range, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.invalid = 0
+        self.nonpositive = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self._pilot = []
+        self._pilot_size = 0
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float).ravel()
+        finite = np.isfinite(values)
+        self.invalid += int(values.size - np.count_nonzero(finite))
+        values = values[finite]
+
+        n = values.size
+        if n == 0:
+            return
+
+        # Chan et al. parallel merge of mean and sum of squared deviations
+        chunk_mean = values.mean()
+        chunk_m2 = np.sum((values - chunk_mean) ** 2)
+        delta = chunk_mean - self.mean
+        total = self.count + n
+        self.mean += delta * n / total
+        self._m2 += chunk_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.nonpositive += int(np.count_nonzero(values <= 0))
+
+        if self.edges is None:
+            self._pilot.append(values)
+            self._pilot_size += n
+            if self._pilot_size >= self.bins:
+                self._set_edges()
+        else:
+            self._add_to_histogram(values)
+
+    def _add_to_histogram(self, values: np.ndarray) -> None:
+        self.underflow += int(np.count_nonzero(values < self.edges[0]))
+        self.overflow += int(np.count_nonzero(values > self.edges[-1]))
+        self.counts += np.histogram(values, bins=self.edges)[0]
+
+    def _set_edges(self) -> None:
+        """Set the histogram range from the pilot values, padded by their range, and bin the pilot values."""
+
+        pilot = np.concatenate(self._pilot) if self._pilot else np.zeros(0)
+        self._pilot = []
+        self._pilot_size = 0
+
+        if pilot.size:
+            lower, upper = pilot.min(), pilot.max()
+        else:
+            lower, upper = 0.0, 0.0
+        pad = max(upper - lower, abs(upper), abs(lower), 1e-12)
+        self.edges = np.linspace(lower - pad, upper + pad, self.bins + 1)
+
+        self._add_to_histogram(pilot)
+
+    @property
+    def std(self) -> float:
+        return np.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def probability_nonpositive(self) -> float:
+        return self.nonpositive / self.count if self.count else np.nan
+
+    def quantile(self, q):
+        """Approximate quantile(s), linearly interpolated within histogram bins."""
+
+        q = np.asarray(q, dtype=float)
+        if not self.count:
+            return np.full(q.shape, np.nan)
+
+        if self.edges is None:
+            self._set_edges()
+
+        cumulative = self.underflow + np.concatenate([[0], np.cumsum(self.counts)])
+        target = q * self.count
+        values = np.interp(target, cumulative, self.edges)
+
+        # targets within the underflow or overflow tails are clamped to the exact extremes
+        values = np.where(target <= self.underflow, self.min, values)
+        values = np.where(target >= self.count - self.overflow, self.max, values)
+
+        return values
+
+    def histogram(self):
+        """Bin counts and bin edges, excluding underflow and overflow."""
+
+        if self.edges is None:
+            self._set_edges()
+
+        return self.counts.copy(), self.edges.copy()
+
+    def summary(self, quantiles=(0.00135, 0.5, 0.99865)) -> Dict[str, float]:
+        data = {
+            'count': self.count,
+            'mean': float(self.mean),
+            'std': float(self.std),
+            'min': float(self.min),
+            'max': float(self.max),
+            'probability_nonpositive': self.probability_nonpositive,
+        }
+        data.update({f'q{q:g}': float(value) for q, value in zip(quantiles, self.quantile(quantiles))})
+
+        return data
+
+
+# endregion
+
+
+# region TOLERANCE ANALYSIS
+
+def sample_results(nominal: GearPairNominal, deviations: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Backlash and clearances of gear pairs with the specified deviations, one element per sample.
+
+    Tooth thickness deviations are applied as an equivalent change in profile shift, as for a change of tool infeed,
+    which also moves the root diameter.  Runout is applied at the tightest mesh position of a revolution, where the
+    eccentricities of both gears reduce the center distance.
+    """
+
+    m_n = nominal.module_normal
+    alpha_n = nominal.pressure_angle_normal
+    beta = nominal.helix_angle
+    z1 = nominal.number_of_teeth1
+    z2 = nominal.number_of_teeth2
+
+    # equivalent profile shift coefficients from tooth thickness deviations
+    x1 = nominal.profile_shift_coefficient1 + deviations['tooth_thickness1'] / (2 * m_n * np.tan(alpha_n))
+    x2 = nominal.profile_shift_coefficient2 + deviations['tooth_thickness2'] / (2 * m_n * np.tan(alpha_n))
+
+    # gear parameters
+    module_transverse = hgb.module_transverse_fcn(m_n, beta)
+    pressure_angle_transverse = hgb.pressure_angle_transverse_fcn(alpha_n, beta)
+    theoretical_pitch_diameter1 = hgb.theoretical_pitch_diameter_fcn(module_transverse, z1)
+    theoretical_pitch_diameter2 = hgb.theoretical_pitch_diameter_fcn(module_transverse, z2)
+    base_diameter1 = hgb.base_diameter_fcn(theoretical_pitch_diameter1, pressure_angle_transverse)
+    base_diameter2 = hgb.base_diameter_fcn(theoretical_pitch_diameter2, pressure_angle_transverse)
+    helix_angle_base = hgb.helix_angle_arbitrary_fcn(base_diameter1, beta, theoretical_pitch_diameter1)
+
+    tip_diameter1 = hgb.tip_diameter_fcn(theoretical_pitch_diameter1, nominal.basic_rack_addendum_coefficient1 * m_n,
+                                         nominal.profile_shift_coefficient1 * m_n) + deviations['tip_diameter1']
+    tip_diameter2 = hgb.tip_diameter_fcn(theoretical_pitch_diameter2, nominal.basic_rack_addendum_coefficient2 * m_n,
+                                         nominal.profile_shift_coefficient2 * m_n) + deviations['tip_diameter2']
+    root_diameter1 = hgb.root_diameter_fcn(theoretical_pitch_diameter1,
+                                           nominal.basic_rack_dedendum_coefficient1 * m_n, x1 * m_n)
+    root_diameter2 = hgb.root_diameter_fcn(theoretical_pitch_diameter2,
+                                           nominal.basic_rack_dedendum_coefficient2 * m_n, x2 * m_n)
+
+    # actual center distance at the tightest mesh position
+    eccentricity = (deviations['runout1'] + deviations['runout2']) / 2
+    center_distance = nominal.center_distance + deviations['center_distance'] - eccentricity
+
+    # center distances and pressure angles
+    working_pressure_angle = hgb.working_pressure_angle_fcn(center_distance, base_diameter1, base_diameter2)
+    working_pressure_angle_theoretical = hgb.working_pressure_angle_theoretical_fcn(
+        x1, x2, z1, z2, alpha_n, pressure_angle_transverse)
+    center_distance_reference = hgb.center_distance_reference_fcn(m_n, z1, z2, beta)
+    center_distance_theoretical = hgb.center_distance_theoretical_fcn(
+        center_distance_reference, working_pressure_angle_theoretical, pressure_angle_transverse)
+
+    # backlash and clearances
+    backlash_radial = hgb.backlash_radial_fcn(center_distance, center_distance_theoretical)
+    backlash_circumferential = hgb.backlash_circumferential_fcn(backlash_radial, working_pressure_angle)
+    backlash_profile = hgb.backlash_profile_fcn(backlash_circumferential, working_pressure_angle)
+
+    return {
+        'backlash_radial': backlash_radial,
+        'backlash_circumferential': backlash_circumferential,
+        'backlash_normal': hgb.backlash_normal_fcn(backlash_profile, helix_angle_base),
+        'tip_clearance1': hgb.tip_clearance_fcn(center_distance, tip_diameter1, root_diameter2),
+        'tip_clearance2': hgb.tip_clearance_fcn(center_distance, tip_diameter2, root_diameter1),
+        'bottom_clearance1': hgb.bottom_clearance_fcn(center_distance, root_diameter1, tip_diameter2),
+        'bottom_clearance2': hgb.bottom_clearance_fcn(center_distance, root_diameter2, tip_diameter1),
+    }
+
+
+class ToleranceResult(NamedTuple):
+    statistics: Dict[str, StreamingStatistics]
+    probability_zero_backlash: float
+    probability_interference: float
+    number_of_samples: int
+
+
+def tolerance_analysis(nominal: GearPairNominal, samplers: Dict[str, Sampler], number_of_samples: int,
+                       chunk_size: int = 200000, seed: Optional[int] = None, bins: int = 2000) -> ToleranceResult:
+    """Monte Carlo analysis of backlash and clearances of a helical gear pair.
+
+    :param nominal: Nominal gear pair data.
+    :param samplers: Deviation samplers, keyed by names in DEVIATIONS.  Unspecified deviations are zero.
+    :param number_of_samples: Total number of samples.
+    :param chunk_size: Number of samples evaluated per vectorized chunk; bounds the memory use.
+    :param seed: Seed of the random number generator, for repeatable results.
+    :param bins: Number of histogram bins of each result statistic.
+    :return: Streaming statistics of each result, with probabilities of zero backlash and of interference.
+    """
+
+    unknown = set(samplers) - set(DEVIATIONS)
+    if unknown:
+        raise ValueError(f'Unknown deviations: {sorted(unknown)}')
+
+    rng = np.random.default_rng(seed)
+    samplers = {name: samplers.get(name, constant(0)) for name in DEVIATIONS}
+    statistics = {name: StreamingStatistics(bins) for name in RESULTS}
+
+    zero_backlash = 0
+    interference = 0
+    remaining = number_of_samples
+
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        remaining -= size
+
+        deviations = {name: sampler(rng, size) for name, sampler in samplers.items()}
+        results = sample_results(nominal, deviations)
+
+        for name, values in results.items():
+            statistics[name].update(values)
+
+        # invalid working pressure angles, i.e. NaN backlash, are counted as jammed
+        zero_backlash += int(np.count_nonzero(~(results['backlash_radial'] > 0)))
+
+        clearances = np.stack([results[name] for name in RESULTS if 'clearance' in name])
+        interference += int(np.count_nonzero(np.any(clearances <= 0, axis=0)))
+
+    return ToleranceResult(statistics, zero_backlash / number_of_samples, interference / number_of_samples,
+                           number_of_samples)
+
+
+# endregion
@@ -0,0 +1,177 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for gear tooth contact stress."""
+
+from math import sqrt
+from typing import NamedTuple
+
+import numpy as np
+
+from geometry import involute as inv
+from geometry import plane_of_action as poa
+from strength import forces
+
+
+def minimum_module_contact_fcn(torque, number_of_teeth1, gear_ratio, facewidth_to_pitch,
+                               allowable_contact_pressure, material_factor, pitch_point_factor):
+    """Minimum module to limit the pitch point contact pressure, for torque in Nm and pressure in MPa.
+
+    :param torque: Pinion torque.
+    :param number_of_teeth1: Pinion number of teeth.
+    :param gear_ratio: Gear ratio, z2 / z1.
+    :param facewidth_to_pitch: Ratio of facewidth to pinion pitch diameter.
+    :param allowable_contact_pressure: Allowable contact pressure.
+    :param material_factor: Material factor, y_m.
+    :param pitch_point_factor: Pitch point factor, y_p.
+    :return: Minimum module in mm.
+    """
+
+    i = gear_ratio
+    numerator = 2000 * torque * material_factor ** 2 * pitch_point_factor ** 2 * (i + 1)
+    denominator = facewidth_to_pitch * allowable_contact_pressure ** 2 * i
+
+    return (numerator / denominator) ** (1 / 3) / number_of_teeth1
+
+
+def contact_pressure_fcn(torque, pitch_diameter1, gear_ratio, facewidth_to_pitch, material_factor,
+                         pitch_point_factor):
+    """Contact pressure at the pitch point, in MPa for torque in Nm and pitch diameter in mm."""
+
+    i = gear_ratio
+
+    return material_factor * pitch_point_factor * \
+        sqrt(2000 * torque / (facewidth_to_pitch * pitch_diameter1 ** 3) * (i + 1) / i)
+
+
+# region CONTACT PRESSURE ALONG PATH OF CONTACT
+
+class ContactPressurePath(NamedTuple):
+    """Contact pressure from SAP to EAP of gear 1.  Arrays have shape (*designs, points), maxima (*designs,)."""
+
+    position: np.ndarray  # distance along the path of contact from its start A, mm
+    roll_angle1: np.ndarray  # involute roll angles at the contact point, radians
+    roll_angle2: np.ndarray
+    radius_curvature1: np.ndarray  # involute radii of curvature in the transverse plane, mm
+    radius_curvature2: np.ndarray
+    radius_curvature_relative: np.ndarray  # relative radius of curvature in the normal plane, mm
+    load_share: np.ndarray  # fraction of the tooth load carried at the point
+    load_per_length: np.ndarray  # normal load per unit length of contact line, N/mm
+    pressure: np.ndarray  # Hertzian contact pressure, MPa
+    pressure_max: np.ndarray
+    position_max: np.ndarray
+
+
+def relative_radius_curvature_fcn(radius_curvature1, radius_curvature2):
+    """Relative radius of curvature of two convex surfaces in contact."""
+
+    return radius_curvature1 * radius_curvature2 / (radius_curvature1 + radius_curvature2)
+
+
+def load_share_fcn(position, contact_plane_length, base_pitch_transverse, contact_ratio_axial=0):
+    """Fraction of the tooth load carried at a point of the path of contact.
+
+    For spur gears, the load is shared equally between the tooth pairs in contact: halved in double contact zones, and
+    fully carried in the single contact zone.  For helical gears, the zones are smeared over the facewidth; the share
+    is interpolated by the axial contact ratio toward 1 / contact_ratio_transverse, reached at an axial contact ratio
+    of one, as in the contact ratio factor of ISO 6336-2.
+
+    :param position: Distance along the path of contact from its start A.
+    """
+
+    g_alpha = contact_plane_length
+    p_bt = base_pitch_transverse
+
+    # tooth pairs in contact: the point itself, and those whole base pitches ahead and behind within the path
+    pairs = np.floor((g_alpha - position) / p_bt) + np.floor(position / p_bt) + 1
+    share_spur = 1 / pairs
+
+    cr_a = np.minimum(contact_ratio_axial, 1)
+    cr_t = g_alpha / p_bt
+
+    return (1 - cr_a) * share_spur + cr_a / cr_t
+
+
+def hertz_line_contact_pressure_fcn(load_per_length, radius_curvature_relative,
+                                    elastic_modulus1, elastic_modulus2, poisson_ratio1=0.3, poisson_ratio2=0.3):
+    """Maximum Hertzian pressure of line contact, in MPa for load in N/mm, radius in mm and moduli in MPa."""
+
+    compliance = (1 - poisson_ratio1 ** 2) / elastic_modulus1 + (1 - poisson_ratio2 ** 2) / elastic_modulus2
+
+    return np.sqrt(load_per_length / (np.pi * radius_curvature_relative * compliance))
+
+
+def contact_pressure_path_fcn(torque, base_diameter1, base_diameter2, number_of_teeth1,
+                              working_pressure_angle_transverse,
+                              pressure_angle_transverse_eap1, pressure_angle_transverse_eap2,
+                              facewidth, helix_angle_base=0, contact_ratio_axial=0,
+                              elastic_modulus1=206000, elastic_modulus2=206000,
+                              poisson_ratio1=0.3, poisson_ratio2=0.3, number_of_points=101) -> ContactPressurePath:
+    """Hertzian contact pressure at every point from SAP to EAP, for arrays of spur or helical gear pairs.
+
+    Design arguments are NumPy arrays, or scalars, that broadcast against each other.  Angles are in radians.  Designs
+    without a valid path of contact, e.g. a NaN working pressure angle or SAP past EAP, have NaN pressures and maxima.
+
+    :param torque: Torque of gear 1, Nm.
+    :param facewidth: Effective facewidth, mm.
+    :param number_of_points: Number of points along the path of contact, including its ends.
+    :return: ContactPressurePath
+    """
+
+    d_b1, d_b2, z1, alpha_wt, alpha_eap1, alpha_eap2, b, beta_b, cr_a, torque = np.broadcast_arrays(
+        *[np.asarray(arg, dtype=float) for arg in (base_diameter1, base_diameter2, number_of_teeth1,
+                                                  working_pressure_angle_transverse, pressure_angle_transverse_eap1,
+                                                  pressure_angle_transverse_eap2, facewidth, helix_angle_base,
+                                                  contact_ratio_axial, torque)])
+
+    t1t2, t1a, t1e = poa.path_of_contact_fcn(d_b1, d_b2, alpha_wt, alpha_eap1, alpha_eap2)
+    g_alpha = t1e - t1a
+    p_bt = np.pi * d_b1 / z1
+    valid = g_alpha > 0
+
+    # axes: (*designs, points)
+    def expand(a):
+        return a[..., np.newaxis]
+
+    position = expand(g_alpha) * np.linspace(0, 1, number_of_points)
+    roll_angle1 = (expand(t1a) + position) / expand(d_b1 / 2)
+    roll_angle2 = (expand(t1t2 - t1a) - position) / expand(d_b2 / 2)
+
+    # invalid designs are evaluated as well, then discarded
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho1 = inv.involute_curvature(expand(d_b1 / 2), roll_angle1)[0]
+        rho2 = inv.involute_curvature(expand(d_b2 / 2), roll_angle2)[0]
+        rho_relative = relative_radius_curvature_fcn(rho1, rho2) / expand(np.cos(beta_b))
+
+        # normal tooth load over the contact line length of one tooth pair, b / cos(beta_b)
+        tangential_force_base = forces.tangential_force_fcn(torque, d_b1)
+        load_share = load_share_fcn(position, expand(g_alpha), expand(p_bt), expand(cr_a))
+        load_per_length = expand(tangential_force_base / b) * load_share
+
+        pressure = hertz_line_contact_pressure_fcn(load_per_length, rho_relative, elastic_modulus1,
+                                                   elastic_modulus2, poisson_ratio1, poisson_ratio2)
+
+    pressure = np.where(expand(valid), pressure, np.nan)
+
+    # rows without any pressure are filled for argmax, then their maxima are NaN
+    no_pressure = np.isnan(pressure).all(axis=-1, keepdims=True)
+    i_max = np.nanargmax(np.where(no_pressure, 0, pressure), axis=-1)[..., np.newaxis]
+    pressure_max = np.where(no_pressure, np.nan, np.take_along_axis(pressure, i_max, -1))[..., 0]
+    position_max = np.where(no_pressure, np.nan, np.take_along_axis(position, i_max, -1))[..., 0]
+
+    return ContactPressurePath(
+        position=position,
+        roll_angle1=roll_angle1,
+        roll_angle2=roll_angle2,
+        radius_curvature1=rho1,
+        radius_curvature2=rho2,
+        radius_curvature_relative=rho_relative,
+        load_share=load_share,
+        load_per_length=load_per_length,
+        pressure=pressure,
+        pressure_max=pressure_max,
+        position_max=position_max,
+    )
+
+
+# endregion
@@ -0,0 +1,26 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for gear mesh force analysis."""
+
+from math import tan, sqrt
+
+
+def tangential_force_fcn(torque, pitch_diameter):
+    """Tangential force at the pitch diameter, in N, for torque in Nm and pitch diameter in mm."""
+
+    return 2000 * torque / pitch_diameter
+
+
+def radial_force_fcn(tangential_force, working_pressure_angle_transverse):
+    return tangential_force * tan(working_pressure_angle_transverse)
+
+
+def axial_force_fcn(tangential_force, helix_angle):
+    return tangential_force * tan(helix_angle)
+
+
+def normal_force_fcn(tangential_force, radial_force, axial_force):
+    """Resultant force normal to the tooth surface."""
+
+    return sqrt(tangential_force ** 2 + radial_force ** 2 + axial_force ** 2)
@@ -0,0 +1,202 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for lubrication of gear teeth: flash temperature and film thickness along the path of contact.
+
+Functions are vectorized for arrays of designs and operating speeds.  Contact conditions come from
+`contact_stress.contact_pressure_path_fcn`; speeds broadcast against its design axes, so that a column of speeds
+against a row of designs evaluates every combination.  Designs without a valid path of contact, with NaN pressures,
+have NaN lubrication conditions and do not pass screening.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from geometry import helical_gears_batch as hgb
+
+
+class Lubricant(NamedTuple):
+    """Lubricant properties at the bulk temperature."""
+
+    dynamic_viscosity: float  # Pa s
+    pressure_viscosity_coefficient: float = 2.0e-8  # 1/Pa
+    bulk_temperature: float = 90  # deg C
+
+
+class LubricationResult(NamedTuple):
+    """Lubrication conditions at every contact point.  Arrays have shape (*designs, points), extrema (*designs,)."""
+
+    tangential_velocity1: np.ndarray  # m/s
+    tangential_velocity2: np.ndarray
+    sliding_velocity: np.ndarray  # magnitude, m/s
+    entrainment_velocity: np.ndarray  # mean rolling velocity, m/s
+    hertz_half_width: np.ndarray  # mm
+    flash_temperature: np.ndarray  # K
+    contact_temperature: np.ndarray  # deg C
+    film_thickness_min: np.ndarray  # um
+    specific_film_thickness: np.ndarray  # lambda ratio
+    flash_temperature_max: np.ndarray
+    contact_temperature_max: np.ndarray
+    specific_film_thickness_min: np.ndarray
+
+
+def _nanmax_rows(a):
+    """Maximum along the last axis, ignoring NaN; NaN for rows of NaN only, without warning."""
+
+    empty = np.isnan(a).all(axis=-1)
+
+    return np.where(empty, np.nan, np.nanmax(np.where(empty[..., np.newaxis], 0, a), axis=-1))
+
+
+def _nanmin_rows(a):
+    """Minimum along the last axis, ignoring NaN; NaN for rows of NaN only, without warning."""
+
+    return -_nanmax_rows(-a)
+
+
+def _reduced_compliance(elastic_modulus1, elastic_modulus2, poisson_ratio1, poisson_ratio2):
+    return (1 - poisson_ratio1 ** 2) / elastic_modulus1 + (1 - poisson_ratio2 ** 2) / elastic_modulus2
+
+
+def hertz_half_width_fcn(load_per_length, radius_curvature_relative, elastic_modulus1, elastic_modulus2,
+                         poisson_ratio1=0.3, poisson_ratio2=0.3):
+    """Half-width of the Hertzian line contact, in mm for load in N/mm, radius in mm and moduli in MPa."""
+
+    compliance = _reduced_compliance(elastic_modulus1, elastic_modulus2, poisson_ratio1, poisson_ratio2)
+
+    return np.sqrt(4 * load_per_length * radius_curvature_relative * compliance / np.pi)
+
+
+def flash_temperature_fcn(friction_coefficient, load_per_length, tangential_velocity1, tangential_velocity2,
+                          hertz_half_width, thermal_contact_coefficient1=13.795, thermal_contact_coefficient2=13.795):
+    """Blok flash temperature, in K.
+
+    :param load_per_length: Normal load per unit length of contact line, N/mm.
+    :param tangential_velocity1: Velocity of the gear 1 surface along its profile, m/s.
+    :param hertz_half_width: Half-width of the Hertzian contact, mm.
+    :param thermal_contact_coefficient1: Thermal contact coefficient, sqrt(conductivity * density * specific heat),
+        of gear 1 in N/(mm s^0.5 K).  The default is for steel.
+    """
+
+    # SI units: N/m, m/s, m, W s^0.5 / (m^2 K)
+    w = 1000 * load_per_length
+    b_h = hertz_half_width / 1000
+    v1 = tangential_velocity1
+    v2 = tangential_velocity2
+    b_m1 = 1000 * thermal_contact_coefficient1
+    b_m2 = 1000 * thermal_contact_coefficient2
+
+    denominator = (b_m1 * np.sqrt(v1) + b_m2 * np.sqrt(v2)) * np.sqrt(b_h)
+
+    return 1.11 * friction_coefficient * w * np.abs(v1 - v2) / denominator
+
+
+def film_thickness_min_fcn(lubricant: Lubricant, entrainment_velocity, load_per_length, radius_curvature_relative,
+                           elastic_modulus1, elastic_modulus2, poisson_ratio1=0.3, poisson_ratio2=0.3):
+    """Dowson-Higginson minimum film thickness of elastohydrodynamic line contact, in um.
+
+    :param entrainment_velocity: Mean rolling velocity of the surfaces, m/s.
+    :param load_per_length: Normal load per unit length of contact line, N/mm.
+    :param radius_curvature_relative: Relative radius of curvature, mm.
+    :param elastic_modulus1: Elastic modulus of gear 1, MPa.
+    """
+
+    # SI units: Pa, m, N/m
+    e_reduced = 2e6 / _reduced_compliance(elastic_modulus1, elastic_modulus2, poisson_ratio1, poisson_ratio2)
+    r = radius_curvature_relative / 1000
+    w = 1000 * load_per_length
+
+    speed_parameter = lubricant.dynamic_viscosity * entrainment_velocity / (e_reduced * r)
+    material_parameter = lubricant.pressure_viscosity_coefficient * e_reduced
+    load_parameter = w / (e_reduced * r)
+
+    return 1e6 * 2.65 * speed_parameter ** 0.7 * material_parameter ** 0.54 * load_parameter ** -0.13 * r
+
+
+def lubrication_fcn(path, base_diameter1, base_diameter2, speed1_rpm, lubricant: Lubricant,
+                    friction_coefficient=0.06, roughness1=0.4, roughness2=0.4,
+                    elastic_modulus1=206000, elastic_modulus2=206000, poisson_ratio1=0.3, poisson_ratio2=0.3,
+                    thermal_contact_coefficient1=13.795, thermal_contact_coefficient2=13.795) -> LubricationResult:
+    """Flash temperature and EHL film thickness at every contact point, for arrays of designs and speeds.
+
+    Velocities are those of the transverse plane.
+
+    :param path: Contact conditions from SAP to EAP, see contact_stress.contact_pressure_path_fcn.
+    :param base_diameter1: Base diameters of gear 1, mm, as used for the path.
+    :param speed1_rpm: Speed of gear 1, rpm.  Broadcasts against the design axes of the path.
+    :param lubricant: Lubricant properties.
+    :param friction_coefficient: Mean coefficient of friction.
+    :param roughness1: Arithmetic mean roughness Ra of gear 1 flanks, um.
+    :return: LubricationResult
+    """
+
+    def expand(a):
+        return np.asarray(a, dtype=float)[..., np.newaxis]
+
+    angular_velocity1 = expand(speed1_rpm) * np.pi / 30
+    angular_velocity2 = angular_velocity1 * expand(base_diameter1) / expand(base_diameter2)
+
+    # points of invalid designs are evaluated as well, then discarded
+    valid = ~np.isnan(path.pressure)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # tan(pressure angle) of an involute point equals its roll angle
+        v1 = hgb.tangential_velocity_fcn(expand(base_diameter1), np.arctan(path.roll_angle1),
+                                         angular_velocity1) / 1000
+        v2 = hgb.tangential_velocity_fcn(expand(base_diameter2), np.arctan(path.roll_angle2),
+                                         angular_velocity2) / 1000
+        sliding_velocity = np.abs(v1 - v2)
+        entrainment_velocity = (v1 + v2) / 2
+
+        w = path.load_per_length
+        rho = path.radius_curvature_relative
+
+        b_h = hertz_half_width_fcn(w, rho, elastic_modulus1, elastic_modulus2, poisson_ratio1, poisson_ratio2)
+        flash_temperature = flash_temperature_fcn(friction_coefficient, w, v1, v2, b_h,
+                                                  thermal_contact_coefficient1, thermal_contact_coefficient2)
+        contact_temperature = lubricant.bulk_temperature + flash_temperature
+
+        film_thickness_min = film_thickness_min_fcn(lubricant, entrainment_velocity, w, rho, elastic_modulus1,
+                                                    elastic_modulus2, poisson_ratio1, poisson_ratio2)
+        specific_film_thickness = film_thickness_min / np.sqrt(roughness1 ** 2 + roughness2 ** 2)
+
+    def discard_invalid(a):
+        return np.where(valid, a, np.nan)
+
+    flash_temperature = discard_invalid(flash_temperature)
+    contact_temperature = discard_invalid(contact_temperature)
+    specific_film_thickness = discard_invalid(specific_film_thickness)
+
+    return LubricationResult(
+        tangential_velocity1=discard_invalid(v1),
+        tangential_velocity2=discard_invalid(v2),
+        sliding_velocity=discard_invalid(sliding_velocity),
+        entrainment_velocity=discard_invalid(entrainment_velocity),
+        hertz_half_width=discard_invalid(b_h),
+        flash_temperature=flash_temperature,
+        contact_temperature=contact_temperature,
+        film_thickness_min=discard_invalid(film_thickness_min),
+        specific_film_thickness=specific_film_thickness,
+        flash_temperature_max=_nanmax_rows(flash_temperature),
+        contact_temperature_max=_nanmax_rows(contact_temperature),
+        specific_film_thickness_min=_nanmin_rows(specific_film_thickness),
+    )
+
+
+def lubrication_screen_fcn(result: LubricationResult, specific_film_thickness_min=1.0, contact_temperature_max=None):
+    """Mask of the designs and speeds that pass lubrication screening at every contact point.
+
+    Designs without a valid path of contact have NaN extrema, and do not pass.
+
+    :param specific_film_thickness_min: Least acceptable lambda ratio, e.g. 1 for mixed lubrication at worst.
+    :param contact_temperature_max: Greatest acceptable contact temperature, deg C, e.g. a scuffing temperature.
+        Not checked if None.
+    """
+
+    passed = result.specific_film_thickness_min >= specific_film_thickness_min
+
+    if contact_temperature_max is not None:
+        passed &= result.contact_temperature_max <= contact_temperature_max
+
+    return passed
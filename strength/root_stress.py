@@ -0,0 +1,229 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for gear tooth root stress."""
+
+from math import ceil
+from typing import NamedTuple
+
+import numpy as np
+
+from geometry import helical_gears_batch as hgb
+
+
+def minimum_module_bending_fcn(torque, number_of_teeth, facewidth_to_pitch, allowable_bending_stress,
+                               stress_concentration_factor, load_sharing_factor=1):
+    """Minimum module to limit the tooth root bending stress, for torque in Nm and stress in MPa.
+
+    :param torque: Pinion torque.
+    :param number_of_teeth: Pinion number of teeth.
+    :param facewidth_to_pitch: Ratio of facewidth to pitch diameter.
+    :param allowable_bending_stress: Allowable bending stress.
+    :param stress_concentration_factor: Lumped tooth form and stress concentration factor, q_k.
+    :param load_sharing_factor: Load sharing factor, q_e.
+    :return: Minimum module in mm.
+    """
+
+    numerator = 2000 * torque * load_sharing_factor * stress_concentration_factor
+    denominator = facewidth_to_pitch * number_of_teeth ** 2 * allowable_bending_stress
+
+    return (numerator / denominator) ** (1 / 3)
+
+
+def selected_module_fcn(module, step=0.5):
+    """Round a module up to the nearest multiple of the step size."""
+
+    return ceil(module / step) * step
+
+
+def bending_stress_fcn(tangential_force, facewidth, module, stress_concentration_factor, load_sharing_factor=1):
+    """Tooth root bending stress, in MPa for force in N and lengths in mm."""
+
+    return tangential_force / (facewidth * module) * stress_concentration_factor * load_sharing_factor
+
+
+# region CRITICAL SECTION
+
+class RootSection(NamedTuple):
+    """Tooth root critical section by the 30 degree tangents, ISO 6336-3 method B, for arrays of gears.
+
+    Lengths are in the normal section of the virtual spur gear, in mm.  Elements where the iteration did not converge
+    are NaN.
+    """
+
+    virtual_number_of_teeth: np.ndarray  # z_n
+    tangent_angle: np.ndarray  # theta, radians, at the 30 degree tangent point
+    root_chord_thickness: np.ndarray  # s_Fn
+    fillet_radius: np.ndarray  # rho_F, at the 30 degree tangent point
+    bending_moment_arm: np.ndarray  # h_Fe
+    load_direction_angle: np.ndarray  # alpha_Fen, radians
+    form_factor: np.ndarray  # Y_F
+    stress_correction_factor: np.ndarray  # Y_S
+
+
+def virtual_number_of_teeth_fcn(number_of_teeth, pressure_angle_normal, helix_angle):
+    """Number of teeth of the virtual spur gear in the normal section of a helical gear."""
+
+    helix_angle_base = np.arcsin(np.sin(helix_angle) * np.cos(pressure_angle_normal))
+
+    return number_of_teeth / (np.cos(helix_angle_base) ** 2 * np.cos(helix_angle))
+
+
+def _rack_fillet_parameters(module_normal, pressure_angle_normal, profile_shift_coefficient,
+                            cutter_addendum_coefficient, tip_radius_coefficient, protuberance):
+    """ISO 6336-3 auxiliary values E, in mm, and G of the generating rack tip radius."""
+
+    h_fp = cutter_addendum_coefficient * module_normal
+    rho_fp = tip_radius_coefficient * module_normal
+    alpha_n = pressure_angle_normal
+
+    e = np.pi / 4 * module_normal - h_fp * np.tan(alpha_n) + protuberance / np.cos(alpha_n) - \
+        (1 - np.sin(alpha_n)) * rho_fp / np.cos(alpha_n)
+    g = tip_radius_coefficient - cutter_addendum_coefficient + profile_shift_coefficient
+
+    return e, g
+
+
+def tangent_angle_fcn(virtual_number_of_teeth, g, h, tolerance=1e-12, max_iterations=50):
+    """Solve theta = 2 G / z_n tan(theta) - H for all gears at once, by Newton iteration from pi / 6.
+
+    :return: theta, radians.  NaN where not converged.
+    """
+
+    z_n, g, h = np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in (virtual_number_of_teeth, g, h)])
+    theta = np.full(z_n.shape, np.pi / 6)
+    converged = np.zeros(z_n.shape, dtype=bool)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(max_iterations):
+            residual = theta - 2 * g / z_n * np.tan(theta) + h
+            slope = 1 - 2 * g / (z_n * np.cos(theta) ** 2)
+            step = np.where(converged, 0, residual / slope)
+            theta = theta - step
+            converged |= np.abs(step) < tolerance
+
+            if converged.all():
+                break
+
+    return np.where(converged, theta, np.nan)
+
+
+def critical_section_fcn(module_normal, number_of_teeth, pressure_angle_normal, helix_angle,
+                         profile_shift_coefficient, cutter_addendum_coefficient=1.25, tip_radius_coefficient=0.38,
+                         protuberance=0, addendum_coefficient=1, contact_ratio_transverse=None) -> RootSection:
+    """Root chord thickness, fillet radius, bending moment arm and form factor of external gears generated by a rack.
+
+    Inputs are NumPy arrays, or scalars, that broadcast against each other.  The form factor and stress correction
+    factor replace the lumped factor q_k of bending_stress_fcn, as q_k = Y_F * Y_S.
+
+    :param pressure_angle_normal: Basic rack pressure angle, radians.
+    :param helix_angle: Helix angle, radians.  Zero for spur gears.
+    :param cutter_addendum_coefficient: Addendum of the generating rack, i.e. the basic rack dedendum, h_fP / m_n.
+    :param tip_radius_coefficient: Tip radius of the generating rack, rho_fP / m_n.
+    :param protuberance: Protuberance of the generating rack less the grinding stock, s_pr, in mm.
+    :param addendum_coefficient: Basic rack addendum coefficient of the gear, for its tip diameter.
+    :param contact_ratio_transverse: Load at the outer point of single tooth contact for this transverse contact
+        ratio, or at the tip if None.
+    :return: RootSection
+    """
+
+    m_n = module_normal
+    z = number_of_teeth
+    x = profile_shift_coefficient
+    alpha_n = pressure_angle_normal
+    rho_fp = tip_radius_coefficient
+
+    z_n = virtual_number_of_teeth_fcn(z, alpha_n, helix_angle)
+    e, g = _rack_fillet_parameters(m_n, alpha_n, x, cutter_addendum_coefficient, tip_radius_coefficient,
+                                   protuberance)
+    h = 2 / z_n * (np.pi / 2 - e / m_n) - np.pi / 3
+
+    theta = tangent_angle_fcn(z_n, g, h)
+    s_fn = m_n * (z_n * np.sin(np.pi / 3 - theta) + np.sqrt(3) * (g / np.cos(theta) - rho_fp))
+    rho_f = m_n * (rho_fp + 2 * g ** 2 / (np.cos(theta) * (z_n * np.cos(theta) ** 2 - 2 * g)))
+
+    # virtual spur gear diameters, and the diameter of load application
+    d = z * m_n / np.cos(helix_angle)
+    d_a = d + 2 * m_n * (addendum_coefficient + x)
+    d_n = m_n * z_n
+    d_bn = d_n * np.cos(alpha_n)
+    d_an = d_n + d_a - d
+
+    if contact_ratio_transverse is None:
+        d_en = d_an
+    else:
+        helix_angle_base = np.arcsin(np.sin(helix_angle) * np.cos(alpha_n))
+        contact_ratio_virtual = contact_ratio_transverse / np.cos(helix_angle_base) ** 2
+        base_pitch = np.pi * d * np.cos(helix_angle) * np.cos(alpha_n) / z
+        roll_length = np.sqrt((d_an / 2) ** 2 - (d_bn / 2) ** 2) - base_pitch * (contact_ratio_virtual - 1)
+        d_en = 2 * np.sqrt(roll_length ** 2 + (d_bn / 2) ** 2)
+
+    alpha_en = np.arccos(d_bn / d_en)
+    gamma_e = (np.pi / 2 + 2 * x * np.tan(alpha_n)) / z_n + hgb.involute_function(alpha_n) - \
+        hgb.involute_function(alpha_en)
+    alpha_fen = alpha_en - gamma_e
+
+    h_fe = m_n / 2 * ((np.cos(gamma_e) - np.sin(gamma_e) * np.tan(alpha_fen)) * d_en / m_n -
+                      z_n * np.cos(np.pi / 3 - theta) - g / np.cos(theta) + rho_fp)
+
+    form_factor = 6 * h_fe / m_n * np.cos(alpha_fen) / ((s_fn / m_n) ** 2 * np.cos(alpha_n))
+
+    # stress correction factor, valid for 1 <= q_s < 8
+    length_ratio = s_fn / h_fe
+    notch_parameter = s_fn / (2 * rho_f)
+    stress_correction_factor = (1.2 + 0.13 * length_ratio) * notch_parameter ** (1 / (1.21 + 2.3 / length_ratio))
+
+    return RootSection(
+        virtual_number_of_teeth=z_n,
+        tangent_angle=theta,
+        root_chord_thickness=s_fn,
+        fillet_radius=rho_f,
+        bending_moment_arm=h_fe,
+        load_direction_angle=alpha_fen,
+        form_factor=form_factor,
+        stress_correction_factor=stress_correction_factor,
+    )
+
+
+def root_fillet_curve(module_normal, number_of_teeth, pressure_angle_normal, helix_angle, profile_shift_coefficient,
+                      cutter_addendum_coefficient=1.25, tip_radius_coefficient=0.38, protuberance=0,
+                      number_of_points=50):
+    """Cartesian coordinates of the trochoidal root fillet generated by the rack tip radius, for arrays of gears.
+
+    Coordinates are in the normal section of the virtual spur gear, centered on the gear axis with the tooth centerline
+    on the y-axis, for the fillet at x > 0 from the root circle to the end of the tip radius.
+
+    :return: x and y coordinates with shape (*gears, points).
+    """
+
+    m_n = module_normal
+    z_n = virtual_number_of_teeth_fcn(number_of_teeth, pressure_angle_normal, helix_angle)
+    e, g = _rack_fillet_parameters(m_n, pressure_angle_normal, profile_shift_coefficient,
+                                   cutter_addendum_coefficient, tip_radius_coefficient, protuberance)
+    rho_fp = tip_radius_coefficient * m_n
+    r = m_n * z_n / 2
+
+    def expand(a):
+        return np.asarray(a, dtype=float)[..., np.newaxis]
+
+    # angle of the contact normal on the rack tip radius, from the root circle to the rack flank
+    fraction = np.linspace(0, 1, number_of_points)
+    psi = expand(np.pi / 2 - pressure_angle_normal) * fraction
+
+    # contact point on the rack tip radius, rack tooth centered on the tooth space at zero travel
+    x_rack = expand(e) + expand(rho_fp) * np.sin(psi)
+    y_rack = expand(r + g * m_n) - expand(rho_fp) * np.cos(psi)
+
+    # rack travel where the contact normal passes through the pitch point, and the corresponding gear rotation
+    travel = -(expand(e) + expand(g * m_n) * np.tan(psi))
+    phi = travel / expand(r)
+
+    # gear frame, rotated to put the next tooth centerline on the y-axis, mirrored to x > 0
+    angle = phi + expand(np.pi / z_n)
+    x = (x_rack + travel) * np.cos(angle) - y_rack * np.sin(angle)
+    y = (x_rack + travel) * np.sin(angle) + y_rack * np.cos(angle)
+
+    return -x, y
+
+
+# endregion
@@ -0,0 +1,48 @@
+# Copyright 2026 Drivetrain Hub LLC
+# For non-commercial use only.  For commercial products and services, visit https://drivetrainhub.com.
+
+"""Notebook module for basic rack, vectorized for arrays of racks.
+
+Functions mirror the names and arguments of `basic_rack`, accepting NumPy arrays that broadcast against each other.
+"""
+
+import numpy as np
+
+
+def pitch_fcn(module):
+    return np.pi * module
+
+
+def base_pitch_fcn(module, pressure_angle):
+    return np.pi * module * np.cos(pressure_angle)
+
+
+def bottom_clearance_fcn(addendum, dedendum):
+    """Calculate the basic rack bottom clearance."""
+
+    return dedendum - addendum
+
+
+def bottom_clearance_root_radius(addendum, dedendum, pressure_angle):
+    """Calculate the basic rack root radius limited by bottom clearance."""
+
+    bottom_clearance = bottom_clearance_fcn(addendum, dedendum)
+
+    return bottom_clearance / (1 - np.sin(pressure_angle))
+
+
+def max_root_radius(module, pressure_angle, addendum, dedendum):
+    """Calculate the basic rack maximum allowable root radius.  Only valid without undercut."""
+
+    bottom_clearance_root_radius_limit = bottom_clearance_root_radius(addendum, dedendum, pressure_angle)
+
+    # calculate full root radius
+    e_p = np.pi * module / 2
+    tan_a = np.tan(pressure_angle)
+    sec_a = 1 / np.cos(pressure_angle)
+    y_fillet = (e_p * tan_a - e_p * sec_a + 2 * dedendum) / (2 * (tan_a * sec_a - tan_a ** 2 - 1))
+    full_root_radius = (dedendum + y_fillet) / (1 - np.sin(pressure_angle))
+
+    # the root radius limited by bottom clearance, where smaller than the full root radius
+    return np.where(bottom_clearance_root_radius_limit < full_root_radius,
+                    bottom_clearance_root_radius_limit, full_root_radius)
@@ -16,29 +16,26 @@ def print_latex(str_list):
     display(Latex('$, \\;\\;$'.join(str_list)))
 
 
-def html_table(headings, rows):
-    """Display an HTML table in a Jupyter notebook.
+def table_html(headings, rows) -> str:
+    """HTML string of a table, built in a single join.
 
     :param headings: List of heading strings.  Can include MathJax notation.
-    :param rows: List of lists to represent rows of data.
-    :return: None
+    :param rows: Iterable of rows, each an iterable of cell values.
+    :return: HTML string.
     """
 
-    html_str = '<table style="margin-left: 0">'
-
-    html_str += '<tr>'
+    header = ''.join(f'<th>{h}</th>' for h in headings)
+    body = ''.join('<tr>' + ''.join(f'<td>{c}</td>' for c in row) + '</tr>' for row in rows)
 
-    for h in headings:
-        html_str += f'<th>{h}</th>'
+    return f'<table style="margin-left: 0"><tr>{header}</tr>{body}</table>'
 
-    html_str += '</tr>'
 
-    for row in rows:
-        html_str += '<tr>'
-        for c in row:
-            html_str += f'<td>{c}</td>'
+def html_table(headings, rows):
+    """Display an HTML table in a Jupyter notebook.
 
-        html_str += '</tr>'
+    :param headings: List of heading strings.  Can include MathJax notation.
+    :param rows: List of lists to represent rows of data.
+    :return: None
+    """
 
-    html_str += '</table>'
-    display(HTML(html_str))
+    display(HTML(table_html(headings, rows)))